@@ -0,0 +1,31 @@
+"""Add LLM response cache table
+
+Revision ID: 003_add_llm_cache
+Revises: 002_add_character_relationships
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '003_add_llm_cache'
+down_revision = '002_add_character_relationships'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'llm_cache',
+        sa.Column('key', sa.String(length=32), nullable=False),
+        sa.Column('model', sa.String(length=100), nullable=False),
+        sa.Column('response', sa.JSON(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+        sa.PrimaryKeyConstraint('key'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('llm_cache')
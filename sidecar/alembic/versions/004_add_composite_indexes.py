@@ -0,0 +1,26 @@
+"""Add indexes for project-scoped listings
+
+Revision ID: 004_add_composite_indexes
+Revises: 003_add_llm_cache
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '004_add_composite_indexes'
+down_revision = '003_add_llm_cache'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_chapters_project_order', 'chapters', ['project_id', 'order'], unique=False)
+    op.create_index('ix_exports_project_created', 'exports', ['project_id', 'created_at'], unique=False)
+    op.create_index('ix_personas_project', 'personas', ['project_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_personas_project', table_name='personas')
+    op.drop_index('ix_exports_project_created', table_name='exports')
+    op.drop_index('ix_chapters_project_order', table_name='chapters')
@@ -0,0 +1,22 @@
+"""Index llm_cache by creation time for expiry and eviction
+
+Revision ID: 005_index_llm_cache_created
+Revises: 004_add_composite_indexes
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '005_index_llm_cache_created'
+down_revision = '004_add_composite_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_llm_cache_created', 'llm_cache', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_llm_cache_created', table_name='llm_cache')
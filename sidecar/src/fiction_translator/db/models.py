@@ -18,13 +18,20 @@ from sqlalchemy import (
 from sqlalchemy import (
     Enum as SQLEnum,
 )
+from sqlalchemy.ext.mutable import MutableList
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 
 class Base(DeclarativeBase):
-    """Base class for all database models."""
-    pass
+    """Base class for all database models.
+
+    ``eager_defaults`` fetches server-generated ``created_at``/``updated_at``
+    via ``RETURNING`` during flush, so services can serialize a freshly
+    written row without a follow-up ``SELECT``.
+    """
+
+    __mapper_args__ = {"eager_defaults": True}
 
 
 class TranslationStatus(enum.StrEnum):
@@ -115,6 +122,10 @@ class Chapter(Base):
         "Persona", back_populates="last_seen_chapter", foreign_keys="[Persona.last_seen_chapter_id]"
     )
 
+    __table_args__ = (
+        Index("ix_chapters_project_order", "project_id", "order"),
+    )
+
 
 class Segment(Base):
     """A translatable unit (sentence, paragraph, or dialogue line)."""
@@ -239,12 +250,12 @@ class Persona(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     project_id: Mapped[int] = mapped_column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
-    aliases: Mapped[list | None] = mapped_column(JSON, nullable=True)
+    aliases: Mapped[list | None] = mapped_column(MutableList.as_mutable(JSON), nullable=True)
     personality: Mapped[str | None] = mapped_column(Text, nullable=True)
     speech_style: Mapped[str | None] = mapped_column(Text, nullable=True)
     formality_level: Mapped[int] = mapped_column(Integer, default=3)
     age_group: Mapped[str | None] = mapped_column(String(50), nullable=True)
-    example_dialogues: Mapped[list | None] = mapped_column(JSON, nullable=True)
+    example_dialogues: Mapped[list | None] = mapped_column(MutableList.as_mutable(JSON), nullable=True)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
     auto_detected: Mapped[bool] = mapped_column(Boolean, default=False)
     detection_confidence: Mapped[float | None] = mapped_column(Float, nullable=True)
@@ -271,6 +282,10 @@ class Persona(Base):
         "Chapter", foreign_keys=[last_seen_chapter_id], back_populates="personas_last_seen"
     )
 
+    __table_args__ = (
+        Index("ix_personas_project", "project_id"),
+    )
+
 
 class CharacterRelationship(Base):
     """Relationship between two character personas."""
@@ -375,4 +390,19 @@ class Export(Base):
 
     __table_args__ = (
         Index("ix_exports_chapter_format", "chapter_id", "format"),
+        Index("ix_exports_project_created", "project_id", "created_at"),
+    )
+
+
+class LLMCacheEntry(Base):
+    """Cached LLM JSON response keyed by a hash of model, parameters and prompt."""
+    __tablename__ = "llm_cache"
+
+    key: Mapped[str] = mapped_column(String(32), primary_key=True)
+    model: Mapped[str] = mapped_column(String(100), nullable=False)
+    response: Mapped[dict] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_llm_cache_created", "created_at"),
     )
@@ -156,10 +156,10 @@ async def project_delete(project_id: int) -> dict:
 
 
 # --- Chapters ---
-async def chapter_list(project_id: int) -> list[dict]:
+async def chapter_list(project_id: int, limit: int | None = None, offset: int = 0) -> list[dict]:
     db = get_db()
     try:
-        return list_chapters(db, project_id)
+        return list_chapters(db, project_id, limit=limit, offset=offset)
     finally:
         db.close()
 
@@ -200,10 +200,10 @@ async def chapter_get_editor_data(chapter_id: int, target_language: str = "en")
 
 
 # --- Glossary ---
-async def glossary_list(project_id: int) -> list[dict]:
+async def glossary_list(project_id: int, limit: int | None = None, offset: int = 0) -> list[dict]:
     db = get_db()
     try:
-        return list_glossary(db, project_id)
+        return list_glossary(db, project_id, limit=limit, offset=offset)
     finally:
         db.close()
 
@@ -295,7 +295,14 @@ async def relationship_delete(relationship_id: int) -> dict:
 
 
 # --- Pipeline ---
-async def pipeline_translate_chapter(chapter_id: int, target_language: str = "en", use_cot: bool = True, **kwargs) -> dict:
+async def pipeline_translate_chapter(
+    chapter_id: int,
+    target_language: str = "en",
+    use_cot: bool = True,
+    fused_analysis: bool = False,
+    use_llm_cache: bool = False,
+    **kwargs,
+) -> dict:
     """Start chapter translation pipeline."""
     # Clear any previous cancellation
     event = _get_cancel_event()
@@ -312,6 +319,8 @@ async def pipeline_translate_chapter(chapter_id: int, target_language: str = "en
             progress_callback=send_progress,
             use_cot=use_cot,
             cancel_event=event,
+            fused_analysis=fused_analysis,
+            use_llm_cache=use_llm_cache,
             **kwargs,
         )
         return result
@@ -326,19 +335,24 @@ async def pipeline_cancel() -> dict:
 
 
 # --- Export ---
-async def export_chapter_txt_handler(chapter_id: int, target_language: str = "en") -> dict:
+def _export_in_own_session(export_fn, chapter_id: int, target_language: str) -> dict:
+    """Run an export on a worker thread with a session created there."""
     db = get_db()
     try:
-        return export_chapter_txt(db, chapter_id, target_language)
+        return export_fn(db, chapter_id, target_language)
     finally:
         db.close()
 
+async def export_chapter_txt_handler(chapter_id: int, target_language: str = "en") -> dict:
+    # File writes block; keep them off the event loop serving other requests
+    return await asyncio.to_thread(
+        _export_in_own_session, export_chapter_txt, chapter_id, target_language,
+    )
+
 async def export_chapter_docx_handler(chapter_id: int, target_language: str = "en") -> dict:
-    db = get_db()
-    try:
-        return export_chapter_docx(db, chapter_id, target_language)
-    finally:
-        db.close()
+    return await asyncio.to_thread(
+        _export_in_own_session, export_chapter_docx, chapter_id, target_language,
+    )
 
 
 # --- Segments ---
@@ -381,7 +395,7 @@ async def batch_get_reasoning(batch_id: int) -> dict:
     """Get CoT reasoning data for a translation batch."""
     db = get_db()
     try:
-        batch = db.query(TranslationBatch).filter(TranslationBatch.id == batch_id).first()
+        batch = db.get(TranslationBatch, batch_id)
         if not batch:
             return {"found": False}
         return {
@@ -5,6 +5,11 @@ import json
 from dataclasses import dataclass
 from typing import Any
 
+try:  # Optional faster parser for incoming requests (pip install orjson)
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 @dataclass
 class JsonRpcRequest:
@@ -83,7 +88,7 @@ class JsonRpcNotification:
 def parse_message(raw: str) -> JsonRpcRequest | None:
     """Parse a raw JSON string into a JsonRpcRequest."""
     try:
-        data = json.loads(raw)
+        data = _json_loads(raw)
     except json.JSONDecodeError:
         return None
     if not isinstance(data, dict) or "method" not in data:
@@ -132,6 +132,9 @@ class JsonRpcServer:
             except Exception as e:
                 logger.exception(f"Server loop error: {e}")
 
+        from fiction_translator.llm.providers import close_http_client
+
+        await close_http_client()
         logger.info("JSON-RPC server stopped")
 
     def stop(self):
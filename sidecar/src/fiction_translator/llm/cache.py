@@ -0,0 +1,165 @@
+"""Exact-match cache for LLM JSON responses.
+
+Responses are stored in the ``llm_cache`` table keyed on a hash of the
+model, generation parameters and prompt, so retries, review iterations
+and re-runs of an unchanged chapter skip the LLM round-trip.  The same
+table also holds other content-addressed pipeline results (e.g. the
+segmenter's output) through ``load_cached`` / ``store_cached``.
+
+Entries older than ``CACHE_TTL`` are treated as misses, and every store
+evicts expired entries plus the oldest beyond ``CACHE_MAX_ENTRIES``.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, select
+
+logger = logging.getLogger(__name__)
+
+# Entries older than this are misses and get evicted
+CACHE_TTL = timedelta(days=30)
+# Newest entries kept; older ones are evicted on store
+CACHE_MAX_ENTRIES = 5000
+
+
+def cache_key(model: str, prompt: str, **params) -> str:
+    """Return a stable hex key for *prompt* sent to *model* with *params*.
+
+    ``cache_key`` itself is a provider routing hint that does not affect
+    the response, so it is left out of the hash.
+    """
+    params.pop("cache_key", None)
+    params_repr = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.blake2b(
+        f"{model}\0{params_repr}\0{prompt}".encode(), digest_size=16,
+    ).hexdigest()
+
+
+def _load(key: str) -> dict | None:
+    from fiction_translator.db.models import LLMCacheEntry
+    from fiction_translator.db.session import get_db
+
+    db = get_db()
+    try:
+        entry = db.get(LLMCacheEntry, key)
+        if entry is None or entry.created_at < datetime.utcnow() - CACHE_TTL:
+            return None
+        return entry.response
+    finally:
+        db.close()
+
+
+def _store(key: str, model: str, response: dict) -> None:
+    from fiction_translator.db.models import LLMCacheEntry
+    from fiction_translator.db.session import get_db
+
+    db = get_db()
+    try:
+        now = datetime.utcnow()
+        # created_at is set explicitly so re-storing a key renews it
+        db.merge(LLMCacheEntry(key=key, model=model, response=response, created_at=now))
+        db.execute(delete(LLMCacheEntry).where(LLMCacheEntry.created_at < now - CACHE_TTL))
+        overflow = (
+            select(LLMCacheEntry.key)
+            .order_by(LLMCacheEntry.created_at.desc())
+            .offset(CACHE_MAX_ENTRIES)
+        )
+        db.execute(delete(LLMCacheEntry).where(LLMCacheEntry.key.in_(overflow)))
+        db.commit()
+    finally:
+        db.close()
+
+
+async def load_cached(key: str) -> dict | None:
+    """Return the cached value stored under *key*, or None.
+
+    Lookup failures are logged and treated as misses.
+    """
+    try:
+        cached = await asyncio.to_thread(_load, key)
+    except Exception as e:
+        logger.warning("LLM cache lookup failed: %s", e)
+        return None
+    if cached is not None:
+        logger.debug("LLM cache hit %s", key)
+    return cached
+
+
+async def store_cached(key: str, model: str, value: dict) -> None:
+    """Store *value* under *key*; failures are logged and ignored."""
+    try:
+        await asyncio.to_thread(_store, key, model, value)
+    except Exception as e:
+        logger.warning("LLM cache store failed: %s", e)
+
+
+async def cached_generate_json(
+    provider,
+    prompt: str,
+    *,
+    enabled: bool = True,
+    cache_if: Callable[[dict], bool] | None = None,
+    **kwargs,
+) -> dict:
+    """Call ``provider.generate_json`` through the response cache.
+
+    Parameters
+    ----------
+    provider : LLMProvider
+        Provider to call on a cache miss.
+    prompt : str
+        The prompt to send.
+    enabled : bool
+        When False, call the provider directly without touching the cache.
+    cache_if : callable | None
+        Predicate on the response; responses it rejects (e.g. incomplete
+        translations) are returned but not stored.
+    **kwargs
+        Forwarded to ``generate_json`` and included in the cache key.
+
+    Cache failures are logged and treated as misses; they never fail the
+    LLM call itself.
+    """
+    result, _ = await cached_generate_json_with_hit(
+        provider, prompt, enabled=enabled, cache_if=cache_if, **kwargs,
+    )
+    return result
+
+
+async def cached_generate_json_with_hit(
+    provider,
+    prompt: str,
+    *,
+    enabled: bool = True,
+    cache_if: Callable[[dict], bool] | None = None,
+    **kwargs,
+) -> tuple[dict, bool]:
+    """Like :func:`cached_generate_json`, but also report whether the
+    response was served from the cache.
+
+    Returns
+    -------
+    tuple[dict, bool]
+        The response and ``True`` for a cache hit, ``False`` when the
+        provider was called.
+    """
+    if not enabled:
+        return await provider.generate_json(prompt=prompt, **kwargs), False
+
+    model = getattr(provider, "model", "")
+    key = cache_key(model, prompt, **kwargs)
+
+    cached = await load_cached(key)
+    if cached is not None:
+        return cached, True
+
+    result = await provider.generate_json(prompt=prompt, **kwargs)
+    if cache_if is None or cache_if(result):
+        await store_cached(key, model, result)
+    return result, False
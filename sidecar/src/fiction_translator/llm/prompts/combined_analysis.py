@@ -0,0 +1,134 @@
+"""Combined analysis prompt template.
+
+Extends the review prompt with the persona-analysis and
+relationship-analysis tasks, so the translated text is sent (and
+prefilled) once instead of three times.
+"""
+from __future__ import annotations
+
+from fiction_translator.llm.prompts.relationship_analysis import _find_name
+from fiction_translator.llm.prompts.review import (
+    build_review_prompt_prefix,
+    complete_review_prompt,
+)
+
+
+def build_combined_analysis_prompt(
+    pairs: list[dict],
+    source_language: str,
+    target_language: str,
+    detected_characters: list[dict] | None = None,
+    existing_personas: list[dict] | None = None,
+    existing_relationships: list[dict] | None = None,
+    glossary: dict[str, str] | None = None,
+    personas_context: str = "",
+) -> str:
+    """Build a combined review + persona + relationship analysis prompt.
+
+    Parameters
+    ----------
+    pairs : list[dict]
+        Each dict has: segment_id, source_text, translated_text, type, speaker.
+    source_language, target_language : str
+        ISO language codes.
+    detected_characters : list[dict] | None
+        Characters detected in the current chapter.  When empty, the
+        character analysis tasks are omitted and only the review is asked for.
+    existing_personas : list[dict] | None
+        Known personas from the project.
+    existing_relationships : list[dict] | None
+        Already-known relationships.
+    glossary : dict | None
+        Glossary to verify adherence.
+    personas_context : str
+        Character voice guide.
+
+    Returns
+    -------
+    str
+        Prompt expecting a JSON response with ``segment_reviews``,
+        ``persona_updates`` and ``relationship_updates``.
+    """
+    lang_names = {
+        "ko": "Korean", "ja": "Japanese", "zh": "Chinese", "en": "English",
+    }
+    src_label = lang_names.get(source_language, source_language)
+    existing_personas = existing_personas or []
+
+    character_tasks = ""
+    character_schema = ""
+    if detected_characters:
+        char_list = ", ".join(c.get("name", "?") for c in detected_characters)
+
+        known_section = ""
+        if existing_personas:
+            parts = []
+            for p in existing_personas:
+                line = f"  - {p['name']}"
+                if p.get("speech_style"):
+                    line += f" | style: {p['speech_style']}"
+                if p.get("personality"):
+                    line += f" | personality: {p['personality']}"
+                parts.append(line)
+            known_section = "\n## Existing persona records\n" + "\n".join(parts) + "\n"
+
+        rel_section = ""
+        if existing_relationships:
+            parts = []
+            for r in existing_relationships:
+                p1_name = _find_name(r.get("persona_id_1"), existing_personas)
+                p2_name = _find_name(r.get("persona_id_2"), existing_personas)
+                rel_type = r.get("relationship_type", "unknown")
+                intimacy = r.get("intimacy_level", 5)
+                parts.append(f"  - {p1_name} <-> {p2_name}: {rel_type} (intimacy: {intimacy}/10)")
+            rel_section = "\n## Existing relationships\n" + "\n".join(parts) + "\n"
+
+        character_tasks = f"""
+## Character voices
+Characters detected in this chapter: {char_list}
+{known_section}
+For each character that speaks in the translations, report NEW information not
+already captured in existing persona records: personality observations, speech
+style notes (formality, vocabulary, quirks), a suggested formality_level
+(1=very casual ... 5=very formal), any new aliases, and a confidence score (0.0-1.0).
+
+## Character relationships
+{rel_section}
+For each pair of characters that interact in the translations, identify the
+relationship type (friend, rival, family, romantic, mentor, subordinate, enemy,
+ally, acquaintance), intimacy level (1=distant strangers, 10=inseparable), a brief
+description of their dynamic, and a confidence score (0.0-1.0).
+
+Write all character observations and descriptions in {src_label} (the source language).
+"""
+        character_schema = """,
+  "persona_updates": [
+    {
+      "name": "character name",
+      "field": "personality|speech_style|formality_level|aliases",
+      "value": "the suggested update",
+      "confidence": 0.8,
+      "evidence": "brief quote or reference from the text"
+    }
+  ],
+  "relationship_updates": [
+    {
+      "character_1": "name of first character",
+      "character_2": "name of second character",
+      "relationship_type": "friend|rival|family|romantic|mentor|subordinate|enemy|ally|acquaintance",
+      "intimacy_level": 7,
+      "description": "brief description of their relationship dynamic",
+      "confidence": 0.8,
+      "evidence": "brief quote or reference from the text"
+    }
+  ]"""
+
+    prefix = build_review_prompt_prefix(
+        source_language,
+        target_language,
+        glossary,
+        personas_context,
+        extra_tasks=character_tasks,
+        extra_schema=character_schema,
+    )
+    return complete_review_prompt(prefix, pairs)
@@ -3,6 +3,11 @@
 The CoT approach asks the LLM to first analyse the scene context, then
 translate each segment while maintaining consistency with the glossary and
 character voices.
+
+Sections that are the same for every batch of a chapter (personas, style,
+user guide, instructions) come first; the per-batch glossary, feedback
+and segments come last, so providers with prefix caching can reuse the
+shared head of the prompt across batches.
 """
 from __future__ import annotations
 
@@ -105,7 +110,7 @@ def build_cot_translation_prompt(
     return f"""You are an expert literary translator from {src_label} to {tgt_label}.
 
 Translate the following numbered segments using Chain-of-Thought reasoning.
-{glossary_section}{personas_section}{style_section}{user_guide_section}{feedback_section}
+{personas_section}{style_section}{user_guide_section}
 ## Instructions
 1. First, write a brief SITUATION SUMMARY describing the scene context.
 2. Then list CHARACTER EVENTS -- what each character does or feels in this passage.
@@ -133,7 +138,7 @@ Return ONLY valid JSON in this exact format:
     {{"segment_id": 1, "text": "translated text"}}
   ]
 }}
-
+{glossary_section}{feedback_section}
 SEGMENTS TO TRANSLATE:
 ---
 {segments_block}
@@ -221,7 +226,7 @@ def build_simple_translation_prompt(
     return f"""You are an expert literary translator from {src_label} to {tgt_label}.
 
 Translate the following numbered segments directly.
-{glossary_section}{personas_section}{style_section}{user_guide_section}{feedback_section}
+{personas_section}{style_section}{user_guide_section}
 ## Instructions
 - Preserve the literary tone and style of the original.
 - Maintain consistent character voices as described in the persona guide.
@@ -236,7 +241,7 @@ Return ONLY valid JSON in this exact format:
     {{"segment_id": 1, "text": "translated text"}}
   ]
 }}
-
+{glossary_section}{feedback_section}
 SEGMENTS TO TRANSLATE:
 ---
 {segments_block}
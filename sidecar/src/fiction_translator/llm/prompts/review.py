@@ -31,6 +31,30 @@ def build_review_prompt(
     str
         Prompt expecting JSON response.
     """
+    prefix = build_review_prompt_prefix(
+        source_language, target_language, glossary, personas_context,
+    )
+    return complete_review_prompt(prefix, pairs)
+
+
+def build_review_prompt_prefix(
+    source_language: str,
+    target_language: str,
+    glossary: dict[str, str] | None = None,
+    personas_context: str = "",
+    extra_tasks: str = "",
+    extra_schema: str = "",
+) -> str:
+    """Build the part of the review prompt that precedes the pairs.
+
+    It only depends on the languages, glossary and personas, so a node
+    reviewing several chunks builds it once; keeping it first also lets
+    provider-side prompt caches match across chunks.
+
+    *extra_tasks* is inserted after the review instructions and
+    *extra_schema* after ``segment_reviews`` in the JSON format, for
+    prompts that ask for more than the review (see combined_analysis).
+    """
     lang_names = {
         "ko": "Korean", "ja": "Japanese", "zh": "Chinese", "en": "English",
     }
@@ -51,16 +75,6 @@ def build_review_prompt(
 {personas_context}
 """
 
-    pair_lines = []
-    for p in pairs:
-        speaker_tag = f" [speaker: {p.get('speaker', '')}]" if p.get("speaker") else ""
-        pair_lines.append(
-            f"[{p['segment_id']}|{p.get('type', 'narrative')}{speaker_tag}]\n"
-            f"  SRC: {p['source_text']}\n"
-            f"  TGT: {p['translated_text']}"
-        )
-    pairs_block = "\n\n".join(pair_lines)
-
     return f"""You are a senior translation reviewer for {src_label} to {tgt_label} literary translation.
 
 Review the following source/translation pairs for quality.
@@ -73,7 +87,7 @@ Review the following source/translation pairs for quality.
 5. **Consistency**: Are names, terms, and tone consistent across segments?
 
 For each segment, decide PASS or FLAG. Only flag segments with genuine issues.
-
+{extra_tasks}
 Return ONLY valid JSON:
 {{
   "overall_passed": true|false,
@@ -85,12 +99,30 @@ Return ONLY valid JSON:
       "issue": "description of issue or null",
       "suggestion": "how to fix or null"
     }}
-  ]
+  ]{extra_schema}
 }}
 
 TRANSLATION PAIRS:
 ---
-{pairs_block}
+"""
+
+
+def complete_review_prompt(prefix: str, pairs: list[dict]) -> str:
+    """Append *pairs* and the closing instruction to a review prompt prefix."""
+    return f"""{prefix}{format_pairs(pairs)}
 ---
 
 Return ONLY the JSON object."""
+
+
+def format_pairs(pairs: list[dict]) -> str:
+    """Render review pairs as tagged SRC/TGT blocks."""
+    pair_lines = []
+    for p in pairs:
+        speaker_tag = f" [speaker: {p.get('speaker', '')}]" if p.get("speaker") else ""
+        pair_lines.append(
+            f"[{p['segment_id']}|{p.get('type', 'narrative')}{speaker_tag}]\n"
+            f"  SRC: {p['source_text']}\n"
+            f"  TGT: {p['translated_text']}"
+        )
+    return "\n\n".join(pair_lines)
@@ -2,6 +2,21 @@
 from __future__ import annotations
 
 import re
+from typing import Any
+
+try:  # Optional Aho-Corasick matcher for glossary filtering (pip install pyahocorasick)
+    import ahocorasick as _ahocorasick
+except ImportError:
+    _ahocorasick = None
+
+
+# Western smart quotes -> straight ASCII, applied in one str.translate pass
+_QUOTE_TABLE = str.maketrans({
+    '\u201C': '"',  # left double
+    '\u201D': '"',  # right double
+    '\u2018': "'",  # left single
+    '\u2019': "'",  # right single
+})
 
 
 def normalize_quotes(text: str) -> str:
@@ -11,15 +26,7 @@ def normalize_quotes(text: str) -> str:
     (\u300C, \u300D) are preserved as they serve structural roles
     in East Asian text.
     """
-    replacements = {
-        '\u201C': '"',  # left double
-        '\u201D': '"',  # right double
-        '\u2018': "'",  # left single
-        '\u2019': "'",  # right single
-    }
-    for smart, straight in replacements.items():
-        text = text.replace(smart, straight)
-    return text
+    return text.translate(_QUOTE_TABLE)
 
 
 def build_glossary_pattern(glossary: dict[str, str]) -> re.Pattern | None:
@@ -57,16 +64,39 @@ def apply_glossary_exchange(
     return pattern.sub(lambda m: glossary[m.group(0)], text)
 
 
+def build_glossary_matcher(glossary: dict[str, str]) -> Any | None:
+    """Build an Aho-Corasick automaton over the glossary source terms.
+
+    Returns ``None`` when *glossary* is empty or ``pyahocorasick`` is not
+    installed; :func:`filter_glossary_for_batch` then falls back to
+    substring checks.
+    """
+    if not glossary or _ahocorasick is None:
+        return None
+    automaton = _ahocorasick.Automaton()
+    for term in glossary:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+
 def filter_glossary_for_batch(
     glossary: dict[str, str],
     batch_texts: list[str],
+    matcher: Any | None = None,
 ) -> dict[str, str]:
     """Return the subset of *glossary* whose source terms appear in *batch_texts*.
 
     Used to trim the prompt glossary section down to only relevant
-    entries, reducing token usage.
+    entries, reducing token usage.  With a *matcher* from
+    :func:`build_glossary_matcher`, the batch text is scanned once for
+    all terms instead of once per term.  Entries keep glossary order
+    either way.
     """
     if not glossary or not batch_texts:
         return {}
     combined = " ".join(batch_texts)
+    if matcher is not None:
+        found = {term for _, term in matcher.iter(combined)}
+        return {k: v for k, v in glossary.items() if k in found}
     return {k: v for k, v in glossary.items() if k in combined}
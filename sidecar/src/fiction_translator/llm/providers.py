@@ -11,20 +11,80 @@ from __future__ import annotations
 import asyncio as _asyncio
 import json
 import logging
+import random
+import weakref
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any
 
 import httpx
 
+try:  # Optional faster JSON parser (pip install orjson)
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 MAX_LLM_RETRIES = 3
 RETRY_BASE_DELAY = 1.0  # seconds
+RETRY_MAX_DELAY = 30.0  # seconds
+
+# Connection pool shared by every provider request on an event loop
+HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0,
+)
+HTTP_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+
+_http_clients: weakref.WeakKeyDictionary[_asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the pooled HTTP client for the running event loop.
+
+    Providers are created per pipeline node, but all of their requests
+    go through this client so concurrent and successive calls to the same
+    API host reuse keep-alive connections instead of paying a TCP/TLS
+    handshake each.  Clients are bound to their loop, hence one per loop.
+    """
+    loop = _asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+        _http_clients[loop] = client
+    return client
+
+
+async def close_http_client() -> None:
+    """Close the running event loop's pooled HTTP client, if any."""
+    client = _http_clients.pop(_asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _retry_delay(attempt: int, error: Exception | None = None) -> float:
+    """Seconds to wait before retrying after failed *attempt* (0-based).
+
+    Honours a numeric ``Retry-After`` header on HTTP errors; otherwise
+    backs off exponentially with random jitter so batches that failed
+    together (e.g. on a shared 429) don't all retry at the same instant.
+    Capped at ``RETRY_MAX_DELAY``.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        retry_after = error.response.headers.get("retry-after")
+        if retry_after is not None:
+            try:
+                return min(max(float(retry_after), 0.0), RETRY_MAX_DELAY)
+            except (TypeError, ValueError):
+                pass  # HTTP-date form -- fall back to backoff
+    delay = RETRY_BASE_DELAY * (2 ** attempt) + random.uniform(0, RETRY_BASE_DELAY)
+    return min(delay, RETRY_MAX_DELAY)
 
 
 async def _retry_generate(coro_factory, max_retries=MAX_LLM_RETRIES):
-    """Retry an async LLM call with exponential backoff.
+    """Retry an async LLM call with jittered exponential backoff.
 
     Parameters
     ----------
@@ -43,7 +103,9 @@ async def _retry_generate(coro_factory, max_retries=MAX_LLM_RETRIES):
             # Don't retry client errors (except 429 rate limit)
             if 400 <= status < 500 and status != 429:
                 raise
-            delay = RETRY_BASE_DELAY * (2 ** attempt)
+            if attempt + 1 == max_retries:
+                break
+            delay = _retry_delay(attempt, e)
             logger.warning(
                 "LLM API error (attempt %d/%d, status %d): %s. Retrying in %.1fs...",
                 attempt + 1, max_retries, status, e, delay,
@@ -51,7 +113,9 @@ async def _retry_generate(coro_factory, max_retries=MAX_LLM_RETRIES):
             await _asyncio.sleep(delay)
         except (httpx.ConnectError, httpx.ReadTimeout, httpx.WriteTimeout) as e:
             last_error = e
-            delay = RETRY_BASE_DELAY * (2 ** attempt)
+            if attempt + 1 == max_retries:
+                break
+            delay = _retry_delay(attempt, e)
             logger.warning(
                 "LLM connection error (attempt %d/%d): %s. Retrying in %.1fs...",
                 attempt + 1, max_retries, e, delay,
@@ -79,8 +143,14 @@ class LLMProvider(ABC):
         system_prompt: str | None = None,
         temperature: float = 0.3,
         max_tokens: int = 4096,
+        cache_key: str | None = None,
     ) -> LLMResponse:
-        """Generate text completion."""
+        """Generate text completion.
+
+        *cache_key* groups requests that share a static prompt prefix so
+        providers with keyed prompt caching can route them to the same
+        cache; providers without such an option ignore it.
+        """
         pass
 
     async def generate_json(
@@ -89,6 +159,7 @@ class LLMProvider(ABC):
         system_prompt: str | None = None,
         temperature: float = 0.2,
         max_tokens: int = 4096,
+        cache_key: str | None = None,
     ) -> dict:
         """Generate and parse JSON response."""
         response = await self.generate(
@@ -96,6 +167,7 @@ class LLMProvider(ABC):
             system_prompt=(system_prompt or "") + "\n\nRespond with valid JSON only.",
             temperature=temperature,
             max_tokens=max_tokens,
+            cache_key=cache_key,
         )
 
         text = response.text.strip()
@@ -117,7 +189,8 @@ class LLMProvider(ABC):
             text = text[:-3]
 
         try:
-            parsed = json.loads(text.strip())
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            parsed = _json_loads(text.strip())
         except json.JSONDecodeError as e:
             logger.error("Failed to parse JSON from LLM response: %s", e)
             logger.error("Raw response text: %s", response.text)
@@ -156,6 +229,7 @@ class GeminiProvider(LLMProvider):
         system_prompt: str | None = None,
         temperature: float = 0.3,
         max_tokens: int = 4096,
+        cache_key: str | None = None,
     ) -> LLMResponse:
         if not self.is_available():
             raise RuntimeError("Gemini API key not configured")
@@ -177,10 +251,9 @@ class GeminiProvider(LLMProvider):
             }
 
         async def _call():
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.post(url, json=payload)
-                response.raise_for_status()
-                return response.json()
+            response = await get_http_client().post(url, json=payload)
+            response.raise_for_status()
+            return response.json()
 
         data = await _retry_generate(_call)
 
@@ -220,6 +293,7 @@ class ClaudeProvider(LLMProvider):
         system_prompt: str | None = None,
         temperature: float = 0.3,
         max_tokens: int = 4096,
+        cache_key: str | None = None,
     ) -> LLMResponse:
         if not self.is_available():
             raise RuntimeError("Anthropic API key not configured")
@@ -245,10 +319,9 @@ class ClaudeProvider(LLMProvider):
             payload["system"] = system_prompt
 
         async def _call():
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.post(url, headers=headers, json=payload)
-                response.raise_for_status()
-                return response.json()
+            response = await get_http_client().post(url, headers=headers, json=payload)
+            response.raise_for_status()
+            return response.json()
 
         data = await _retry_generate(_call)
 
@@ -285,6 +358,7 @@ class OpenAIProvider(LLMProvider):
         system_prompt: str | None = None,
         temperature: float = 0.3,
         max_tokens: int = 4096,
+        cache_key: str | None = None,
     ) -> LLMResponse:
         if not self.is_available():
             raise RuntimeError("OpenAI API key not configured")
@@ -307,12 +381,13 @@ class OpenAIProvider(LLMProvider):
             "temperature": temperature,
             "max_tokens": max_tokens,
         }
+        if cache_key:
+            payload["prompt_cache_key"] = cache_key
 
         async def _call():
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.post(url, headers=headers, json=payload)
-                response.raise_for_status()
-                return response.json()
+            response = await get_http_client().post(url, headers=headers, json=payload)
+            response.raise_for_status()
+            return response.json()
 
         data = await _retry_generate(_call)
 
@@ -23,6 +23,11 @@ PIPELINE_STAGES = [
     "finalize",
 ]
 
+# Fraction of the pipeline complete once each stage finishes
+_STAGE_PROGRESS = {
+    stage: (i + 1) / len(PIPELINE_STAGES) for i, stage in enumerate(PIPELINE_STAGES)
+}
+
 
 def stage_progress(stage: str) -> float:
     """Get overall progress (0.0-1.0) for a given pipeline stage.
@@ -30,10 +35,7 @@ def stage_progress(stage: str) -> float:
     Returns the fraction of the pipeline completed when the given stage
     finishes.
     """
-    if stage not in PIPELINE_STAGES:
-        return 0.0
-    idx = PIPELINE_STAGES.index(stage)
-    return (idx + 1) / len(PIPELINE_STAGES)
+    return _STAGE_PROGRESS.get(stage, 0.0)
 
 
 async def check_cancelled(state: dict) -> None:
@@ -1,49 +1,137 @@
-"""Shared constants for the translation pipeline."""
+"""Shared constants for the translation pipeline.
+
+All patterns are compiled once here with explicit flags.  Callers should
+use the compiled ``re.Pattern`` methods (``pattern.search(text)``) rather
+than passing ``pattern.pattern`` to module-level ``re`` functions, which
+would go through ``re``'s internal compile cache on every call.
+"""
 from __future__ import annotations
 
 import re
 
+try:  # Optional faster engine for the fused alternations (pip install regex)
+    import regex as _re_engine
+except ImportError:
+    _re_engine = re
+
+__all__ = [
+    "DIALOGUE_MARKERS",
+    "DIALOGUE_MARKERS_FUSED",
+    "SEGMENT_TYPE_PATTERNS",
+    "SPEAKER_PATTERNS",
+    "SPEAKER_PATTERNS_FUSED",
+    "THOUGHT_MARKER",
+]
+
 # ── Language-specific dialogue markers ────────────────────────────────
 DIALOGUE_MARKERS: dict[str, list[re.Pattern]] = {
     "ko": [
-        re.compile(r'^["\u201C].*["\u201D]\s*$'),        # "..." full line
-        re.compile(r'^["\u201C]'),                        # starts with "
-        re.compile(r'^\u300C.*\u300D'),                   # Korean angular quotes
+        re.compile(r'^["\u201C].*["\u201D]\s*$', re.UNICODE),        # "..." full line
+        re.compile(r'^["\u201C]', re.UNICODE),                        # starts with "
+        re.compile(r'^\u300C.*\u300D', re.UNICODE),                   # Korean angular quotes
     ],
     "ja": [
-        re.compile(r'^\u300C.*\u300D'),                   # Japanese brackets
-        re.compile(r'^\u300E.*\u300F'),                   # double brackets
-        re.compile(r'^["\u201C].*["\u201D]'),
+        re.compile(r'^\u300C.*\u300D', re.UNICODE),                   # Japanese brackets
+        re.compile(r'^\u300E.*\u300F', re.UNICODE),                   # double brackets
+        re.compile(r'^["\u201C].*["\u201D]', re.UNICODE),
     ],
     "zh": [
-        re.compile(r'^\u201C.*\u201D'),                   # Chinese quotes
-        re.compile(r'^["\u300C]'),
+        re.compile(r'^\u201C.*\u201D', re.UNICODE),                   # Chinese quotes
+        re.compile(r'^["\u300C]', re.UNICODE),
     ],
     "en": [
-        re.compile(r'^["\u201C].*["\u201D]\s*$'),
-        re.compile(r'^["\u201C]'),
-        re.compile(r"^'.*'\s*$"),
+        re.compile(r'^["\u201C].*["\u201D]\s*$', re.UNICODE),
+        re.compile(r'^["\u201C]', re.UNICODE),
+        re.compile(r"^'.*'\s*$", re.UNICODE),
     ],
 }
 
+def _fuse_markers(patterns: list[re.Pattern]) -> re.Pattern:
+    """Fuse patterns into one alternation that matches wherever any of them does."""
+    branches = [
+        f"(?i:{p.pattern})" if p.flags & re.IGNORECASE else f"(?:{p.pattern})"
+        for p in patterns
+    ]
+    return _re_engine.compile("|".join(branches), _re_engine.UNICODE)
+
+
+# One compiled alternation per language -- "is this dialogue?" in one search
+DIALOGUE_MARKERS_FUSED: dict[str, re.Pattern] = {
+    lang: _fuse_markers(patterns)
+    for lang, patterns in DIALOGUE_MARKERS.items()
+}
+
+# Internal monologue markers: 'thought', (thought), CJK brackets
+THOUGHT_MARKER: re.Pattern = re.compile(
+    r"(?:^\u2018.*\u2019$)"
+    r"|(?:^\(.*\)$)"
+    r"|(?:^[\u3008\u3010].*[\u3009\u3011]$)",
+    re.UNICODE,
+)
+
+
+def _segment_type_pattern(dialogue: re.Pattern) -> re.Pattern:
+    """Combine a fused dialogue pattern with the thought markers.
+
+    Every branch is anchored at the start of the text, so one ``match``
+    call classifies a paragraph: ``match.lastgroup`` is ``"dialogue"`` or
+    ``"thought"``, and dialogue wins when both apply.
+    """
+    return _re_engine.compile(
+        f"(?P<dialogue>{dialogue.pattern})|(?P<thought>{THOUGHT_MARKER.pattern})",
+        _re_engine.UNICODE,
+    )
+
+
+# One compiled dialogue-or-thought alternation per language
+SEGMENT_TYPE_PATTERNS: dict[str, re.Pattern] = {
+    lang: _segment_type_pattern(pattern)
+    for lang, pattern in DIALOGUE_MARKERS_FUSED.items()
+}
+
 # Speaker attribution patterns per language
 SPEAKER_PATTERNS: dict[str, list[re.Pattern]] = {
     "ko": [
-        re.compile(r'["\u201D]\s*(?:\ub77c\uace0|\uc774\ub77c\uace0)\s+(\w+)'),
-        re.compile(r'(\w+)[\uc774\uac00\uc740\ub294]\s+\ub9d0\ud588\ub2e4'),
-        re.compile(r'(\w+)\s*:\s*["\u201C]'),
+        re.compile(r'["\u201D]\s*(?:\ub77c\uace0|\uc774\ub77c\uace0)\s+(\w+)', re.UNICODE),
+        re.compile(r'(\w+)[\uc774\uac00\uc740\ub294]\s+\ub9d0\ud588\ub2e4', re.UNICODE),
+        re.compile(r'(\w+)\s*:\s*["\u201C]', re.UNICODE),
     ],
     "ja": [
-        re.compile(r'\u300D\u3068(\w+)'),
-        re.compile(r'(\w+)\u306F\u8A00\u3063\u305F'),
+        re.compile(r'\u300D\u3068(\w+)', re.UNICODE),
+        re.compile(r'(\w+)\u306F\u8A00\u3063\u305F', re.UNICODE),
     ],
     "zh": [
-        re.compile(r'\u201D(\w+)\u8BF4'),
-        re.compile(r'(\w+)\u8BF4\s*[:\uFF1A]\s*\u201C'),
+        re.compile(r'\u201D(\w+)\u8BF4', re.UNICODE),
+        re.compile(r'(\w+)\u8BF4\s*[:\uFF1A]\s*\u201C', re.UNICODE),
     ],
     "en": [
-        re.compile(r'["\u201D]\s+said\s+(\w+)', re.IGNORECASE),
-        re.compile(r'(\w+)\s+said[,.]?\s*["\u201C]', re.IGNORECASE),
-        re.compile(r'(\w+)\s*:\s*["\u201C]'),
+        re.compile(r'["\u201D]\s+said\s+(\w+)', re.IGNORECASE | re.UNICODE),
+        re.compile(r'(\w+)\s+said[,.]?\s*["\u201C]', re.IGNORECASE | re.UNICODE),
+        re.compile(r'(\w+)\s*:\s*["\u201C]', re.UNICODE),
     ],
 }
+
+
+def _fuse_speaker_patterns(patterns: list[re.Pattern]) -> re.Pattern:
+    """Fuse a language's speaker patterns into a single alternation.
+
+    Each branch's ``(\\w+)`` capture is renamed to ``speaker<N>`` so the
+    matched name can be read with ``match.group(match.lastgroup)``.
+    Per-pattern IGNORECASE is preserved as a scoped inline flag.  The
+    result is compiled with the third-party ``regex`` module when it is
+    installed and with ``re`` otherwise; both expose the same API here.
+    """
+    branches: list[str] = []
+    for i, pattern in enumerate(patterns):
+        source = pattern.pattern.replace(r"(\w+)", rf"(?P<speaker{i}>\w+)", 1)
+        if pattern.flags & re.IGNORECASE:
+            source = f"(?i:{source})"
+        branches.append(f"(?:{source})")
+    return _re_engine.compile("|".join(branches), _re_engine.UNICODE)
+
+
+# One compiled alternation per language -- a single search per segment
+SPEAKER_PATTERNS_FUSED: dict[str, re.Pattern] = {
+    lang: _fuse_speaker_patterns(patterns)
+    for lang, patterns in SPEAKER_PATTERNS.items()
+}
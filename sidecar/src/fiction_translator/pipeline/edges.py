@@ -38,3 +38,16 @@ def should_re_translate(state: TranslationState) -> str:
         # Max retries exhausted, proceed anyway
         return "learn"
     return "translate"
+
+
+def should_fuse_analysis(state: TranslationState) -> str:
+    """After translation: pick separate or fused review/learning.
+
+    Returns
+    -------
+    "analyse"  -- ``fused_analysis`` is set: one combined LLM call per chunk
+    "review"   -- default: review, then persona/relationship learning
+    """
+    if state.get("fused_analysis", False):
+        return "analyse"
+    return "review"
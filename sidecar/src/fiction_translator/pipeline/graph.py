@@ -7,20 +7,29 @@ Exports:
 """
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
 from datetime import datetime
+from operator import itemgetter
 
 from langgraph.graph import END, StateGraph
-from sqlalchemy.sql import func
+from sqlalchemy import insert
+from sqlalchemy.orm import load_only
 
 from fiction_translator.pipeline.callbacks import notify
 from fiction_translator.pipeline.edges import (
+    should_fuse_analysis,
     should_re_segment,
     should_re_translate,
 )
+from fiction_translator.pipeline.nodes._common import segment_key
 from fiction_translator.pipeline.nodes.character_extractor import (
     character_extractor_node,
 )
+from fiction_translator.pipeline.nodes.combined_analysis import (
+    combined_analysis_node,
+)
 from fiction_translator.pipeline.nodes.persona_learner import (
     persona_learner_node,
 )
@@ -41,6 +50,17 @@ logger = logging.getLogger(__name__)
 # ─────────────────────────────────────────────────────────────────────
 
 
+def _sort_by_segment_id(translated_segments: list[dict]) -> list[tuple[int, dict]]:
+    """Return ``(segment_id, segment)`` pairs sorted by segment id.
+
+    Decorate-sort-undecorate: the key is read once per segment rather
+    than on every comparison.
+    """
+    keyed = [(segment_key(s), s) for s in translated_segments]
+    keyed.sort(key=itemgetter(0))
+    return keyed
+
+
 def _build_connected_text(
     translated_segments: list[dict],
     segments: list[dict],
@@ -49,41 +69,38 @@ def _build_connected_text(
 
     Returns (connected_text, segment_map).
     """
-    sorted_segs = sorted(
-        translated_segments,
-        key=lambda s: s.get("segment_id", s.get("order", 0)),
-    )
+    # Project the source fields used below into tuples keyed by order:
+    # (has_preceding_break, source_start_offset, source_end_offset)
+    source_fields = {
+        s.get("order"): (
+            s.get("has_preceding_break", False),
+            s.get("source_start_offset", 0),
+            s.get("source_end_offset", 0),
+        )
+        for s in segments
+    }
+    missing = (False, 0, 0)
 
-    parts: list[str] = []
-    offset = 0
+    keyed = _sort_by_segment_id(translated_segments)
+    n = len(keyed)
+    # Size is known up front: text i lives at parts[2*i], the separator
+    # before it at parts[2*i - 1]
+    parts: list[str] = [""] * max(2 * n - 1, 0)
     segment_map: list[dict] = []
+    offset = 0
 
-    for i, seg in enumerate(sorted_segs):
+    for i, (seg_id, seg) in enumerate(keyed):
         text = seg.get("translated_text", "")
+        has_break, source_start, source_end = source_fields.get(seg_id, missing)
 
         if i > 0:
-            seg_id = seg.get("segment_id", seg.get("order", 0))
-            has_break = False
-            for src_seg in segments:
-                if src_seg.get("order") == seg_id:
-                    has_break = src_seg.get("has_preceding_break", False)
-                    break
             separator = "\n\n" if has_break else "\n"
             offset += len(separator)
-            parts.append(separator)
+            parts[2 * i - 1] = separator
 
         start = offset
         end = offset + len(text)
 
-        source_start = 0
-        source_end = 0
-        seg_id = seg.get("segment_id", seg.get("order", 0))
-        for src_seg in segments:
-            if src_seg.get("order") == seg_id:
-                source_start = src_seg.get("source_start_offset", 0)
-                source_end = src_seg.get("source_end_offset", 0)
-                break
-
         segment_map.append({
             "segment_id": seg_id,
             "source_start": source_start,
@@ -95,7 +112,7 @@ def _build_connected_text(
             "batch_id": seg.get("batch_id"),
         })
 
-        parts.append(text)
+        parts[2 * i] = text
         offset = end
 
     connected = "".join(parts)
@@ -105,60 +122,83 @@ def _build_connected_text(
 def _persist_segments_and_translations(
     db, chapter_id: int, segments: list[dict], sorted_segs: list[dict],
     segment_map: list[dict], target_language: str,
+    seg_to_batch_db_id: dict[int, int] | None = None,
 ):
-    """Save segments and their translations to the database."""
+    """Save segments and their translations to the database.
+
+    *seg_to_batch_db_id* maps segment order to its persisted batch id so
+    each translation is linked to its batch at insert time.
+    """
     from fiction_translator.db.models import Segment, Translation, TranslationStatus
 
-    # Clear previous segments for this chapter
+    # Clear previous segments for this chapter.  None of these rows are
+    # loaded in this session, so skip the SELECT that "fetch" sync issues.
+    # Translations are deleted explicitly: SQLite only honours ON DELETE
+    # CASCADE when foreign_keys is enabled, which this engine does not do.
     db.query(Translation).filter(
         Translation.segment_id.in_(
             db.query(Segment.id).filter(Segment.chapter_id == chapter_id)
         )
-    ).delete(synchronize_session="fetch")
+    ).delete(synchronize_session=False)
     db.query(Segment).filter(Segment.chapter_id == chapter_id).delete(
-        synchronize_session="fetch"
+        synchronize_session=False
     )
 
-    for i, src_seg in enumerate(segments):
-        db_seg = Segment(
-            chapter_id=chapter_id,
-            order=src_seg.get("order", i),
-            source_text=src_seg.get("text", ""),
-            source_start_offset=src_seg.get("source_start_offset"),
-            source_end_offset=src_seg.get("source_end_offset"),
-            segment_type=src_seg.get("type", "narrative"),
-            speaker=src_seg.get("speaker"),
-            status=TranslationStatus.TRANSLATED,
-        )
-        db.add(db_seg)
-        db.flush()
-
-        seg_order = src_seg.get("order", i)
-        matching_trans = None
-        for ts in sorted_segs:
-            if ts.get("segment_id", ts.get("order")) == seg_order:
-                matching_trans = ts
-                break
+    if not segments:
+        return
 
-        if matching_trans:
-            trans_start = 0
-            trans_end = 0
-            for sm in segment_map:
-                if sm["segment_id"] == seg_order:
-                    trans_start = sm["translated_start"]
-                    trans_end = sm["translated_end"]
-                    break
-
-            db_trans = Translation(
-                segment_id=db_seg.id,
-                target_language=target_language,
-                translated_text=matching_trans.get("translated_text", ""),
-                translated_start_offset=trans_start,
-                translated_end_offset=trans_end,
-                status=TranslationStatus.TRANSLATED,
-                batch_id=None,
-            )
-            db.add(db_trans)
+    seg_to_batch_db_id = seg_to_batch_db_id or {}
+
+    # Index translations and offsets by segment order for O(1) lookup
+    trans_by_order = {ts.get("segment_id", ts.get("order")): ts for ts in sorted_segs}
+    sm_by_id = {sm["segment_id"]: sm for sm in segment_map}
+
+    # Insert all segments in one statement and map order -> new id
+    segment_rows = [
+        {
+            "chapter_id": chapter_id,
+            "order": src_seg.get("order", i),
+            "source_text": src_seg.get("text", ""),
+            "source_start_offset": src_seg.get("source_start_offset"),
+            "source_end_offset": src_seg.get("source_end_offset"),
+            "segment_type": src_seg.get("type", "narrative"),
+            "speaker": src_seg.get("speaker"),
+            "status": TranslationStatus.TRANSLATED,
+        }
+        for i, src_seg in enumerate(segments)
+    ]
+    result = db.execute(
+        insert(Segment).returning(Segment.id, Segment.order),
+        segment_rows,
+    )
+    order_to_seg_id = {order: seg_id for seg_id, order in result}
+
+    translation_rows: list[dict] = []
+    for row in segment_rows:
+        seg_order = row["order"]
+        matching_trans = trans_by_order.get(seg_order)
+        if not matching_trans:
+            continue
+
+        trans_start = 0
+        trans_end = 0
+        sm = sm_by_id.get(seg_order)
+        if sm:
+            trans_start = sm["translated_start"]
+            trans_end = sm["translated_end"]
+
+        translation_rows.append({
+            "segment_id": order_to_seg_id[seg_order],
+            "target_language": target_language,
+            "translated_text": matching_trans.get("translated_text", ""),
+            "translated_start_offset": trans_start,
+            "translated_end_offset": trans_end,
+            "status": TranslationStatus.TRANSLATED,
+            "batch_id": seg_to_batch_db_id.get(seg_order),
+        })
+
+    if translation_rows:
+        db.execute(insert(Translation), translation_rows)
 
 
 def _persist_batches(db, chapter_id: int, target_language: str, state: dict) -> dict[int, int]:
@@ -166,61 +206,193 @@ def _persist_batches(db, chapter_id: int, target_language: str, state: dict) ->
     from fiction_translator.db.models import TranslationBatch
 
     batches = state.get("batches", [])
-    batch_order_to_id: dict[int, int] = {}
+    if not batches:
+        return {}
+
     final_review_passed = state.get("review_passed", True)
     final_review_feedback = state.get("review_feedback", [])
     final_review_iteration = state.get("review_iteration", 0)
 
+    batch_rows: list[dict] = []
     for batch_data in batches:
         if final_review_passed:
             stored_feedback = None
         else:
             stored_feedback = final_review_feedback or batch_data.get("review_feedback")
 
-        db_batch = TranslationBatch(
-            chapter_id=chapter_id,
-            target_language=target_language,
-            batch_order=batch_data.get("batch_order", 0),
-            situation_summary=batch_data.get("situation_summary"),
-            character_events=batch_data.get("character_events"),
-            full_cot_json={
+        batch_rows.append({
+            "chapter_id": chapter_id,
+            "target_language": target_language,
+            "batch_order": batch_data.get("batch_order", 0),
+            "situation_summary": batch_data.get("situation_summary"),
+            "character_events": batch_data.get("character_events"),
+            "full_cot_json": {
                 "situation_summary": batch_data.get("situation_summary"),
                 "character_events": batch_data.get("character_events"),
                 "translations": batch_data.get("translations"),
             },
-            segment_ids=batch_data.get("segment_ids"),
-            review_feedback=stored_feedback,
-            review_iteration=final_review_iteration,
-        )
-        db.add(db_batch)
-        db.flush()
-        batch_order_to_id[batch_data.get("batch_order", 0)] = db_batch.id
-
-    return batch_order_to_id
+            "segment_ids": batch_data.get("segment_ids"),
+            "review_feedback": stored_feedback,
+            "review_iteration": final_review_iteration,
+        })
 
+    # Single INSERT ... RETURNING for all batches
+    result = db.execute(
+        insert(TranslationBatch).returning(
+            TranslationBatch.id, TranslationBatch.batch_order,
+        ),
+        batch_rows,
+    )
+    return {batch_order: batch_id for batch_id, batch_order in result}
 
-def _link_translations_to_batches(db, chapter_id: int, batches: list[dict], batch_order_to_id: dict[int, int]):
-    """Link translation records to their batch records."""
-    from fiction_translator.db.models import Segment, Translation
-
-    if not batch_order_to_id:
-        return
 
+def _map_segments_to_batches(batches: list[dict], batch_order_to_id: dict[int, int]) -> dict[int, int]:
+    """Return segment order -> persisted batch id for the given batches."""
     seg_to_batch_db_id: dict[int, int] = {}
     for batch_data in batches:
         db_batch_id = batch_order_to_id.get(batch_data.get("batch_order", 0))
         if db_batch_id:
             for seg_id in (batch_data.get("segment_ids") or []):
                 seg_to_batch_db_id[seg_id] = db_batch_id
+    return seg_to_batch_db_id
+
+
+def _apply_persona_suggestion(persona, field_name: str, value) -> None:
+    """Write a suggested value onto an auto-detected persona."""
+    if field_name == "personality":
+        persona.personality = value
+    elif field_name == "speech_style":
+        persona.speech_style = value
+    elif field_name == "formality_level":
+        # Convert to int if it's a string number
+        try:
+            persona.formality_level = int(value)
+        except (ValueError, TypeError):
+            pass
+    elif field_name == "aliases":
+        # Add to aliases list (avoid duplicates)
+        if not persona.aliases:
+            persona.aliases = []
+        if value and value not in persona.aliases:
+            persona.aliases = persona.aliases + [value]
+
+
+def _persist_persona_suggestions(db, project_id: int, persona_suggestions: list[dict]) -> None:
+    """Save persona suggestions, creating auto-detected personas as needed.
+
+    Suggestions for auto-detected personas are applied immediately and
+    stored as ``auto_applied``; those for user-created personas are
+    stored as ``pending``.  Personas are resolved with at most two
+    reads, new personas are flushed together, and every suggestion row
+    goes in a single INSERT.
+    """
+    from fiction_translator.db.models import Persona, PersonaSuggestion
 
-    for trans in db.query(Translation).filter(
-        Translation.segment_id.in_(
-            db.query(Segment.id).filter(Segment.chapter_id == chapter_id)
-        )
-    ).all():
-        seg = db.query(Segment).filter(Segment.id == trans.segment_id).first()
-        if seg and seg.order in seg_to_batch_db_id:
-            trans.batch_id = seg_to_batch_db_id[seg.order]
+    if not persona_suggestions:
+        return
+
+    # Columns read while resolving and applying suggestions; fields that
+    # are only assigned (personality, speech_style, ...) need not be loaded
+    persona_columns = load_only(
+        Persona.id, Persona.name, Persona.aliases, Persona.auto_detected,
+    )
+
+    # Group suggestions by character name
+    suggestions_by_name: dict[str, list[dict]] = {}
+    for suggestion in persona_suggestions:
+        suggestions_by_name.setdefault(suggestion.get("name", "Unknown"), []).append(suggestion)
+
+    # Names whose suggestions already carry a persona_id
+    explicit_ids: dict[str, int] = {}
+    for char_name, char_suggestions in suggestions_by_name.items():
+        for suggestion in char_suggestions:
+            if suggestion.get("persona_id") is not None:
+                explicit_ids[char_name] = suggestion["persona_id"]
+                break
+
+    personas_by_id: dict[int, Persona] = {}
+    if explicit_ids:
+        personas_by_id = {
+            p.id: p
+            for p in db.query(Persona).options(persona_columns).filter(
+                Persona.id.in_(set(explicit_ids.values()))
+            )
+        }
+
+    # Resolve the remaining names by name, then alias (case-insensitive),
+    # creating auto-detected personas for characters not seen before
+    resolved: dict[str, Persona] = {}
+    unresolved = [name for name in suggestions_by_name if name not in explicit_ids]
+    if unresolved:
+        by_name: dict[str, Persona] = {}
+        by_alias: dict[str, Persona] = {}
+        project_personas = db.query(Persona).options(persona_columns).filter(
+            Persona.project_id == project_id
+        ).order_by(Persona.id)
+        for p in project_personas:
+            by_name.setdefault(p.name.lower(), p)
+            if p.aliases and isinstance(p.aliases, list):
+                for alias in p.aliases:
+                    by_alias.setdefault(alias.lower(), p)
+
+        created: dict[str, Persona] = {}
+        for char_name in unresolved:
+            name_lower = char_name.lower()
+            persona = by_name.get(name_lower) or by_alias.get(name_lower) or created.get(name_lower)
+            if persona is None:
+                persona = Persona(
+                    project_id=project_id,
+                    name=char_name,
+                    auto_detected=True,
+                    detection_confidence=suggestions_by_name[char_name][0].get("confidence"),
+                )
+                created[name_lower] = persona
+            resolved[char_name] = persona
+
+        if created:
+            # One flush for all new personas to obtain their ids
+            db.add_all(created.values())
+            db.flush()
+
+    suggestion_rows: list[dict] = []
+    for char_name, char_suggestions in suggestions_by_name.items():
+        if char_name in explicit_ids:
+            persona_id = explicit_ids[char_name]
+            persona = personas_by_id.get(persona_id)
+        else:
+            persona = resolved[char_name]
+            persona_id = persona.id
+
+        # Auto-apply suggestions to auto-detected personas
+        auto_apply = persona is not None and persona.auto_detected
+        for suggestion in char_suggestions:
+            field_name = suggestion.get("field", "")
+            suggested_value = suggestion.get("value", "")
+            if auto_apply:
+                _apply_persona_suggestion(persona, field_name, suggested_value)
+            suggestion_rows.append({
+                "persona_id": persona_id,
+                "field_name": field_name,
+                "suggested_value": suggested_value,
+                "confidence": suggestion.get("confidence"),
+                "status": "auto_applied" if auto_apply else "pending",
+            })
+
+    db.execute(insert(PersonaSuggestion), suggestion_rows)
+
+
+def _read_in_own_session(read_fn, project_id: int):
+    """Run a read-only service call on a dedicated session.
+
+    Sessions are not thread-safe, so each concurrent read gets its own.
+    """
+    from fiction_translator.db.session import get_db
+
+    db = get_db()
+    try:
+        return read_fn(db, project_id)
+    finally:
+        db.close()
 
 
 async def load_context_node(state: TranslationState) -> dict:
@@ -228,7 +400,7 @@ async def load_context_node(state: TranslationState) -> dict:
     callback = state.get("progress_callback")
     await notify(callback, "load_context", 0.0, "Loading project context...")
 
-    from fiction_translator.db.session import get_db
+    from fiction_translator.pipeline.nodes._common import build_name_index
     from fiction_translator.services.glossary_service import get_glossary_map
     from fiction_translator.services.persona_service import (
         get_personas_context,
@@ -239,30 +411,60 @@ async def load_context_node(state: TranslationState) -> dict:
         list_relationships,
     )
 
-    db = get_db()
-    try:
-        project_id = state["project_id"]
-        glossary = get_glossary_map(db, project_id)
-        personas_ctx = get_personas_context(db, project_id)
-        existing = list_personas(db, project_id)
-        relationships = list_relationships(db, project_id)
-        relationships_ctx = get_relationships_context(db, project_id)
-
-        await notify(
-            callback, "load_context", 1.0,
-            f"Loaded {len(glossary)} glossary terms, {len(existing)} personas, "
-            f"{len(relationships)} relationships",
+    project_id = state["project_id"]
+    # Independent reads -- overlap them on worker threads
+    glossary, personas_ctx, existing, relationships, relationships_ctx = await asyncio.gather(
+        *(
+            asyncio.to_thread(_read_in_own_session, read_fn, project_id)
+            for read_fn in (
+                get_glossary_map,
+                get_personas_context,
+                list_personas,
+                list_relationships,
+                get_relationships_context,
+            )
         )
+    )
 
-        return {
-            "glossary": glossary,
-            "personas_context": personas_ctx,
-            "existing_personas": existing,
-            "existing_relationships": relationships,
-            "relationships_context": relationships_ctx,
+    await notify(
+        callback, "load_context", 1.0,
+        f"Loaded {len(glossary)} glossary terms, {len(existing)} personas, "
+        f"{len(relationships)} relationships",
+    )
+
+    return {
+        "glossary": glossary,
+        "personas_context": personas_ctx,
+        "existing_personas": existing,
+        # Lowercased once here so every learner lookup is a plain dict hit
+        "persona_name_index": build_name_index(existing),
+        "existing_relationships": relationships,
+        "relationships_context": relationships_ctx,
+    }
+
+
+async def learn_node(state: TranslationState) -> dict:
+    """Run persona and relationship learning concurrently.
+
+    Both are independent LLM analyses of the same translated text, so
+    the text is joined once (normally by the translator) and the two
+    calls overlap.
+    """
+    from fiction_translator.pipeline.nodes._common import join_translated_text
+
+    shared_state = state
+    if state.get("translated_text_joined") is None:
+        shared_state = {
+            **state,
+            "translated_text_joined": join_translated_text(
+                state.get("translated_segments", []),
+            ),
         }
-    finally:
-        db.close()
+    persona_update, relationship_update = await asyncio.gather(
+        persona_learner_node(shared_state),
+        relationship_learner_node(shared_state),
+    )
+    return {**persona_update, **relationship_update}
 
 
 async def finalize_node(state: TranslationState) -> dict:
@@ -281,202 +483,93 @@ async def finalize_node(state: TranslationState) -> dict:
 
     connected, segment_map = _build_connected_text(translated_segments, segments)
 
-    sorted_segs = sorted(
-        translated_segments,
-        key=lambda s: s.get("segment_id", s.get("order", 0)),
-    )
+    sorted_segs = [seg for _, seg in _sort_by_segment_id(translated_segments)]
 
     # ── Persist to database ──────────────────────────────────────────
     from fiction_translator.db.models import (
         Chapter,
+        CharacterRelationship,
         GlossaryEntry,
-        Persona,
-        PersonaSuggestion,
     )
     from fiction_translator.db.session import get_db
 
     db = get_db()
     try:
-        chapter = db.query(Chapter).filter(Chapter.id == chapter_id).first()
-        if not chapter:
-            raise ValueError(f"Chapter {chapter_id} not found")
+        # One transaction for everything below; flushes happen only where
+        # generated ids are needed, and the commit happens on block exit.
+        with db.begin(), db.no_autoflush:
+            # Only project_id is read; skip loading the chapter's large text columns
+            chapter = db.get(
+                Chapter, chapter_id, options=[load_only(Chapter.id, Chapter.project_id)],
+            )
+            if not chapter:
+                raise ValueError(f"Chapter {chapter_id} not found")
 
-        # Save connected translated text
-        chapter.translated_content = connected
-        chapter.translation_stale = False
+            # Save connected translated text
+            chapter.translated_content = connected
+            chapter.translation_stale = False
 
-        _persist_segments_and_translations(
-            db, chapter_id, segments, sorted_segs, segment_map, target_language,
-        )
+            # Batches first so translations can reference them on insert
+            batch_order_to_id = _persist_batches(db, chapter_id, target_language, state)
+            seg_to_batch_db_id = _map_segments_to_batches(
+                state.get("batches", []), batch_order_to_id,
+            )
 
-        batch_order_to_id = _persist_batches(db, chapter_id, target_language, state)
-        _link_translations_to_batches(
-            db, chapter_id, state.get("batches", []), batch_order_to_id,
-        )
+            _persist_segments_and_translations(
+                db, chapter_id, segments, sorted_segs, segment_map, target_language,
+                seg_to_batch_db_id,
+            )
 
-        # Save persona suggestions
-        persona_suggestions = state.get("persona_suggestions", [])
-
-        # Track personas created in this batch to avoid duplicates
-        created_personas: dict[str, int] = {}
-
-        # Group suggestions by character name for efficient processing
-        suggestions_by_name: dict[str, list] = {}
-        for suggestion in persona_suggestions:
-            name = suggestion.get("name", "Unknown")
-            if name not in suggestions_by_name:
-                suggestions_by_name[name] = []
-            suggestions_by_name[name].append(suggestion)
-
-        # Process each character's suggestions
-        for char_name, char_suggestions in suggestions_by_name.items():
-            persona_id = None
-            persona = None
-
-            # Check if any suggestion already has a persona_id
-            for suggestion in char_suggestions:
-                if suggestion.get("persona_id") is not None:
-                    persona_id = suggestion.get("persona_id")
-                    persona = db.query(Persona).filter(Persona.id == persona_id).first()
-                    break
-
-            # If no existing persona_id, look for or create persona
-            if persona_id is None:
-                name_lower = char_name.lower()
-
-                # Check local batch cache first
-                if name_lower in created_personas:
-                    persona_id = created_personas[name_lower]
-                    persona = db.query(Persona).filter(Persona.id == persona_id).first()
-                else:
-                    # Query DB for existing persona by name (case-insensitive)
-                    persona = db.query(Persona).filter(
-                        Persona.project_id == chapter.project_id,
-                        func.lower(Persona.name) == name_lower
-                    ).first()
-
-                    # Also check aliases in existing personas
-                    if not persona:
-                        personas_with_aliases = db.query(Persona).filter(
-                            Persona.project_id == chapter.project_id,
-                            Persona.aliases.isnot(None)
-                        ).all()
-
-                        for p in personas_with_aliases:
-                            if p.aliases and isinstance(p.aliases, list):
-                                if any(alias.lower() == name_lower for alias in p.aliases):
-                                    persona = p
-                                    break
-
-                    # Create new persona if not found
-                    if not persona:
-                        # Get first suggestion's confidence for persona creation
-                        first_confidence = char_suggestions[0].get("confidence")
-
-                        persona = Persona(
+            # Save persona suggestions
+            _persist_persona_suggestions(
+                db, chapter.project_id, state.get("persona_suggestions", []),
+            )
+
+            # Save unknown terms as auto-detected glossary entries
+            unknown_terms = state.get("unknown_terms", [])
+            if unknown_terms:
+                # Single-column query -- no ORM hydration for a set of strings
+                existing_terms = {
+                    source_term.lower()
+                    for (source_term,) in db.query(GlossaryEntry.source_term).filter(
+                        GlossaryEntry.project_id == chapter.project_id
+                    )
+                }
+                for term in unknown_terms:
+                    source = term.get("source_term", "").strip()
+                    translated = term.get("translated_term", "").strip()
+                    if source and translated and source.lower() not in existing_terms:
+                        db.add(GlossaryEntry(
                             project_id=chapter.project_id,
-                            name=char_name,
+                            source_term=source,
+                            translated_term=translated,
+                            term_type=term.get("term_type", "general"),
                             auto_detected=True,
-                            detection_confidence=first_confidence,
-                        )
-                        db.add(persona)
-                        db.flush()
-                        created_personas[name_lower] = persona.id
-
-                    persona_id = persona.id
-
-            # Process all suggestions for this character
-            for suggestion in char_suggestions:
-                field_name = suggestion.get("field", "")
-                suggested_value = suggestion.get("value", "")
-                confidence = suggestion.get("confidence")
-
-                # Auto-apply suggestions to auto-detected personas
-                if persona and persona.auto_detected:
-                    if field_name == "personality":
-                        persona.personality = suggested_value
-                    elif field_name == "speech_style":
-                        persona.speech_style = suggested_value
-                    elif field_name == "formality_level":
-                        # Convert to int if it's a string number
-                        try:
-                            persona.formality_level = int(suggested_value)
-                        except (ValueError, TypeError):
-                            pass
-                    elif field_name == "aliases":
-                        # Add to aliases list (avoid duplicates)
-                        if not persona.aliases:
-                            persona.aliases = []
-                        if suggested_value and suggested_value not in persona.aliases:
-                            persona.aliases = persona.aliases + [suggested_value]
-
-                    # Create suggestion record with auto_applied status
-                    db_suggestion = PersonaSuggestion(
-                        persona_id=persona_id,
-                        field_name=field_name,
-                        suggested_value=suggested_value,
-                        confidence=confidence,
-                        status="auto_applied",
-                    )
-                else:
-                    # Create pending suggestion for manually-created personas
-                    db_suggestion = PersonaSuggestion(
-                        persona_id=persona_id,
-                        field_name=field_name,
-                        suggested_value=suggested_value,
-                        confidence=confidence,
-                        status="pending",
-                    )
-
-                db.add(db_suggestion)
-
-        # Save unknown terms as auto-detected glossary entries
-        unknown_terms = state.get("unknown_terms", [])
-        if unknown_terms:
-            existing_terms = {
-                e.source_term.lower()
-                for e in db.query(GlossaryEntry).filter(
-                    GlossaryEntry.project_id == chapter.project_id
-                ).all()
-            }
-            for term in unknown_terms:
-                source = term.get("source_term", "").strip()
-                translated = term.get("translated_term", "").strip()
-                if source and translated and source.lower() not in existing_terms:
-                    db.add(GlossaryEntry(
-                        project_id=chapter.project_id,
-                        source_term=source,
-                        translated_term=translated,
-                        term_type=term.get("term_type", "general"),
-                        auto_detected=True,
-                    ))
-                    existing_terms.add(source.lower())
-
-        # Save relationship suggestions
-        relationship_suggestions = state.get("relationship_suggestions", [])
-        if relationship_suggestions:
-            from fiction_translator.services.relationship_service import (
-                create_relationship,
-                list_relationships,
-            )
-            existing_rels = list_relationships(db, chapter.project_id)
-            existing_pairs = {
-                (r["persona_id_1"], r["persona_id_2"]) for r in existing_rels
-            }
-
-            for suggestion in relationship_suggestions:
-                pid1 = suggestion.get("persona_id_1")
-                pid2 = suggestion.get("persona_id_2")
-                if pid1 is None or pid2 is None:
-                    continue
-                # Normalize pair
-                if pid1 > pid2:
-                    pid1, pid2 = pid2, pid1
-                if (pid1, pid2) in existing_pairs:
-                    continue
-                try:
-                    create_relationship(
-                        db,
+                        ))
+                        existing_terms.add(source.lower())
+
+            # Save relationship suggestions.  Rows are added directly rather
+            # than via create_relationship(), which commits on every call.
+            relationship_suggestions = state.get("relationship_suggestions", [])
+            if relationship_suggestions:
+                existing_pairs = set(
+                    db.query(
+                        CharacterRelationship.persona_id_1,
+                        CharacterRelationship.persona_id_2,
+                    ).filter(CharacterRelationship.project_id == chapter.project_id)
+                )
+
+                for suggestion in relationship_suggestions:
+                    pid1 = suggestion.get("persona_id_1")
+                    pid2 = suggestion.get("persona_id_2")
+                    if pid1 is None or pid2 is None or pid1 == pid2:
+                        continue
+                    # Normalize pair
+                    if pid1 > pid2:
+                        pid1, pid2 = pid2, pid1
+                    if (pid1, pid2) in existing_pairs:
+                        continue
+                    db.add(CharacterRelationship(
                         project_id=chapter.project_id,
                         persona_id_1=pid1,
                         persona_id_2=pid2,
@@ -485,18 +578,13 @@ async def finalize_node(state: TranslationState) -> dict:
                         intimacy_level=suggestion.get("intimacy_level", 5),
                         auto_detected=True,
                         detection_confidence=suggestion.get("confidence"),
-                    )
+                    ))
                     existing_pairs.add((pid1, pid2))
-                except Exception:
-                    pass  # Skip duplicates or invalid pairs
-
-        db.commit()
-
-        await notify(callback, "finalize", 1.0, "Translation saved to database")
-
     finally:
         db.close()
 
+    await notify(callback, "finalize", 1.0, "Translation saved to database")
+
     return {
         "connected_translated_text": connected,
         "segment_map": segment_map,
@@ -515,10 +603,16 @@ def build_translation_graph() -> StateGraph:
         load_context -> segment -> extract_characters -> validate
             validate --[pass]--> translate
             validate --[fail, attempts < 3]--> segment
-        translate -> review
-            review --[pass]--> learn_personas
+        translate --[default]--> review
+            review --[pass]--> learn
             review --[fail, iteration < 2]--> translate
-        learn_personas -> learn_relationships -> finalize -> END
+        learn -> finalize -> END
+        translate --[fused_analysis]--> analyse
+            analyse --[pass]--> finalize
+            analyse --[fail, iteration < 2]--> translate
+
+    ``learn`` runs persona and relationship learning concurrently;
+    ``analyse`` does review and both analyses in one call per chunk.
     """
     graph = StateGraph(TranslationState)
 
@@ -529,8 +623,8 @@ def build_translation_graph() -> StateGraph:
     graph.add_node("validate", validator_node)
     graph.add_node("translate", translator_node)
     graph.add_node("review", reviewer_node)
-    graph.add_node("learn_personas", persona_learner_node)
-    graph.add_node("learn_relationships", relationship_learner_node)
+    graph.add_node("analyse", combined_analysis_node)
+    graph.add_node("learn", learn_node)
     graph.add_node("finalize", finalize_node)
 
     # Linear edges
@@ -545,18 +639,26 @@ def build_translation_graph() -> StateGraph:
         "translate": "translate",
     })
 
-    # Linear: translate -> review
-    graph.add_edge("translate", "review")
+    # Conditional: separate review + learning, or one fused analysis
+    graph.add_conditional_edges("translate", should_fuse_analysis, {
+        "review": "review",
+        "analyse": "analyse",
+    })
 
     # Conditional: review loop
     graph.add_conditional_edges("review", should_re_translate, {
         "translate": "translate",
-        "learn": "learn_personas",
+        "learn": "learn",
+    })
+
+    # Conditional: fused analysis loop (learning already done)
+    graph.add_conditional_edges("analyse", should_re_translate, {
+        "translate": "translate",
+        "learn": "finalize",
     })
 
-    # Linear: learn -> learn_relationships -> finalize -> END
-    graph.add_edge("learn_personas", "learn_relationships")
-    graph.add_edge("learn_relationships", "finalize")
+    # Linear: learn -> finalize -> END
+    graph.add_edge("learn", "finalize")
     graph.add_edge("finalize", END)
 
     return graph
@@ -567,13 +669,20 @@ def build_translation_graph() -> StateGraph:
 # ─────────────────────────────────────────────────────────────────────
 
 _compiled_graph = None
+_compiled_graph_lock = threading.Lock()
 
 
 def get_translation_graph():
-    """Get (or create) the compiled translation pipeline graph."""
+    """Get (or create) the compiled translation pipeline graph.
+
+    Compilation happens at most once per process, even when the first
+    calls race from several threads.
+    """
     global _compiled_graph
     if _compiled_graph is None:
-        _compiled_graph = build_translation_graph().compile()
+        with _compiled_graph_lock:
+            if _compiled_graph is None:
+                _compiled_graph = build_translation_graph().compile()
     return _compiled_graph
 
 
@@ -588,6 +697,8 @@ async def run_translation_pipeline(
     api_keys: dict | None = None,
     progress_callback=None,
     cancel_event=None,
+    fused_analysis: bool = False,
+    use_llm_cache: bool = False,
     **kwargs,
 ) -> dict:
     """Run the full translation pipeline for a chapter.
@@ -604,6 +715,12 @@ async def run_translation_pipeline(
         Provider API keys, e.g. ``{"gemini": "...", "openai": "..."}``.
     progress_callback : callable | None
         ``async def callback(stage, pct, message)``
+    fused_analysis : bool
+        Review and learn personas/relationships in one combined LLM call
+        per chunk instead of separate review and learning stages.
+    use_llm_cache : bool
+        Reuse stored LLM responses and segmentations for identical input
+        (off by default; re-runs then always call the provider).
     **kwargs
         Extra overrides merged into the initial state.
 
@@ -615,7 +732,7 @@ async def run_translation_pipeline(
     """
     from fiction_translator.db.models import Chapter, PipelineRun, PipelineStatus
 
-    chapter = db.query(Chapter).filter(Chapter.id == chapter_id).first()
+    chapter = db.get(Chapter, chapter_id)
     if not chapter:
         raise ValueError(f"Chapter {chapter_id} not found")
 
@@ -630,6 +747,8 @@ async def run_translation_pipeline(
         config={
             "llm_provider": project.llm_provider,
             "target_language": target_language,
+            "fused_analysis": fused_analysis,
+            "use_llm_cache": use_llm_cache,
         },
     )
     db.add(run)
@@ -644,16 +763,18 @@ async def run_translation_pipeline(
         "target_language": target_language,
         "llm_provider": project.llm_provider or "gemini",
         "api_keys": api_keys or {},
+        "use_llm_cache": use_llm_cache,
         "pipeline_run_id": run.id,
         "progress_callback": progress_callback,
         "cancel_event": cancel_event,
+        "fused_analysis": fused_analysis,
         "validation_attempts": 0,
         "review_iteration": 0,
         "total_tokens": 0,
         "total_cost": 0.0,
     }
     # Merge any extra overrides
-    initial_state.update(kwargs)  # type: ignore[arg-type]
+    initial_state.update(kwargs)
 
     try:
         from fiction_translator.pipeline.callbacks import PipelineCancelled
@@ -0,0 +1,244 @@
+"""Helpers shared by pipeline nodes."""
+from __future__ import annotations
+
+import logging
+from itertools import pairwise
+from operator import itemgetter
+
+logger = logging.getLogger(__name__)
+
+
+def segment_key(seg: dict) -> int:
+    """Return a translated segment's id, falling back to its order.
+
+    Unlike a nested ``seg.get("segment_id", seg.get("order", 0))``, the
+    fallback lookup only runs when the id is missing.
+    """
+    sid = seg.get("segment_id")
+    return sid if sid is not None else seg.get("order", 0)
+
+
+def join_translated_text(translated_segments: list[dict]) -> str:
+    """Join non-empty translations in segment order, one per line.
+
+    Translations usually arrive in segment order already; the sort is
+    skipped when a linear check confirms that.
+    """
+    keys = [segment_key(s) for s in translated_segments]
+    if all(a <= b for a, b in pairwise(keys)):
+        ordered = translated_segments
+    else:
+        ordered = [s for _, s in sorted(zip(keys, translated_segments, strict=True), key=itemgetter(0))]
+    return "\n".join(
+        s.get("translated_text", "") for s in ordered
+        if s.get("translated_text")
+    )
+
+
+def build_name_index(existing_personas: list[dict]) -> dict[str, int | None]:
+    """Map each persona's lowercased name and aliases to its ID.
+
+    Earlier personas win on collisions, matching a linear scan.
+    """
+    index: dict[str, int | None] = {}
+    for p in existing_personas:
+        for name in [p.get("name", ""), *(p.get("aliases") or [])]:
+            if name:
+                index.setdefault(name.lower(), p.get("id"))
+    return index
+
+
+def persona_name_index(state: dict) -> dict[str, int | None]:
+    """Return the name index loaded with the context, building it if absent."""
+    index = state.get("persona_name_index")
+    if index is None:
+        index = build_name_index(state.get("existing_personas", []))
+    return index
+
+
+# ── Persona and relationship suggestions ─────────────────────────────
+
+_PERSONA_FIELDS = frozenset({"personality", "speech_style", "formality_level", "aliases"})
+
+_RELATIONSHIP_TYPES = frozenset({
+    "friend", "rival", "family", "romantic", "mentor",
+    "subordinate", "enemy", "ally", "acquaintance",
+})
+
+
+def normalise_persona_updates(
+    raw_updates: list[dict],
+    name_index: dict[str, int | None],
+) -> list[dict]:
+    """Filter raw LLM ``persona_updates`` into persona suggestions.
+
+    Drops incomplete, unknown-field and low-confidence (< 0.3) updates and
+    matches each name to an existing persona id where possible.
+    """
+    suggestions: list[dict] = []
+
+    for update in raw_updates:
+        name = update.get("name", "").strip()
+        field = update.get("field", "").strip()
+        value = update.get("value")
+        confidence = update.get("confidence", 0.5)
+
+        if not name or not field or not value:
+            continue
+        if field not in _PERSONA_FIELDS:
+            continue
+        if confidence < 0.3:
+            continue
+
+        suggestions.append({
+            "name": name,
+            "persona_id": name_index.get(name.lower()),
+            "field": field,
+            "value": str(value),
+            "confidence": confidence,
+            "evidence": update.get("evidence", ""),
+        })
+
+    return suggestions
+
+
+def normalise_relationship_updates(
+    raw_updates: list[dict],
+    name_index: dict[str, int | None],
+) -> list[dict]:
+    """Filter raw LLM ``relationship_updates`` into relationship suggestions.
+
+    Drops incomplete, unknown-type and low-confidence (< 0.3) updates,
+    clamps intimacy to 1-10 and resolves both names to persona ids.
+    """
+    suggestions: list[dict] = []
+
+    for update in raw_updates:
+        char_1 = update.get("character_1", "").strip()
+        char_2 = update.get("character_2", "").strip()
+        rel_type = update.get("relationship_type", "").strip()
+        intimacy = update.get("intimacy_level", 5)
+        confidence = update.get("confidence", 0.5)
+
+        if not char_1 or not char_2 or not rel_type:
+            continue
+        if rel_type not in _RELATIONSHIP_TYPES:
+            continue
+        if confidence < 0.3:
+            continue
+
+        # Clamp intimacy
+        intimacy = max(1, min(10, int(intimacy)))
+
+        suggestions.append({
+            "character_1": char_1,
+            "character_2": char_2,
+            "persona_id_1": name_index.get(char_1.lower()),
+            "persona_id_2": name_index.get(char_2.lower()),
+            "relationship_type": rel_type,
+            "intimacy_level": intimacy,
+            "description": update.get("description", ""),
+            "confidence": confidence,
+            "evidence": update.get("evidence", ""),
+        })
+
+    return suggestions
+
+
+# ── Review ───────────────────────────────────────────────────────────
+
+# Max review chunks in flight at once (overridable via state["review_concurrency"])
+DEFAULT_REVIEW_CONCURRENCY = 8
+
+# Estimated prompt tokens per review call (overridable via state["review_token_budget"])
+DEFAULT_REVIEW_TOKEN_BUDGET = 6000
+
+# Hard cap on pairs per review call, so the per-pair verdicts fit in max_tokens
+REVIEW_MAX_PAIRS = 100
+
+
+def build_review_pairs(translated_segments: list[dict]) -> list[dict]:
+    """Build the source/translation pairs sent for review."""
+    pairs = [
+        {
+            "segment_id": segment_key(seg),
+            "source_text": seg.get("source_text", ""),
+            "translated_text": seg.get("translated_text", ""),
+            "type": seg.get("type", "narrative"),
+            "speaker": seg.get("speaker"),
+        }
+        for seg in translated_segments
+    ]
+
+    # Warn if any pairs have empty translations before sending to LLM
+    empty = [p["segment_id"] for p in pairs if not p.get("translated_text")]
+    if empty:
+        logger.warning(
+            "Review: %d segments have empty translated_text: %s",
+            len(empty), empty,
+        )
+    return pairs
+
+
+def _pair_tokens(pair: dict) -> int:
+    """Rough prompt-token estimate for one pair (~3 chars/token + framing)."""
+    return len(pair["source_text"] or "") // 3 + len(pair["translated_text"] or "") // 3 + 40
+
+
+def pack_by_tokens(
+    pairs: list[dict],
+    budget: int = DEFAULT_REVIEW_TOKEN_BUDGET,
+    max_pairs: int = REVIEW_MAX_PAIRS,
+) -> list[list[dict]]:
+    """Split *pairs* into consecutive chunks of at most ~*budget* tokens.
+
+    A pair larger than the budget on its own still gets a chunk of its own.
+    """
+    chunks: list[list[dict]] = []
+    chunk: list[dict] = []
+    used = 0
+    for pair in pairs:
+        cost = _pair_tokens(pair)
+        if chunk and (used + cost > budget or len(chunk) >= max_pairs):
+            chunks.append(chunk)
+            chunk, used = [], 0
+        chunk.append(pair)
+        used += cost
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def segments_to_review(state: dict, review_iteration: int) -> list[dict]:
+    """Return the translated segments a review pass should look at.
+
+    Segments that passed were not re-translated, so from the second
+    iteration on only the ones flagged last time are reviewed again.
+    """
+    translated_segments = state.get("translated_segments", [])
+    if review_iteration <= 1:
+        return translated_segments
+    flagged_prev = set(state.get("flagged_segments", []))
+    return [s for s in translated_segments if segment_key(s) in flagged_prev]
+
+
+def collect_flagged(reviews: list[dict]) -> tuple[list[int], list[dict]]:
+    """Return the flagged segment ids and their feedback entries.
+
+    Reviews with ``verdict == "flag"`` but no segment id are ignored.
+    """
+    flagged: list[int] = []
+    feedback: list[dict] = []
+
+    for review in reviews:
+        if review.get("verdict") == "flag":
+            sid = review.get("segment_id")
+            if sid is not None:
+                flagged.append(sid)
+                feedback.append({
+                    "segment_id": sid,
+                    "issue": review.get("issue", ""),
+                    "suggestion": review.get("suggestion", ""),
+                })
+
+    return flagged, feedback
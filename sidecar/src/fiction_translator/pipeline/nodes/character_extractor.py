@@ -7,14 +7,21 @@ identification.
 from __future__ import annotations
 
 import logging
+from bisect import bisect_right
 from collections import Counter
+from functools import lru_cache
+from itertools import accumulate
+from operator import itemgetter
 
 from fiction_translator.pipeline.callbacks import notify
-from fiction_translator.pipeline.constants import SPEAKER_PATTERNS
+from fiction_translator.pipeline.constants import SPEAKER_PATTERNS_FUSED
 from fiction_translator.pipeline.state import TranslationState
 
 logger = logging.getLogger(__name__)
 
+# Max characters of chapter text sent to the LLM for character analysis
+_LLM_TEXT_LIMIT = 8000
+
 
 async def character_extractor_node(state: TranslationState) -> dict:
     """Extract characters using regex patterns + optional LLM analysis."""
@@ -27,31 +34,35 @@ async def character_extractor_node(state: TranslationState) -> dict:
 
     # ── 1. Pattern-based extraction from segments ────────────────────
     speaker_counts: Counter = Counter()
-    patterns = SPEAKER_PATTERNS.get(source_language, SPEAKER_PATTERNS["en"])
+    pending: list[str] = []
 
     for seg in segments:
         # Use speaker from segmentation if available
         if seg.get("speaker"):
             speaker_counts[seg["speaker"]] += 1
-            continue
-
-        # Only scan dialogue segments
-        if seg.get("type") != "dialogue":
-            continue
-
-        text = seg.get("text", "")
-        for pattern in patterns:
-            match = pattern.search(text)
-            if match:
-                name = match.group(1).strip()
-                if len(name) >= 1:
-                    speaker_counts[name] += 1
-                break
-
-    # Build initial character list from regex
-    detected: list[dict] = []
-    for name, count in speaker_counts.most_common():
-        detected.append({
+        elif seg.get("type") == "dialogue":
+            # Only dialogue without a known speaker needs a regex scan
+            pending.append(seg.get("text", ""))
+
+    if pending:
+        pattern = SPEAKER_PATTERNS_FUSED.get(source_language, SPEAKER_PATTERNS_FUSED["en"])
+        # Scan all pending dialogue in one pass.  No speaker pattern can
+        # match NUL, so matches never straddle two segments; segment starts
+        # map each match back to its owner and only the first one counts.
+        starts = list(accumulate((len(text) + 1 for text in pending), initial=0))
+        last_owner = -1
+        for match in pattern.finditer("\0".join(pending)):
+            owner = bisect_right(starts, match.start()) - 1
+            if owner == last_owner:
+                continue
+            last_owner = owner
+            name = match.group(match.lastgroup).strip()
+            if name:
+                speaker_counts[name] += 1
+
+    # Build initial character list from regex, most frequent speakers first
+    detected: list[dict] = [
+        {
             "name": name,
             "aliases": [],
             "role": "supporting",
@@ -59,15 +70,14 @@ async def character_extractor_node(state: TranslationState) -> dict:
             "personality_hints": None,
             "speech_style_hints": None,
             "source": "regex",
-        })
+        }
+        for name, count in sorted(speaker_counts.items(), key=itemgetter(1), reverse=True)
+    ]
 
     # ── 2. LLM-based extraction for deeper analysis ──────────────────
     api_keys = state.get("api_keys", {})
     if api_keys and segments:
         try:
-            from fiction_translator.llm.prompts.character_extraction import (
-                build_character_extraction_prompt,
-            )
             from fiction_translator.llm.providers import get_llm_provider
 
             provider = get_llm_provider(
@@ -75,13 +85,13 @@ async def character_extractor_node(state: TranslationState) -> dict:
                 api_keys=api_keys,
             )
 
-            # Concatenate segment texts (cap at ~8000 chars for token efficiency)
-            all_text = "\n".join(s.get("text", "") for s in segments)
-            if len(all_text) > 8000:
-                all_text = all_text[:8000]
+            # Concatenate segment texts (capped for token efficiency)
+            all_text = _capped_text(segments, _LLM_TEXT_LIMIT)
 
-            prompt = build_character_extraction_prompt(
-                all_text, source_language, existing_personas,
+            prompt = _build_prompt_cached(
+                all_text,
+                source_language,
+                tuple(p.get("name", "?") for p in existing_personas),
             )
             result = await provider.generate_json(
                 prompt=prompt, temperature=0.2, max_tokens=2048,
@@ -103,6 +113,44 @@ async def character_extractor_node(state: TranslationState) -> dict:
     return {"detected_characters": detected}
 
 
+@lru_cache(maxsize=32)
+def _build_prompt_cached(
+    text: str,
+    source_language: str,
+    persona_names: tuple[str, ...],
+) -> str:
+    """Build the extraction prompt, memoized across re-segmentation retries.
+
+    The prompt only uses persona names, so those form the cache key.
+    """
+    from fiction_translator.llm.prompts.character_extraction import (
+        build_character_extraction_prompt,
+    )
+
+    personas = [{"name": name} for name in persona_names]
+    return build_character_extraction_prompt(text, source_language, personas)
+
+
+def _capped_text(segments: list[dict], limit: int) -> str:
+    """Join segment texts with newlines, truncated to *limit* characters.
+
+    Equivalent to ``"\\n".join(...)[:limit]`` but stops copying once the
+    limit is reached instead of building the whole chapter first.
+    """
+    parts: list[str] = []
+    total = 0
+    for seg in segments:
+        text = seg.get("text", "")
+        if parts:
+            total += 1  # newline separator
+        if total + len(text) >= limit:
+            parts.append(text[:limit - total])
+            break
+        parts.append(text)
+        total += len(text)
+    return "\n".join(parts)
+
+
 def _merge_characters(
     regex_chars: list[dict],
     llm_chars: list[dict],
@@ -161,15 +209,18 @@ def _merge_with_existing(
             persona_lookup[alias.lower()] = p
 
     for ch in detected:
-        name_lower = ch["name"].lower()
-        matched_persona = persona_lookup.get(name_lower)
+        matched_persona = persona_lookup.get(ch["name"].lower())
 
         # Also check aliases from detected character
-        if not matched_persona:
-            for alias in (ch.get("aliases") or []):
-                matched_persona = persona_lookup.get(alias.lower())
-                if matched_persona:
-                    break
+        if matched_persona is None and ch.get("aliases"):
+            matched_persona = next(
+                (
+                    persona
+                    for alias in ch["aliases"]
+                    if (persona := persona_lookup.get(alias.lower())) is not None
+                ),
+                None,
+            )
 
         if matched_persona:
             ch["persona_id"] = matched_persona.get("id")
@@ -0,0 +1,184 @@
+"""Combined analysis node -- review, persona and relationship learning in one call.
+
+Alternative to running ``review`` followed by the two learners: each chunk
+of source/translation pairs is sent once with a fused prompt, and the
+response is split into review verdicts, persona suggestions and
+relationship suggestions using the same normalisation as the separate
+nodes.  Enabled with ``run_translation_pipeline(..., fused_analysis=True)``.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable, Hashable
+
+from fiction_translator.pipeline.callbacks import notify
+from fiction_translator.pipeline.nodes._common import (
+    DEFAULT_REVIEW_CONCURRENCY,
+    DEFAULT_REVIEW_TOKEN_BUDGET,
+    build_review_pairs,
+    collect_flagged,
+    normalise_persona_updates,
+    normalise_relationship_updates,
+    pack_by_tokens,
+    persona_name_index,
+    segments_to_review,
+)
+from fiction_translator.pipeline.state import TranslationState
+
+logger = logging.getLogger(__name__)
+
+
+def _keep_most_confident(items: list[dict], key: Callable[[dict], Hashable]) -> list[dict]:
+    """Deduplicate *items* by *key*, keeping the highest-confidence entry.
+
+    Different chunks can report the same observation; first-seen order is
+    preserved.
+    """
+    best: dict[Hashable, dict] = {}
+    for item in items:
+        k = key(item)
+        current = best.get(k)
+        if current is None or item["confidence"] > current["confidence"]:
+            best[k] = item
+    return list(best.values())
+
+
+async def combined_analysis_node(state: TranslationState) -> dict:
+    """Review translations and learn personas/relationships in one LLM pass.
+
+    Returns review_passed, review_feedback, review_iteration,
+    flagged_segments, persona_suggestions and relationship_suggestions.
+    """
+    from fiction_translator.pipeline.callbacks import check_cancelled
+
+    await check_cancelled(state)
+
+    review_iteration = state.get("review_iteration", 0) + 1
+    # Same rule as the reviewer: later iterations only re-check flagged segments
+    translated_segments = segments_to_review(state, review_iteration)
+    detected_characters = state.get("detected_characters", [])
+    existing_personas = state.get("existing_personas", [])
+    callback = state.get("progress_callback")
+    # Suggestions from earlier iterations are kept and merged with new ones
+    previous_personas = state.get("persona_suggestions", [])
+    previous_relationships = state.get("relationship_suggestions", [])
+
+    await notify(
+        callback, "review", 0.0,
+        f"Reviewing translations and characters (iteration {review_iteration})...",
+    )
+
+    passthrough = {
+        "review_passed": True,
+        "review_feedback": [],
+        "review_iteration": review_iteration,
+        "flagged_segments": [],
+        "persona_suggestions": previous_personas,
+        "relationship_suggestions": previous_relationships,
+    }
+
+    if not translated_segments:
+        return passthrough
+
+    api_keys = state.get("api_keys", {})
+    if not api_keys:
+        logger.warning("No API keys for analysis, auto-passing")
+        return passthrough
+
+    try:
+        from fiction_translator.llm.cache import cached_generate_json
+        from fiction_translator.llm.prompts.combined_analysis import (
+            build_combined_analysis_prompt,
+        )
+        from fiction_translator.llm.providers import get_llm_provider
+
+        provider = get_llm_provider(
+            state.get("llm_provider", "gemini"),
+            api_keys=api_keys,
+        )
+
+        chunks = pack_by_tokens(
+            build_review_pairs(translated_segments),
+            budget=state.get("review_token_budget") or DEFAULT_REVIEW_TOKEN_BUDGET,
+        )
+        sem = asyncio.Semaphore(
+            state.get("review_concurrency") or DEFAULT_REVIEW_CONCURRENCY
+        )
+        completed = 0
+
+        async def _analyse_chunk(chunk: list[dict]) -> dict:
+            nonlocal completed
+            async with sem:
+                await check_cancelled(state)
+                prompt = build_combined_analysis_prompt(
+                    pairs=chunk,
+                    source_language=state.get("source_language", "ko"),
+                    target_language=state.get("target_language", "en"),
+                    detected_characters=detected_characters,
+                    existing_personas=existing_personas,
+                    existing_relationships=state.get("existing_relationships", []),
+                    glossary=state.get("glossary"),
+                    personas_context=state.get("personas_context", ""),
+                )
+                result = await cached_generate_json(
+                    provider,
+                    prompt=prompt,
+                    temperature=0.2,
+                    max_tokens=8192,
+                    enabled=state.get("use_llm_cache", False),
+                )
+            completed += 1
+            await notify(
+                callback, "review", completed / len(chunks),
+                f"Analysed {completed}/{len(chunks)} chunks...",
+            )
+            return result
+
+        results = await asyncio.gather(*(_analyse_chunk(chunk) for chunk in chunks))
+
+        overall_passed = all(r.get("overall_passed", True) for r in results)
+        flagged, feedback = collect_flagged(
+            [review for r in results for review in r.get("segment_reviews", [])]
+        )
+        review_passed = overall_passed or len(flagged) == 0
+
+        persona_suggestions = previous_personas
+        relationship_suggestions = previous_relationships
+        if detected_characters:
+            name_index = persona_name_index(state)
+            persona_suggestions = _keep_most_confident(
+                previous_personas + normalise_persona_updates(
+                    [u for r in results for u in r.get("persona_updates", [])],
+                    name_index,
+                ),
+                key=lambda s: (s["name"].lower(), s["field"]),
+            )
+            relationship_suggestions = _keep_most_confident(
+                previous_relationships + normalise_relationship_updates(
+                    [u for r in results for u in r.get("relationship_updates", [])],
+                    name_index,
+                ),
+                key=lambda s: frozenset((s["character_1"].lower(), s["character_2"].lower())),
+            )
+
+        await notify(
+            callback, "review", 1.0,
+            f"Review {'passed' if review_passed else 'flagged ' + str(len(flagged)) + ' segments'}; "
+            f"{len(persona_suggestions)} persona and "
+            f"{len(relationship_suggestions)} relationship suggestions",
+        )
+
+        return {
+            "review_passed": review_passed,
+            "review_feedback": feedback,
+            "review_iteration": review_iteration,
+            "flagged_segments": flagged,
+            "persona_suggestions": persona_suggestions,
+            "relationship_suggestions": relationship_suggestions,
+        }
+
+    except Exception as e:
+        logger.error("Combined analysis failed: %s", e)
+        # On failure, pass through to avoid blocking the pipeline
+        return passthrough
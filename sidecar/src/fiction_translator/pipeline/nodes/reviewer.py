@@ -6,17 +6,73 @@ the review loop (up to 2 iterations).
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from fiction_translator.pipeline.callbacks import notify
+from fiction_translator.pipeline.nodes._common import (
+    DEFAULT_REVIEW_CONCURRENCY,
+    DEFAULT_REVIEW_TOKEN_BUDGET,
+    build_review_pairs,
+    collect_flagged,
+    pack_by_tokens,
+    segments_to_review,
+)
 from fiction_translator.pipeline.state import TranslationState
 
 logger = logging.getLogger(__name__)
 
+def _dedupe_pairs(pairs: list[dict]) -> tuple[list[dict], dict[int, list[int]]]:
+    """Drop repeated pairs so each unique line is reviewed once.
+
+    Pairs are identical when source, translation and speaker all match;
+    the first occurrence is kept as the representative.  Pairs with an
+    empty side are always kept.  Returns the unique pairs and a map from
+    representative segment id to the ids of its dropped duplicates.
+    """
+    unique: list[dict] = []
+    first_by_key: dict[tuple, int] = {}
+    duplicates: dict[int, list[int]] = {}
+    for pair in pairs:
+        if not pair["source_text"] or not pair["translated_text"]:
+            unique.append(pair)
+            continue
+        key = (pair["source_text"], pair["translated_text"], pair["speaker"])
+        rep = first_by_key.get(key)
+        if rep is None:
+            first_by_key[key] = pair["segment_id"]
+            unique.append(pair)
+        else:
+            duplicates.setdefault(rep, []).append(pair["segment_id"])
+    return unique, duplicates
+
+
+def _fan_out_flags(
+    flagged: list[int],
+    feedback: list[dict],
+    duplicates: dict[int, list[int]],
+) -> tuple[list[int], list[dict]]:
+    """Copy each representative's flag and feedback to its duplicates."""
+    if not duplicates:
+        return flagged, feedback
+    all_flagged: list[int] = []
+    for sid in flagged:
+        all_flagged.append(sid)
+        all_flagged.extend(duplicates.get(sid, ()))
+    all_feedback: list[dict] = []
+    for fb in feedback:
+        all_feedback.append(fb)
+        all_feedback.extend(
+            {**fb, "segment_id": dup} for dup in duplicates.get(fb["segment_id"], ())
+        )
+    return all_flagged, all_feedback
+
 
 async def reviewer_node(state: TranslationState) -> dict:
     """Review translations for quality.  Flags segments for re-translation.
 
+    On later iterations only the previously flagged segments are reviewed.
+
     Returns review_passed, review_feedback, review_iteration, and
     flagged_segments.
     """
@@ -24,8 +80,8 @@ async def reviewer_node(state: TranslationState) -> dict:
 
     await check_cancelled(state)
 
-    translated_segments = state.get("translated_segments", [])
     review_iteration = state.get("review_iteration", 0) + 1
+    translated_segments = segments_to_review(state, review_iteration)
     callback = state.get("progress_callback")
 
     await notify(
@@ -52,99 +108,70 @@ async def reviewer_node(state: TranslationState) -> dict:
             "flagged_segments": [],
         }
 
-    try:
-        from fiction_translator.llm.prompts.review import build_review_prompt
-        from fiction_translator.llm.providers import get_llm_provider
-
-        provider = get_llm_provider(
-            state.get("llm_provider", "gemini"),
-            api_keys=api_keys,
-        )
-
-        # Build review pairs
-        pairs = []
-        for seg in translated_segments:
-            pairs.append({
-                "segment_id": seg.get("segment_id", seg.get("order", 0)),
-                "source_text": seg.get("source_text", ""),
-                "translated_text": seg.get("translated_text", ""),
-                "type": seg.get("type", "narrative"),
-                "speaker": seg.get("speaker"),
-            })
-
-        # Warn if any pairs have empty translations before sending to LLM
-        empty = [p["segment_id"] for p in pairs if not p.get("translated_text")]
-        if empty:
-            logger.warning(
-                "Review: %d segments have empty translated_text: %s",
-                len(empty), empty,
-            )
-
-        # Review in chunks to avoid token limits (max ~30 pairs per call)
-        all_reviews: list[dict] = []
-        chunk_size = 30
-        overall_passed = True
+    from fiction_translator.llm.cache import cached_generate_json
+    from fiction_translator.llm.prompts.review import (
+        build_review_prompt_prefix,
+        complete_review_prompt,
+    )
+    from fiction_translator.llm.providers import get_llm_provider
+
+    # Repeated lines (e.g. short replies) are reviewed once and their
+    # verdicts copied to every occurrence afterwards.
+    pairs, duplicates = _dedupe_pairs(build_review_pairs(translated_segments))
+
+    # Review in chunks packed to a token budget, so short segments
+    # share a call and long ones stay under the limits.
+    # Chunks are independent, so send them concurrently (bounded).
+    chunks = pack_by_tokens(
+        pairs,
+        budget=state.get("review_token_budget") or DEFAULT_REVIEW_TOKEN_BUDGET,
+    )
+    sem = asyncio.Semaphore(
+        state.get("review_concurrency") or DEFAULT_REVIEW_CONCURRENCY
+    )
+    completed = 0
+
+    # Everything before the pairs is the same for every chunk
+    prompt_prefix = build_review_prompt_prefix(
+        source_language=state.get("source_language", "ko"),
+        target_language=state.get("target_language", "en"),
+        glossary=state.get("glossary"),
+        personas_context=state.get("personas_context", ""),
+    )
 
-        for i in range(0, len(pairs), chunk_size):
+    async def _review_chunk(chunk: list[dict]) -> tuple[bool, list[int], list[dict]]:
+        """Review one chunk; return (passed, flagged ids, feedback)."""
+        nonlocal completed
+        async with sem:
             await check_cancelled(state)
-
-            chunk = pairs[i:i + chunk_size]
-            pct = i / max(len(pairs), 1)
-            await notify(
-                callback, "review", pct,
-                f"Reviewing segments {i+1}-{min(i+chunk_size, len(pairs))}...",
-            )
-
-            prompt = build_review_prompt(
-                pairs=chunk,
-                source_language=state.get("source_language", "ko"),
-                target_language=state.get("target_language", "en"),
-                glossary=state.get("glossary"),
-                personas_context=state.get("personas_context", ""),
-            )
-
-            result = await provider.generate_json(
-                prompt=prompt,
+            result = await cached_generate_json(
+                provider,
+                prompt=complete_review_prompt(prompt_prefix, chunk),
                 temperature=0.2,
                 max_tokens=4096,
+                enabled=state.get("use_llm_cache", False),
             )
-
-            chunk_passed = result.get("overall_passed", True)
-            if not chunk_passed:
-                overall_passed = False
-
-            segment_reviews = result.get("segment_reviews", [])
-            all_reviews.extend(segment_reviews)
-
-        # Collect flagged segment IDs
-        flagged: list[int] = []
-        feedback: list[dict] = []
-
-        for review in all_reviews:
-            if review.get("verdict") == "flag":
-                sid = review.get("segment_id")
-                if sid is not None:
-                    flagged.append(sid)
-                    feedback.append({
-                        "segment_id": sid,
-                        "issue": review.get("issue", ""),
-                        "suggestion": review.get("suggestion", ""),
-                    })
-
-        review_passed = overall_passed or len(flagged) == 0
-
+        # Reduce the raw response to its flags right away so only the
+        # small filtered lists outlive the chunk
+        chunk_flagged, chunk_feedback = collect_flagged(
+            result.get("segment_reviews", []),
+        )
+        chunk_passed = result.get("overall_passed", True)
+        completed += 1
         await notify(
-            callback, "review", 1.0,
-            f"Review {'passed' if review_passed else 'flagged ' + str(len(flagged)) + ' segments'}",
+            callback, "review", completed / len(chunks),
+            f"Reviewed {completed}/{len(chunks)} chunks...",
         )
+        return chunk_passed, chunk_flagged, chunk_feedback
 
-        return {
-            "review_passed": review_passed,
-            "review_feedback": feedback,
-            "review_iteration": review_iteration,
-            "flagged_segments": flagged,
-        }
-
+    # Guard only the LLM calls and response parsing
+    try:
+        provider = get_llm_provider(
+            state.get("llm_provider", "gemini"),
+            api_keys=api_keys,
+        )
+        # gather preserves chunk order, so flags stay in segment order
+        results = await asyncio.gather(*(_review_chunk(chunk) for chunk in chunks))
     except Exception as e:
         logger.error("Review failed: %s", e)
         # On failure, pass through to avoid blocking the pipeline
@@ -154,3 +181,22 @@ async def reviewer_node(state: TranslationState) -> dict:
             "review_iteration": review_iteration,
             "flagged_segments": [],
         }
+
+    overall_passed = all(passed for passed, _, _ in results)
+    flagged = [sid for _, chunk_flagged, _ in results for sid in chunk_flagged]
+    feedback = [fb for _, _, chunk_feedback in results for fb in chunk_feedback]
+    flagged, feedback = _fan_out_flags(flagged, feedback, duplicates)
+
+    review_passed = overall_passed or len(flagged) == 0
+
+    await notify(
+        callback, "review", 1.0,
+        f"Review {'passed' if review_passed else 'flagged ' + str(len(flagged)) + ' segments'}",
+    )
+
+    return {
+        "review_passed": review_passed,
+        "review_feedback": feedback,
+        "review_iteration": review_iteration,
+        "flagged_segments": flagged,
+    }
@@ -8,13 +8,28 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Iterator
 
+from fiction_translator.llm.cache import cache_key, load_cached
 from fiction_translator.pipeline.callbacks import notify
-from fiction_translator.pipeline.constants import DIALOGUE_MARKERS, SPEAKER_PATTERNS
+from fiction_translator.pipeline.constants import (
+    SEGMENT_TYPE_PATTERNS,
+    SPEAKER_PATTERNS_FUSED,
+)
 from fiction_translator.pipeline.state import SegmentData, TranslationState
 
 logger = logging.getLogger(__name__)
 
+# Texts at least this long skip LLM refinement in "auto" mode
+_LLM_SEGMENTATION_MAX_CHARS = 10000
+
+# Part of the segmentation cache key: bump when the rules or the LLM
+# prompt change so stale stored segmentations miss
+SEGMENTER_CACHE_VERSION = 2
+
+# One or more blank lines (two+ newlines, whitespace between) end a paragraph
+_PARA_RE = re.compile(r"\n\s*\n")
+
 
 # ── Public node function ─────────────────────────────────────────────
 
@@ -26,25 +41,61 @@ async def segmenter_node(state: TranslationState) -> dict:
 
     await notify(callback, "segmentation", 0.0, "Segmenting text...")
 
-    # Primary: rule-based segmentation (always runs)
-    segments = _rule_based_segment(source_text, source_language)
-
-    # Optional: LLM refinement for short texts
+    # LLM refinement -- "auto" only for short texts, "off" skips the extra
+    # round-trip entirely, "on" forces it
     api_keys = state.get("api_keys", {})
-    if api_keys and len(source_text) < 10000:
+    mode = state.get("llm_segmentation", "auto")
+    use_llm = bool(api_keys) and (mode == "on" or (
+        mode == "auto" and len(source_text) < _LLM_SEGMENTATION_MAX_CHARS
+    ))
+
+    provider = None
+    if use_llm:
         try:
-            from fiction_translator.llm.prompts.segmentation import (
-                build_segmentation_prompt,
-            )
             from fiction_translator.llm.providers import get_llm_provider
 
             provider = get_llm_provider(
                 state.get("llm_provider", "gemini"),
                 api_keys=api_keys,
             )
+        except Exception as e:
+            logger.warning("LLM segmentation unavailable, using rule-based: %s", e)
+
+    # Re-running an unchanged chapter reuses its stored segmentation.  A
+    # re-segment after failed validation must not get the same result back,
+    # so retries skip the lookup; the validator stores a result once it passes.
+    use_cache = state.get("use_llm_cache", False)
+    key = cache_key(
+        provider.model if provider is not None else "rule-based", source_text,
+        segmenter_version=SEGMENTER_CACHE_VERSION,
+        source_language=source_language,
+    )
+    if use_cache and state.get("validation_attempts", 0) == 0:
+        cached = await load_cached(key)
+        if cached is not None:
+            segments = cached["segments"]
+            await notify(
+                callback, "segmentation", 1.0,
+                f"Segmented into {len(segments)} segments (cached)",
+            )
+            return {"segments": segments, "segmentation_cache_key": None}
+
+    # Primary: rule-based segmentation (always runs)
+    segments = _rule_based_segment(source_text, source_language)
+    cacheable = True
+
+    if provider is not None:
+        try:
+            from fiction_translator.llm.prompts.segmentation import (
+                build_segmentation_prompt,
+            )
+
             prompt = build_segmentation_prompt(source_text, source_language)
+            # Not routed through the response cache: the raw reply is only
+            # worth keeping once the segments built from it pass validation
             result = await provider.generate_json(
                 prompt=prompt, temperature=0.1, max_tokens=4096,
+                cache_key=f"segmentation:{source_language}",
             )
             llm_segments = result.get("segments", [])
             if llm_segments:
@@ -53,13 +104,18 @@ async def segmenter_node(state: TranslationState) -> dict:
                     segments = parsed
         except Exception as e:
             logger.warning("LLM segmentation failed, using rule-based: %s", e)
+            # Leave the fallback uncached so the next run retries the LLM
+            cacheable = False
 
     await notify(
         callback, "segmentation", 1.0,
         f"Segmented into {len(segments)} segments",
     )
 
-    return {"segments": segments}
+    return {
+        "segments": segments,
+        "segmentation_cache_key": key if use_cache and cacheable else None,
+    }
 
 
 # ── Rule-based segmentation ──────────────────────────────────────────
@@ -77,8 +133,8 @@ def _rule_based_segment(
         return []
 
     paragraphs = _split_paragraphs(source_text)
-    dialogue_patterns = DIALOGUE_MARKERS.get(source_language, DIALOGUE_MARKERS["en"])
-    speaker_patterns = SPEAKER_PATTERNS.get(source_language, SPEAKER_PATTERNS["en"])
+    type_pattern = SEGMENT_TYPE_PATTERNS.get(source_language, SEGMENT_TYPE_PATTERNS["en"])
+    speaker_pattern = SPEAKER_PATTERNS_FUSED.get(source_language, SPEAKER_PATTERNS_FUSED["en"])
 
     segments: list[SegmentData] = []
     order = 0
@@ -88,8 +144,8 @@ def _rule_based_segment(
         if not stripped:
             continue
 
-        seg_type = _classify_segment(stripped, dialogue_patterns)
-        speaker = _detect_speaker(stripped, speaker_patterns) if seg_type == "dialogue" else None
+        seg_type = _classify_segment(stripped, type_pattern)
+        speaker = _detect_speaker(stripped, speaker_pattern) if seg_type == "dialogue" else None
 
         segments.append(SegmentData(
             id=None,
@@ -113,60 +169,49 @@ def _split_paragraphs(text: str) -> list[tuple[str, int, bool]]:
     Single-newline boundaries inside a paragraph are preserved.
     """
     results: list[tuple[str, int, bool]] = []
-    # Split on one or more blank lines (two+ consecutive newlines)
-    parts = re.split(r'(\n\s*\n)', text)
-
-    offset = 0
-    found_first = False
-    last_was_separator = False
-    for part in parts:
-        stripped = part.strip()
-        if stripped:
-            # Find the actual start within the part (skip leading whitespace)
-            leading = len(part) - len(part.lstrip())
-            has_break = last_was_separator and found_first
-            results.append((stripped, offset + leading, has_break))
-            found_first = True
-            last_was_separator = False
-        else:
-            # This is a separator (blank line gap)
-            last_was_separator = True
-        offset += len(part)
-
+    for start, end in _paragraph_spans(text):
+        part = text[start:end]
+        lstripped = part.lstrip()
+        if not lstripped:
+            continue
+        # Offset of the first non-whitespace character; every paragraph
+        # after the first one follows a blank-line separator
+        results.append((
+            lstripped.rstrip(),
+            start + len(part) - len(lstripped),
+            bool(results),
+        ))
     return results
 
 
+def _paragraph_spans(text: str) -> Iterator[tuple[int, int]]:
+    """Yield (start, end) spans of the text between blank-line separators."""
+    start = 0
+    for match in _PARA_RE.finditer(text):
+        yield start, match.start()
+        start = match.end()
+    yield start, len(text)
+
+
 def _classify_segment(
     text: str,
-    dialogue_patterns: list[re.Pattern],
+    type_pattern: re.Pattern,
 ) -> str:
     """Classify a segment as narrative, dialogue, action, or thought."""
-    for pattern in dialogue_patterns:
-        if pattern.search(text):
-            return "dialogue"
-
-    # Heuristic for thought (internal monologue markers)
-    thought_markers = [
-        re.compile(r"^\u2018.*\u2019$"),           # 'thought'
-        re.compile(r"^\(.*\)$"),                    # (thought)
-        re.compile(r"^[\u3008\u3010].*[\u3009\u3011]$"),  # CJK brackets
-    ]
-    for pattern in thought_markers:
-        if pattern.search(text):
-            return "thought"
-
+    match = type_pattern.match(text)
+    if match:
+        return match.lastgroup
     return "narrative"
 
 
 def _detect_speaker(
     text: str,
-    speaker_patterns: list[re.Pattern],
+    speaker_pattern: re.Pattern,
 ) -> str | None:
     """Try to extract a speaker name from dialogue text."""
-    for pattern in speaker_patterns:
-        match = pattern.search(text)
-        if match:
-            return match.group(1).strip()
+    match = speaker_pattern.search(text)
+    if match:
+        return match.group(match.lastgroup).strip()
     return None
 
 
@@ -190,15 +235,7 @@ def _parse_llm_segments(
         if not seg_text:
             continue
 
-        # Find this segment's text in the source
-        idx = source_text.find(seg_text, search_start)
-        if idx == -1:
-            # Fuzzy fallback: try first 50 chars
-            short = seg_text[:50]
-            idx = source_text.find(short, search_start)
-            if idx == -1:
-                # Cannot locate -- use approximate offset
-                idx = search_start
+        idx = _locate_segment(source_text, seg_text, search_start)
 
         start_offset = idx
         end_offset = idx + len(seg_text)
@@ -221,3 +258,23 @@ def _parse_llm_segments(
         order += 1
 
     return results
+
+
+def _locate_segment(source_text: str, seg_text: str, search_start: int) -> int:
+    """Return where *seg_text* starts in *source_text* at or after *search_start*.
+
+    Prefers an exact match, falls back to a match on the first 50 chars,
+    and finally to *search_start* itself.  The prefix is searched first:
+    a miss there means the full text is absent too, so an unlocatable
+    segment costs one scan of the remaining source instead of two.
+    """
+    idx = source_text.find(seg_text[:50], search_start)
+    if idx == -1:
+        # Cannot locate -- use approximate offset
+        return search_start
+    if not source_text.startswith(seg_text, idx):
+        # Prefix matched here but the full text may still occur later
+        full = source_text.find(seg_text, idx + 1)
+        if full != -1:
+            return full
+    return idx
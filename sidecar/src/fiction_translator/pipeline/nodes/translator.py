@@ -6,15 +6,20 @@ loops, only the flagged segments are re-translated.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
+import statistics
+import time
 
 from fiction_translator.llm.prompts.text_utils import (
     apply_glossary_exchange,
+    build_glossary_matcher,
     build_glossary_pattern,
     filter_glossary_for_batch,
     normalize_quotes,
 )
 from fiction_translator.pipeline.callbacks import notify
+from fiction_translator.pipeline.nodes._common import join_translated_text
 from fiction_translator.pipeline.state import (
     BatchData,
     SegmentData,
@@ -27,6 +32,19 @@ logger = logging.getLogger(__name__)
 # ── Batch grouping constants ─────────────────────────────────────────
 MAX_BATCH_CHARS = 20000
 MAX_BATCH_SEGMENTS = 10
+# Floor for the adaptive character cap
+MIN_BATCH_CHARS = 5000
+# An unfinished dialogue exchange may run this fraction past the character
+# cap rather than be split across batches
+DIALOGUE_OVERFLOW_RATIO = 0.1
+
+# Per-batch latency the adaptive cap aims for (overridable via state["batch_target_seconds"])
+_DEFAULT_BATCH_TARGET_SECONDS = 60.0
+# Recent chars/sec samples kept in the run state
+_THROUGHPUT_WINDOW = 20
+
+# Max translation batches in flight at once (overridable via state["translation_concurrency"])
+_DEFAULT_TRANSLATION_CONCURRENCY = 8
 
 
 async def translator_node(state: TranslationState) -> dict:
@@ -52,27 +70,26 @@ async def translator_node(state: TranslationState) -> dict:
     if not api_keys:
         raise ValueError("No API keys provided for translation")
 
+    from fiction_translator.llm.cache import cached_generate_json_with_hit
     from fiction_translator.llm.prompts.cot_translation import (
         build_cot_translation_prompt,
         build_simple_translation_prompt,
     )
     from fiction_translator.llm.providers import get_llm_provider
 
-    provider = get_llm_provider(
-        state.get("llm_provider", "gemini"),
-        api_keys=api_keys,
-    )
+    provider = get_llm_provider(state.get("llm_provider", "gemini"), api_keys=api_keys)
 
     # Decide which segments to translate
     if flagged_ids and previous_translations:
         # Re-translation loop: only translate flagged segments
+        flagged_set = set(flagged_ids)
         segments_to_translate = [
-            s for s in segments if s.get("order") in flagged_ids
+            s for s in segments if s.get("order") in flagged_set
         ]
         # Build per-segment feedback map
         feedback_by_id = {
             fb["segment_id"]: fb for fb in review_feedback
-            if fb.get("segment_id") in flagged_ids
+            if fb.get("segment_id") in flagged_set
         }
     else:
         segments_to_translate = segments
@@ -90,10 +107,30 @@ async def translator_node(state: TranslationState) -> dict:
     )
 
     # ── Group segments into batches ──────────────────────────────────
-    batches_input = _group_segments_into_batches(segments_to_translate)
+    # Sized from this run's own samples only, so the first pass of every
+    # run batches (and prompts) identically and re-runs can hit the cache
+    throughput = list(state.get("batch_throughput", []))
+    max_chars = _adaptive_max_chars(
+        throughput,
+        state.get("batch_target_seconds") or _DEFAULT_BATCH_TARGET_SECONDS,
+    )
+    batches_input = _group_segments_into_batches(
+        segments_to_translate, max_chars=max_chars,
+    )
+
+    # Review feedback for each batch, in segment order (None when empty)
+    batch_feedbacks: list[list[dict] | None] = [
+        [
+            feedback_by_id[seg.get("order", 0)]
+            for seg in batch_segments
+            if seg.get("order", 0) in feedback_by_id
+        ] or None
+        for batch_segments in batches_input
+    ] if feedback_by_id else [None] * len(batches_input)
 
     glossary = state.get("glossary", {})
     glossary_pattern = build_glossary_pattern(glossary)
+    glossary_matcher = build_glossary_matcher(glossary)
     personas_context = state.get("personas_context", "")
     relationships_context = state.get("relationships_context", "")
     # Combine personas and relationships context for the translator
@@ -102,28 +139,31 @@ async def translator_node(state: TranslationState) -> dict:
     style_context = state.get("style_context", "")
     source_language = state.get("source_language", "ko")
     target_language = state.get("target_language", "en")
+    # Batches share the prompt head (personas, style, instructions)
+    prompt_cache_key = f"translation:{state.get('project_id')}:{target_language}"
 
-    all_batches: list[BatchData] = []
-    new_translations: list[TranslatedSegment] = []
-    # Preserve unknown terms from previous iterations (review loop)
-    all_unknown_terms: list[dict] = list(state.get("unknown_terms", []))
-    total_tokens = state.get("total_tokens", 0)
-    total_cost = state.get("total_cost", 0.0)
+    sem = asyncio.Semaphore(
+        state.get("translation_concurrency") or _DEFAULT_TRANSLATION_CONCURRENCY
+    )
+    completed = 0
 
-    for batch_idx, batch_segments in enumerate(batches_input):
-        await check_cancelled(state)
+    async def _translate_batch(
+        batch_idx: int,
+        batch_segments: list[SegmentData],
+    ) -> tuple[list[TranslatedSegment], BatchData | None, list[dict]]:
+        """Translate one batch; return (translations, batch data, unknown terms).
 
-        pct = batch_idx / max(len(batches_input), 1)
-        await notify(
-            callback, "translation", pct,
-            f"Translating batch {batch_idx + 1}/{len(batches_input)}...",
-        )
+        A failed batch yields placeholder translations and no batch data.
+        """
+        nonlocal completed
 
         # Build prompt segments with their IDs
         prompt_segments = []
         batch_source_texts = []
+        batch_seg_ids = []
         for seg in batch_segments:
             seg_order = seg.get("order", 0)
+            batch_seg_ids.append(seg_order)
             raw_text = normalize_quotes(seg.get("text", ""))
             batch_source_texts.append(raw_text)
             exchanged_text = apply_glossary_exchange(
@@ -136,51 +176,57 @@ async def translator_node(state: TranslationState) -> dict:
                 "speaker": seg.get("speaker"),
             })
 
-        batch_glossary = filter_glossary_for_batch(glossary, batch_source_texts)
-
-        # Collect any feedback for segments in this batch
-        batch_feedback = None
-        if feedback_by_id:
-            batch_feedback = [
-                feedback_by_id[seg["id"]]
-                for seg in prompt_segments
-                if seg["id"] in feedback_by_id
-            ]
-            if not batch_feedback:
-                batch_feedback = None
+        batch_glossary = filter_glossary_for_batch(
+            glossary, batch_source_texts, glossary_matcher,
+        )
+        batch_feedback = batch_feedbacks[batch_idx]
+
+        build_prompt = build_cot_translation_prompt if use_cot else build_simple_translation_prompt
+        prompt = build_prompt(
+            segments=prompt_segments,
+            source_language=source_language,
+            target_language=target_language,
+            glossary=batch_glossary,
+            personas_context=personas_context,
+            style_context=style_context,
+            review_feedback=batch_feedback,
+        )
 
-        if use_cot:
-            prompt = build_cot_translation_prompt(
-                segments=prompt_segments,
-                source_language=source_language,
-                target_language=target_language,
-                glossary=batch_glossary,
-                personas_context=personas_context,
-                style_context=style_context,
-                review_feedback=batch_feedback,
-            )
-        else:
-            prompt = build_simple_translation_prompt(
-                segments=prompt_segments,
-                source_language=source_language,
-                target_language=target_language,
-                glossary=batch_glossary,
-                personas_context=personas_context,
-                style_context=style_context,
-                review_feedback=batch_feedback,
-            )
+        async with sem:
+            await check_cancelled(state)
+            started = time.monotonic()
+            cache_hit = False
+            try:
+                # Unchanged batches of a re-run chapter are served from cache
+                result, cache_hit = await cached_generate_json_with_hit(
+                    provider,
+                    prompt=prompt,
+                    temperature=0.3,
+                    max_tokens=8192,
+                    cache_key=prompt_cache_key,
+                    enabled=state.get("use_llm_cache", False),
+                    cache_if=lambda r: _translations_complete(r, batch_seg_ids),
+                )
+            except Exception as e:
+                logger.error("Batch %d translation failed: %s", batch_idx, e)
+                result = None
+            if result is not None and not cache_hit:
+                _record_batch_throughput(
+                    throughput,
+                    sum(len(text) for text in batch_source_texts),
+                    time.monotonic() - started,
+                )
+
+        completed += 1
+        await notify(
+            callback, "translation", completed / len(batches_input),
+            f"Translated batch {completed}/{len(batches_input)}...",
+        )
 
-        try:
-            result = await provider.generate_json(
-                prompt=prompt,
-                temperature=0.3,
-                max_tokens=8192,
-            )
-        except Exception as e:
-            logger.error("Batch %d translation failed: %s", batch_idx, e)
-            # Store empty translations for failed batch
-            for seg in batch_segments:
-                new_translations.append(TranslatedSegment(
+        if result is None:
+            # Store placeholder translations for failed batch
+            failed = [
+                TranslatedSegment(
                     segment_id=seg.get("order", 0),
                     order=seg.get("order", 0),
                     source_text=seg.get("text", ""),
@@ -190,8 +236,10 @@ async def translator_node(state: TranslationState) -> dict:
                     translated_start_offset=0,
                     translated_end_offset=0,
                     batch_id=batch_idx,
-                ))
-            continue
+                )
+                for seg in batch_segments
+            ]
+            return failed, None, []
 
         # Parse response
         if use_cot:
@@ -206,34 +254,34 @@ async def translator_node(state: TranslationState) -> dict:
         translations_raw = result.get("translations", [])
 
         # Build a lookup of translations by segment_id
-        trans_lookup: dict[int, str] = {}
-        for t in translations_raw:
-            sid = t.get("segment_id")
-            text = t.get("text", "")
-            if sid is not None:
-                trans_lookup[sid] = text
+        trans_lookup: dict[int, str] = {
+            t["segment_id"]: t.get("text", "")
+            for t in translations_raw
+            if t.get("segment_id") is not None
+        }
 
         # Fallback: if lookup missed all segments, try positional matching
-        matched = sum(1 for seg in batch_segments if trans_lookup.get(seg.get("order", 0)))
-        if matched == 0 and translations_raw:
+        matched = any(trans_lookup.get(seg_id) for seg_id in batch_seg_ids)
+        if not matched and translations_raw:
             logger.warning(
                 "Batch %d: segment_id mismatch. Expected orders %s, got IDs %s. "
                 "Using positional fallback.",
                 batch_idx,
-                [s.get("order") for s in batch_segments],
+                batch_seg_ids,
                 [t.get("segment_id") for t in translations_raw],
             )
-            for seg, t in zip(batch_segments, translations_raw, strict=False):
-                trans_lookup[seg.get("order", 0)] = t.get("text", "")
+            for seg_id, t in zip(batch_seg_ids, translations_raw, strict=False):
+                trans_lookup[seg_id] = t.get("text", "")
 
         # Create TranslatedSegment entries
-        batch_seg_ids = []
-        for seg in batch_segments:
-            seg_order = seg.get("order", 0)
+        batch_translations: list[TranslatedSegment] = []
+        empty_count = 0
+        for seg, seg_order in zip(batch_segments, batch_seg_ids, strict=True):
             translated_text = trans_lookup.get(seg_order, "")
-            batch_seg_ids.append(seg_order)
+            if not translated_text:
+                empty_count += 1
 
-            new_translations.append(TranslatedSegment(
+            batch_translations.append(TranslatedSegment(
                 segment_id=seg_order,
                 order=seg_order,
                 source_text=seg.get("text", ""),
@@ -246,7 +294,6 @@ async def translator_node(state: TranslationState) -> dict:
             ))
 
         # Warn if any translations came back empty
-        empty_count = sum(1 for t in new_translations[-len(batch_segments):] if not t.get("translated_text"))
         if empty_count > 0:
             logger.warning(
                 "Batch %d: %d/%d segments have empty translations",
@@ -254,17 +301,16 @@ async def translator_node(state: TranslationState) -> dict:
             )
 
         # Collect unknown terms from this batch
-        for term in unknown_terms_raw:
-            if term.get("source_term") and term.get("translated_term"):
-                all_unknown_terms.append(term)
-
+        batch_terms = [
+            term for term in unknown_terms_raw
+            if term.get("source_term") and term.get("translated_term")
+        ]
         logger.debug(
-            "Batch %d: %d unknown terms extracted (total so far: %d)",
-            batch_idx, len(unknown_terms_raw), len(all_unknown_terms),
+            "Batch %d: %d unknown terms extracted",
+            batch_idx, len(unknown_terms_raw),
         )
 
-        # Store batch data
-        all_batches.append(BatchData(
+        batch_data = BatchData(
             batch_order=batch_idx,
             segment_ids=batch_seg_ids,
             situation_summary=situation_summary,
@@ -273,7 +319,27 @@ async def translator_node(state: TranslationState) -> dict:
                           for t in translations_raw],
             review_feedback=batch_feedback,
             review_iteration=review_iteration,
-        ))
+        )
+        return batch_translations, batch_data, batch_terms
+
+    # Batches are independent, so send them concurrently (bounded);
+    # gather preserves batch order for the merged results
+    results = await asyncio.gather(*(
+        _translate_batch(batch_idx, batch_segments)
+        for batch_idx, batch_segments in enumerate(batches_input)
+    ))
+
+    all_batches: list[BatchData] = []
+    new_translations: list[TranslatedSegment] = []
+    # Preserve unknown terms from previous iterations (review loop)
+    all_unknown_terms: list[dict] = list(state.get("unknown_terms", []))
+    for batch_translations, batch_data, batch_terms in results:
+        new_translations.extend(batch_translations)
+        if batch_data is not None:
+            all_batches.append(batch_data)
+        all_unknown_terms.extend(batch_terms)
+    total_tokens = state.get("total_tokens", 0)
+    total_cost = state.get("total_cost", 0.0)
 
     # ── Merge new translations with previous (for re-translation) ────
     if flagged_ids and previous_translations:
@@ -296,45 +362,140 @@ async def translator_node(state: TranslationState) -> dict:
     return {
         "batches": all_batches,
         "translated_segments": final_translations,
+        # Joined once here for the learners rather than once per learner
+        "translated_text_joined": join_translated_text(final_translations),
         "unknown_terms": all_unknown_terms,
         "total_tokens": total_tokens,
         "total_cost": total_cost,
+        "batch_throughput": throughput[-_THROUGHPUT_WINDOW:],
     }
 
 
+def _translations_complete(result: dict, segment_ids: list[int]) -> bool:
+    """True when *result* has a non-empty translation for every segment id.
+
+    Used to keep partial or empty batch responses out of the LLM cache.
+    """
+    texts = {
+        t.get("segment_id"): t.get("text")
+        for t in result.get("translations", [])
+    }
+    return all(texts.get(seg_id) for seg_id in segment_ids)
+
+
+# ── Adaptive batch size ──────────────────────────────────────────────
+
+def _adaptive_max_chars(samples: list[float], target_seconds: float) -> int:
+    """Character cap for a pass's batches, from the run's observed throughput.
+
+    Uses the median of the recent chars/sec *samples* so a batch takes
+    roughly *target_seconds*, clamped to ``MIN_BATCH_CHARS`` and
+    ``MAX_BATCH_CHARS``.  Without samples the static maximum is used.
+
+    Samples are kept per run, not per provider across runs, so the first
+    translation pass always uses ``MAX_BATCH_CHARS``.  This is deliberate:
+    it keeps batch boundaries, and therefore prompts and LLM cache keys,
+    stable between runs of an unchanged chapter.  Only review
+    re-translation passes adapt.
+    """
+    if not samples:
+        return MAX_BATCH_CHARS
+    target = int(statistics.median(samples[-_THROUGHPUT_WINDOW:]) * target_seconds)
+    return max(MIN_BATCH_CHARS, min(MAX_BATCH_CHARS, target))
+
+
+def _record_batch_throughput(samples: list[float], chars: int, seconds: float) -> None:
+    """Append one provider call's chars/sec to *samples*.
+
+    Only calls that reached the provider and succeeded are recorded;
+    cache hits and failures say nothing about the provider's speed.
+    """
+    if seconds > 0:
+        samples.append(chars / seconds)
+
+
 # ── Batch grouping ───────────────────────────────────────────────────
 
 def _group_segments_into_batches(
     segments: list[SegmentData],
+    balance: bool = True,
+    max_chars: int = MAX_BATCH_CHARS,
 ) -> list[list[SegmentData]]:
     """Group segments into batches respecting size and count limits.
 
     Tries to keep dialogue exchanges together: when consecutive segments
-    are dialogue, they stay in the same batch if possible.
+    are dialogue, they stay in the same batch past the segment limit, and
+    past the character cap by up to ``DIALOGUE_OVERFLOW_RATIO``.
+
+    Batches are translated concurrently, so the one with the most text
+    sets the pace.  With *balance*, the character cap is lowered as far
+    as possible without needing more batches than a plain greedy packing,
+    which evens out batch sizes at no extra LLM calls.  Batches stay
+    contiguous either way: the translator relies on neighbouring segments
+    for context.
 
     Parameters
     ----------
     segments : list[SegmentData]
         Ordered segments to group.
+    balance : bool
+        Even out character counts across batches.
+    max_chars : int
+        Character cap per batch.
 
     Returns
     -------
     list[list[SegmentData]]
         List of batches, each a list of segments.
     """
+    # Measured once; the balancing search below repacks several times
+    lengths = [len(seg.get("text", "")) for seg in segments]
+    batches = _pack_batches(segments, max_chars=max_chars, lengths=lengths)
+    if not balance or len(batches) < 2:
+        return batches
+
+    # Binary search the smallest cap that still packs into as many batches.
+    # A segment longer than max_chars must not raise the cap above it, or
+    # its neighbours would be merged into oversized batches
+    hi = min(max_chars, sum(lengths))
+    lo = min(max(lengths), hi)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if len(_pack_batches(segments, max_chars=mid, lengths=lengths)) <= len(batches):
+            hi = mid
+        else:
+            lo = mid + 1
+
+    balanced = _pack_batches(segments, max_chars=lo, lengths=lengths)
+    return balanced if len(balanced) <= len(batches) else batches
+
+
+def _pack_batches(
+    segments: list[SegmentData],
+    max_chars: int = MAX_BATCH_CHARS,
+    lengths: list[int] | None = None,
+) -> list[list[SegmentData]]:
+    """Greedily pack ordered segments into batches of at most *max_chars*.
+
+    A dialogue segment following dialogue may overflow the cap by up to
+    ``DIALOGUE_OVERFLOW_RATIO``.  *lengths* optionally gives each
+    segment's text length up front.
+    """
     if not segments:
         return []
+    if lengths is None:
+        lengths = [len(seg.get("text", "")) for seg in segments]
 
     batches: list[list[SegmentData]] = []
     current_batch: list[SegmentData] = []
     current_chars = 0
+    overflow_chars = max_chars + int(max_chars * DIALOGUE_OVERFLOW_RATIO)
 
-    for seg in segments:
-        seg_len = len(seg.get("text", ""))
+    for seg, seg_len in zip(segments, lengths, strict=True):
         is_dialogue = seg.get("type") == "dialogue"
 
         # Check if adding this segment would exceed limits
-        would_exceed_chars = (current_chars + seg_len) > MAX_BATCH_CHARS
+        would_exceed_chars = (current_chars + seg_len) > max_chars
         would_exceed_count = len(current_batch) >= MAX_BATCH_SEGMENTS
 
         if current_batch and (would_exceed_chars or would_exceed_count):
@@ -343,8 +504,12 @@ def _group_segments_into_batches(
                 current_batch
                 and current_batch[-1].get("type") == "dialogue"
             )
-            if is_dialogue and prev_is_dialogue and not would_exceed_chars:
-                # Keep dialogue together even if count exceeded
+            if (
+                is_dialogue and prev_is_dialogue
+                and current_chars + seg_len <= overflow_chars
+            ):
+                # Keep the dialogue exchange together: the segment limit
+                # may be exceeded, the character cap only within bounds
                 pass
             else:
                 batches.append(current_batch)
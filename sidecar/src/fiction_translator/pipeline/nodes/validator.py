@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import logging
 
+from fiction_translator.llm.cache import store_cached
 from fiction_translator.pipeline.callbacks import notify
 from fiction_translator.pipeline.state import TranslationState
 
@@ -16,6 +17,11 @@ logger = logging.getLogger(__name__)
 MAX_SEGMENT_LENGTH = 10000
 # Minimum coverage ratio (segment text vs source text)
 MIN_COVERAGE_RATIO = 0.80
+# Stop scanning once this many issues are found -- re-segmentation is
+# triggered either way
+MAX_VALIDATION_ERRORS = 50
+# Segment types the translator knows how to handle
+_VALID_TYPES = frozenset({"narrative", "dialogue", "action", "thought"})
 
 
 async def validator_node(state: TranslationState) -> dict:
@@ -42,30 +48,57 @@ async def validator_node(state: TranslationState) -> dict:
             "validation_attempts": attempts,
         }
 
-    # ── Check 2: No empty segments ───────────────────────────────────
-    for i, seg in enumerate(segments):
-        text = seg.get("text", "").strip()
-        if not text:
-            validation_errors.append(f"Segment {i} is empty")
+    # ── Check 5: Coverage -- segments should cover most of source ────
+    # Measured up front so it is reported even when the scan below stops early
+    coverage_errors: list[str] = []
+    source_chars = len(source_text.strip())
+    if source_chars > 0:
+        coverage = sum(len(seg.get("text", "")) for seg in segments) / source_chars
+        if coverage < MIN_COVERAGE_RATIO:
+            coverage_errors.append(
+                f"Low coverage: segments cover {coverage:.0%} of source text "
+                f"(minimum {MIN_COVERAGE_RATIO:.0%})"
+            )
 
-    # ── Check 3: No oversized segments ───────────────────────────────
+    # ── Checks 2-4, 6-7: per-segment checks in a single pass ─────────
+    # Issues are collected per check and concatenated in check order below
+    empty_errors: list[str] = []
+    length_errors: list[str] = []
+    offset_errors: list[str] = []
+    type_errors: list[str] = []
+    dialogue_count = 0
+    speaker_count = 0
+    prev_end = -1
+    truncated: list[str] = []
     for i, seg in enumerate(segments):
+        found = len(empty_errors) + len(length_errors) + len(offset_errors) + len(type_errors)
+        if found >= MAX_VALIDATION_ERRORS:
+            # Check 7 needs every segment counted, so it is skipped too
+            truncated.append(
+                f"Stopped after {found} issues; "
+                f"segments {i}-{len(segments) - 1} not checked"
+            )
+            break
+
         text = seg.get("text", "")
+
+        # Check 2: no empty segments
+        if not text.strip():
+            empty_errors.append(f"Segment {i} is empty")
+
+        # Check 3: no oversized segments
         if len(text) > MAX_SEGMENT_LENGTH:
-            validation_errors.append(
+            length_errors.append(
                 f"Segment {i} exceeds max length ({len(text)} > {MAX_SEGMENT_LENGTH})"
             )
 
-    # ── Check 4: Offsets are non-negative and ordered ────────────────
-    prev_end = -1
-    for i, seg in enumerate(segments):
+        # Check 4: offsets are non-negative and ordered
         start = seg.get("source_start_offset", 0)
         end = seg.get("source_end_offset", 0)
-
         if start < 0 or end < 0:
-            validation_errors.append(f"Segment {i} has negative offset")
+            offset_errors.append(f"Segment {i} has negative offset")
         if end < start:
-            validation_errors.append(
+            offset_errors.append(
                 f"Segment {i} end offset ({end}) < start offset ({start})"
             )
         if start < prev_end:
@@ -73,34 +106,22 @@ async def validator_node(state: TranslationState) -> dict:
             logger.warning("Segment %d overlaps with previous (start=%d, prev_end=%d)", i, start, prev_end)
         prev_end = end
 
-    # ── Check 5: Coverage -- segments should cover most of source ────
-    if source_text and segments:
-        total_seg_chars = sum(len(s.get("text", "")) for s in segments)
-        source_chars = len(source_text.strip())
-        if source_chars > 0:
-            coverage = total_seg_chars / source_chars
-            if coverage < MIN_COVERAGE_RATIO:
-                validation_errors.append(
-                    f"Low coverage: segments cover {coverage:.0%} of source text "
-                    f"(minimum {MIN_COVERAGE_RATIO:.0%})"
-                )
-
-    # ── Check 6: Segment types are valid ─────────────────────────────
-    valid_types = {"narrative", "dialogue", "action", "thought"}
-    for i, seg in enumerate(segments):
+        # Check 6: segment types are valid
         seg_type = seg.get("type", "")
-        if seg_type not in valid_types:
-            validation_errors.append(
-                f"Segment {i} has invalid type '{seg_type}'"
-            )
+        if seg_type not in _VALID_TYPES:
+            type_errors.append(f"Segment {i} has invalid type '{seg_type}'")
+        elif seg_type == "dialogue":
+            dialogue_count += 1
+            if seg.get("speaker"):
+                speaker_count += 1
+
+    validation_errors.extend(
+        empty_errors + length_errors + offset_errors + coverage_errors
+        + type_errors + truncated
+    )
 
     # ── Check 7: Dialogue segments should ideally have speakers ──────
-    dialogue_count = sum(1 for s in segments if s.get("type") == "dialogue")
-    speaker_count = sum(
-        1 for s in segments
-        if s.get("type") == "dialogue" and s.get("speaker")
-    )
-    if dialogue_count > 0 and speaker_count == 0:
+    if not truncated and dialogue_count > 0 and speaker_count == 0:
         # Warn but do not fail -- speaker detection is best-effort
         logger.warning(
             "No speakers detected in %d dialogue segments", dialogue_count
@@ -108,6 +129,11 @@ async def validator_node(state: TranslationState) -> dict:
 
     passed = len(validation_errors) == 0
 
+    # Only segmentations that passed are reused by later runs
+    cache_key = state.get("segmentation_cache_key")
+    if passed and cache_key:
+        await store_cached(cache_key, "segmenter", {"segments": segments})
+
     await notify(
         callback, "validation", 1.0,
         f"Validation {'passed' if passed else 'failed'} "
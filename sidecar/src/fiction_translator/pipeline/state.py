@@ -55,15 +55,20 @@ class TranslationState(TypedDict, total=False):
     llm_provider: str
     api_keys: dict[str, str]
     use_cot: bool
+    llm_segmentation: str           # "auto" (default) | "on" | "off"
+    use_llm_cache: bool             # reuse stored LLM responses / segmentations for identical input
+    fused_analysis: bool            # review + persona/relationship learning in one call
 
     # ── Context (loaded from DB) ─────────────────────────────────────
     glossary: dict[str, str]
     personas_context: str
     style_context: str
     existing_personas: list[dict]
+    persona_name_index: dict[str, int | None]   # lowercased name/alias -> persona id
 
     # ── Segmentation ─────────────────────────────────────────────────
     segments: list[SegmentData]
+    segmentation_cache_key: str | None   # stored by the validator once segments pass
 
     # ── Character extraction ─────────────────────────────────────────
     detected_characters: list[dict]
@@ -76,12 +81,21 @@ class TranslationState(TypedDict, total=False):
     # ── Translation ──────────────────────────────────────────────────
     batches: list[BatchData]
     translated_segments: list[TranslatedSegment]
+    translated_text_joined: str     # translations in segment order, newline-joined
+    translation_concurrency: int    # max translation LLM calls in flight
+    batch_target_seconds: float     # per-batch latency the adaptive batch cap aims for
+    # This run's chars/sec samples from provider calls. Kept per run (not per
+    # provider across runs) so the first pass batches identically every run
+    # and stays cacheable; only review re-translation passes adapt.
+    batch_throughput: list[float]
 
     # ── Review ───────────────────────────────────────────────────────
     review_passed: bool
     review_feedback: list[dict]
     review_iteration: int
     flagged_segments: list[int]     # segment IDs that need re-translation
+    review_concurrency: int         # max review LLM calls in flight
+    review_token_budget: int        # estimated prompt tokens per review call
 
     # ── Persona learning ─────────────────────────────────────────────
     persona_suggestions: list[dict]
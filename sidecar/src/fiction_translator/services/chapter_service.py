@@ -2,36 +2,83 @@
 from __future__ import annotations
 
 import re
+from itertools import accumulate, pairwise
 
-from sqlalchemy import func
+from sqlalchemy import Row, case, distinct, func, select
 from sqlalchemy.orm import Session
 
 from fiction_translator.db.models import Chapter, Segment, Translation, TranslationStatus
 
 _CHAPTER_UPDATABLE = {"title", "order", "source_content", "file_path", "translated_content", "translation_stale"}
 
-
-def list_chapters(db: Session, project_id: int) -> list[dict]:
-    """List all chapters in a project with statistics."""
-    chapters = db.query(Chapter).filter(
-        Chapter.project_id == project_id
-    ).order_by(Chapter.order).all()
-    result = []
-    for ch in chapters:
-        seg_count = db.query(func.count(Segment.id)).filter(Segment.chapter_id == ch.id).scalar()
-        # Count translations that are not pending
-        trans_count = db.query(func.count(Translation.id)).filter(
-            Translation.segment_id.in_(
-                db.query(Segment.id).filter(Segment.chapter_id == ch.id)
-            ),
-            Translation.status != TranslationStatus.PENDING,
-        ).scalar()
-        result.append({
-            **_chapter_to_dict(ch),
-            "segment_count": seg_count,
-            "translated_count": trans_count,
-        })
-    return result
+# One or more blank lines (two+ newlines, whitespace between) end a paragraph
+_PARA_BREAK_RE = re.compile(r"\n\s*\n")
+# (separator, length) between editor segments, indexed by has_break
+_SEGMENT_SEPARATORS = (("\n", 1), ("\n\n", 2))
+
+
+# Columns serialized by _chapter_summary_to_dict: everything except the
+# source/translated content blobs, which the chapter list doesn't show
+_CHAPTER_SUMMARY_COLUMNS = (
+    Chapter.id,
+    Chapter.project_id,
+    Chapter.title,
+    Chapter.order,
+    Chapter.file_path,
+    Chapter.translation_stale,
+    Chapter.created_at,
+    Chapter.updated_at,
+)
+
+
+def list_chapters(
+    db: Session,
+    project_id: int,
+    limit: int | None = None,
+    offset: int = 0,
+) -> list[dict]:
+    """List chapters in a project with statistics.
+
+    Content is omitted; use :func:`get_chapter` for a single chapter's text.
+    Pass *limit* (and *offset*) to fetch one page; all chapters by default.
+    """
+    # Plain rows rather than ORM instances: nothing here is modified
+    chapters = db.execute(
+        select(*_CHAPTER_SUMMARY_COLUMNS)
+        .where(Chapter.project_id == project_id)
+        .order_by(Chapter.order, Chapter.id)
+        .limit(limit)
+        .offset(offset)
+    ).all()
+    if not chapters:
+        return []
+    # A page only needs counts for its own chapters
+    if limit is None:
+        count_filter = Chapter.project_id == project_id
+    else:
+        count_filter = Chapter.id.in_([ch.id for ch in chapters])
+
+    # Per-chapter segment and non-pending translation counts in one
+    # grouped query (outer join keeps segments without translations)
+    counts = {
+        chapter_id: {"segment_count": seg_count, "translated_count": trans_count}
+        for chapter_id, seg_count, trans_count in db.query(
+            Segment.chapter_id,
+            func.count(distinct(Segment.id)),
+            func.count(case(
+                (Translation.status != TranslationStatus.PENDING, Translation.id),
+            )),
+        )
+        .join(Chapter, Segment.chapter_id == Chapter.id)
+        .outerjoin(Translation, Translation.segment_id == Segment.id)
+        .filter(count_filter)
+        .group_by(Segment.chapter_id)
+    }
+    no_counts = {"segment_count": 0, "translated_count": 0}
+    return [
+        {**_chapter_summary_to_dict(ch), **counts.get(ch.id, no_counts)}
+        for ch in chapters
+    ]
 
 
 def create_chapter(db: Session, project_id: int, title: str, source_content: str = "", **kwargs) -> dict:
@@ -49,14 +96,15 @@ def create_chapter(db: Session, project_id: int, title: str, source_content: str
         file_path=kwargs.get("file_path"),
     )
     db.add(chapter)
+    db.flush()
+    result = _chapter_to_dict(chapter)
     db.commit()
-    db.refresh(chapter)
-    return _chapter_to_dict(chapter)
+    return result
 
 
 def get_chapter(db: Session, chapter_id: int) -> dict:
     """Get a single chapter by ID."""
-    chapter = db.query(Chapter).filter(Chapter.id == chapter_id).first()
+    chapter = db.get(Chapter, chapter_id)
     if not chapter:
         raise ValueError(f"Chapter {chapter_id} not found")
     return _chapter_to_dict(chapter)
@@ -64,20 +112,23 @@ def get_chapter(db: Session, chapter_id: int) -> dict:
 
 def update_chapter(db: Session, chapter_id: int, **kwargs) -> dict:
     """Update an existing chapter."""
-    chapter = db.query(Chapter).filter(Chapter.id == chapter_id).first()
+    chapter = db.get(Chapter, chapter_id)
     if not chapter:
         raise ValueError(f"Chapter {chapter_id} not found")
     for key, value in kwargs.items():
         if key in _CHAPTER_UPDATABLE:
             setattr(chapter, key, value)
+    if not db.is_modified(chapter):
+        return _chapter_to_dict(chapter)
+    db.flush()
+    result = _chapter_to_dict(chapter)
     db.commit()
-    db.refresh(chapter)
-    return _chapter_to_dict(chapter)
+    return result
 
 
 def delete_chapter(db: Session, chapter_id: int) -> dict:
     """Delete a chapter and all related data (cascades)."""
-    chapter = db.query(Chapter).filter(Chapter.id == chapter_id).first()
+    chapter = db.get(Chapter, chapter_id)
     if not chapter:
         raise ValueError(f"Chapter {chapter_id} not found")
     db.delete(chapter)
@@ -91,13 +142,24 @@ def get_editor_data(db: Session, chapter_id: int, target_language: str = "en") -
     Returns source text and translated text as continuous prose,
     with a segment map for click-to-highlight linking.
     """
-    chapter = db.query(Chapter).filter(Chapter.id == chapter_id).first()
+    chapter = db.get(Chapter, chapter_id)
     if not chapter:
         raise ValueError(f"Chapter {chapter_id} not found")
 
-    segments = db.query(Segment).filter(
-        Segment.chapter_id == chapter_id
-    ).order_by(Segment.order).all()
+    # Plain column rows: the loops below only read, and skipping ORM
+    # identity-map bookkeeping is most of the cost on long chapters
+    segments = db.execute(
+        select(
+            Segment.id,
+            Segment.source_text,
+            Segment.source_start_offset,
+            Segment.source_end_offset,
+            Segment.segment_type,
+            Segment.speaker,
+        )
+        .where(Segment.chapter_id == chapter_id)
+        .order_by(Segment.order)
+    ).all()
 
     if not segments:
         return {
@@ -108,95 +170,80 @@ def get_editor_data(db: Session, chapter_id: int, target_language: str = "en") -
 
     source_content = chapter.source_content or ""
 
-    # Build translation lookup (single batch query)
-    segment_ids = [seg.id for seg in segments]
-    translations = db.query(Translation).filter(
-        Translation.segment_id.in_(segment_ids),
-        Translation.target_language == target_language,
-    ).all()
-    translation_map: dict[int, Translation | None] = {
-        t.segment_id: t for t in translations
+    # Build translation lookup (single query, joined on the chapter so
+    # large chapters don't hit SQLite's bound-parameter limit)
+    translation_map: dict[int, Row] = {
+        t.segment_id: t
+        for t in db.execute(
+            select(Translation.segment_id, Translation.translated_text, Translation.batch_id)
+            .join(Segment, Translation.segment_id == Segment.id)
+            .where(
+                Segment.chapter_id == chapter_id,
+                Translation.target_language == target_language,
+            )
+        )
     }
 
-    # Phase 1: Determine paragraph breaks between segments
-    has_break_list: list[bool] = [False]  # first segment never has a preceding break
-
-    for i in range(1, len(segments)):
-        prev_end = segments[i - 1].source_end_offset
-        curr_start = segments[i].source_start_offset
+    # Phase 1: Pick the separator before each segment from the source gap
+    # and lay out the source connected text
+    separators = [_SEGMENT_SEPARATORS[False]]  # first segment has none
+    source_parts: list[str] = [segments[0].source_text]
+    for prev, seg in pairwise(segments):
+        prev_end = prev.source_end_offset
+        curr_start = seg.source_start_offset
 
         has_break = False
         if prev_end is not None and curr_start is not None and prev_end <= curr_start:
             gap = source_content[prev_end:curr_start]
-            has_break = bool(re.search(r'\n\s*\n', gap))
-        has_break_list.append(has_break)
-
-    # Phase 2: Build source connected text with variable separators
-    source_parts: list[str] = []
-    source_offset = 0
-    source_starts: list[int] = []
-    source_ends: list[int] = []
-
-    for i, seg in enumerate(segments):
-        source_text = seg.source_text
-
-        if i > 0:
-            separator = "\n\n" if has_break_list[i] else "\n"
-            source_parts.append(separator)
-            source_offset += len(separator)
-
-        source_start = source_offset
-        source_end = source_offset + len(source_text)
-        source_starts.append(source_start)
-        source_ends.append(source_end)
-
-        source_parts.append(source_text)
-        source_offset = source_end
-
-    source_connected = "".join(source_parts)
-
-    # Phase 3: Build translated connected text with variable separators
+            # Plain "\n\n" is the usual gap; the regex catches blank
+            # lines that contain whitespace
+            has_break = "\n\n" in gap or bool(_PARA_BREAK_RE.search(gap))
+        separator = _SEGMENT_SEPARATORS[has_break]
+        separators.append(separator)
+        source_parts.append(separator[0])
+        source_parts.append(seg.source_text)
+
+    # Phase 2: Source end offsets are the running totals at each text
+    # part (every other part, since separators sit in between)
+    source_ends = list(accumulate(map(len, source_parts)))[::2]
+
+    # Phase 3: Build the translated text and the segment map in one pass,
+    # tracking translated offsets with a running cursor
     translated_parts: list[str] = []
-    translated_offset = 0
-    translated_starts: list[int] = []
-    translated_ends: list[int] = []
-
-    for i, seg in enumerate(segments):
+    segment_map: list[dict] = []
+    translated_append = translated_parts.append
+    map_append = segment_map.append
+    translated_cursor = 0
+
+    for seg, (separator, sep_len), source_end in zip(
+        segments, separators, source_ends, strict=True,
+    ):
         translation = translation_map.get(seg.id)
-        translated_text = translation.translated_text if translation and translation.translated_text else ""
-
-        if i > 0 and translated_text and translated_parts:
-            separator = "\n\n" if has_break_list[i] else "\n"
-            translated_parts.append(separator)
-            translated_offset += len(separator)
-
-        translated_start = translated_offset
-        translated_end = translated_offset + len(translated_text)
-        translated_starts.append(translated_start)
-        translated_ends.append(translated_end)
+        translated_text = (translation.translated_text if translation else None) or ""
 
+        # Untranslated segments get an empty span and no separator
+        translated_start = translated_cursor
         if translated_text:
-            translated_parts.append(translated_text)
-            translated_offset = translated_end
+            if translated_parts:
+                translated_append(separator)
+                translated_start += sep_len
+            translated_append(translated_text)
+            translated_cursor = translated_start + len(translated_text)
 
-    translated_connected = "".join(translated_parts)
-
-    # Phase 4: Build segment_map
-    segment_map = []
-    for i, seg in enumerate(segments):
-        translation = translation_map.get(seg.id)
-
-        segment_map.append({
+        map_append({
             "segment_id": seg.id,
-            "source_start": source_starts[i],
-            "source_end": source_ends[i],
-            "translated_start": translated_starts[i],
-            "translated_end": translated_ends[i],
+            "source_start": source_end - len(seg.source_text),
+            "source_end": source_end,
+            "translated_start": translated_start,
+            "translated_end": translated_cursor,
             "type": seg.segment_type,
             "speaker": seg.speaker,
             "batch_id": translation.batch_id if translation else None,
         })
 
+    source_connected = "".join(source_parts)
+    translated_connected = "".join(translated_parts)
+
     return {
         "source_connected_text": source_connected,
         "translated_connected_text": translated_connected,
@@ -206,14 +253,21 @@ def get_editor_data(db: Session, chapter_id: int, target_language: str = "en") -
 
 def _chapter_to_dict(ch: Chapter) -> dict:
     """Convert Chapter model to dict."""
+    return {
+        **_chapter_summary_to_dict(ch),
+        "source_content": ch.source_content,
+        "translated_content": ch.translated_content,
+    }
+
+
+def _chapter_summary_to_dict(ch: Chapter | Row) -> dict:
+    """Convert a Chapter (or a row of ``_CHAPTER_SUMMARY_COLUMNS``) to a dict without content."""
     return {
         "id": ch.id,
         "project_id": ch.project_id,
         "title": ch.title,
         "order": ch.order,
-        "source_content": ch.source_content,
         "file_path": ch.file_path,
-        "translated_content": ch.translated_content,
         "translation_stale": ch.translation_stale,
         "created_at": ch.created_at.isoformat() if ch.created_at else None,
         "updated_at": ch.updated_at.isoformat() if ch.updated_at else None,
@@ -4,6 +4,7 @@ from __future__ import annotations
 from datetime import datetime
 from pathlib import Path
 
+from sqlalchemy import and_, select
 from sqlalchemy.orm import Session
 
 from fiction_translator.db.models import Chapter, Export, Segment, Translation
@@ -11,35 +12,23 @@ from fiction_translator.db.models import Chapter, Export, Segment, Translation
 
 def export_chapter_txt(db: Session, chapter_id: int, target_language: str = "en") -> dict:
     """Export a chapter as plain text."""
-    chapter = db.query(Chapter).filter(Chapter.id == chapter_id).first()
+    chapter = db.get(Chapter, chapter_id)
     if not chapter:
         raise ValueError(f"Chapter {chapter_id} not found")
 
-    segments = db.query(Segment).filter(
-        Segment.chapter_id == chapter_id
-    ).order_by(Segment.order).all()
-
-    segment_ids = [seg.id for seg in segments]
-    translations = db.query(Translation).filter(
-        Translation.segment_id.in_(segment_ids),
-        Translation.target_language == target_language,
-    ).all()
-    translation_map = {t.segment_id: t for t in translations}
-
-    lines = [f"# {chapter.title}\n"]
-    for seg in segments:
-        translation = translation_map.get(seg.id)
-        text = translation.translated_text if translation and translation.translated_text else seg.source_text
-        lines.append(text)
-
-    content = "\n".join(lines)
+    segments = _export_segments(db, chapter_id, target_language)
 
     # Save to file
     export_dir = Path.home() / ".fiction-translator" / "exports"
     export_dir.mkdir(parents=True, exist_ok=True)
     filename = f"{chapter.title}_{target_language}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
     filepath = export_dir / filename
-    filepath.write_text(content, encoding="utf-8")
+    # Written piecewise so the full text is never built as one string;
+    # size stays a character count, summed from the text-mode writes
+    with filepath.open("w", encoding="utf-8") as f:
+        size = f.write(f"# {chapter.title}\n")
+        for _, _, text in segments:
+            size += f.write(f"\n{text}")
 
     # Record export
     export = Export(
@@ -51,7 +40,7 @@ def export_chapter_txt(db: Session, chapter_id: int, target_language: str = "en"
     db.add(export)
     db.commit()
 
-    return {"path": str(filepath), "format": "txt", "size": len(content)}
+    return {"path": str(filepath), "format": "txt", "size": size}
 
 
 def export_chapter_docx(db: Session, chapter_id: int, target_language: str = "en") -> dict:
@@ -61,30 +50,18 @@ def export_chapter_docx(db: Session, chapter_id: int, target_language: str = "en
     except ImportError as err:
         raise RuntimeError("python-docx not installed. Install with: uv add python-docx") from err
 
-    chapter = db.query(Chapter).filter(Chapter.id == chapter_id).first()
+    chapter = db.get(Chapter, chapter_id)
     if not chapter:
         raise ValueError(f"Chapter {chapter_id} not found")
 
     doc = Document()
     doc.add_heading(chapter.title, 0)
 
-    segments = db.query(Segment).filter(
-        Segment.chapter_id == chapter_id
-    ).order_by(Segment.order).all()
-
-    segment_ids = [seg.id for seg in segments]
-    translations = db.query(Translation).filter(
-        Translation.segment_id.in_(segment_ids),
-        Translation.target_language == target_language,
-    ).all()
-    translation_map = {t.segment_id: t for t in translations}
-
-    for seg in segments:
-        translation = translation_map.get(seg.id)
-        text = translation.translated_text if translation and translation.translated_text else seg.source_text
+    segments = _export_segments(db, chapter_id, target_language)
 
-        if seg.segment_type == "dialogue" and seg.speaker:
-            doc.add_paragraph(f"{seg.speaker}: {text}")
+    for segment_type, speaker, text in segments:
+        if segment_type == "dialogue" and speaker:
+            doc.add_paragraph(f"{speaker}: {text}")
         else:
             doc.add_paragraph(text)
 
@@ -107,11 +84,53 @@ def export_chapter_docx(db: Session, chapter_id: int, target_language: str = "en
     return {"path": str(filepath), "format": "docx"}
 
 
-def list_exports(db: Session, project_id: int) -> list[dict]:
-    """List all exports for a project."""
-    exports = db.query(Export).filter(
-        Export.project_id == project_id
-    ).order_by(Export.created_at.desc()).all()
+def _export_segments(
+    db: Session, chapter_id: int, target_language: str,
+) -> list[tuple[str | None, str | None, str]]:
+    """Return ``(segment_type, speaker, text)`` for each segment in order.
+
+    *text* is the translation in *target_language*, falling back to the
+    source text for untranslated segments.  One query: translations are
+    outer-joined onto the chapter's segments.
+    """
+    rows = db.query(
+        Segment.segment_type,
+        Segment.speaker,
+        Segment.source_text,
+        Translation.translated_text,
+    ).outerjoin(
+        Translation,
+        and_(
+            Translation.segment_id == Segment.id,
+            Translation.target_language == target_language,
+        ),
+    ).filter(
+        Segment.chapter_id == chapter_id
+    ).order_by(Segment.order).all()
+    return [
+        (segment_type, speaker, translated_text or source_text)
+        for segment_type, speaker, source_text, translated_text in rows
+    ]
+
+
+def list_exports(
+    db: Session,
+    project_id: int,
+    limit: int | None = None,
+    offset: int = 0,
+) -> list[dict]:
+    """List exports for a project, newest first (one page with *limit*/*offset*)."""
+    # Plain rows rather than ORM instances for the read-only listing
+    exports = db.execute(
+        select(
+            Export.id, Export.chapter_id, Export.project_id,
+            Export.format, Export.file_path, Export.created_at,
+        )
+        .where(Export.project_id == project_id)
+        .order_by(Export.created_at.desc(), Export.id.desc())
+        .limit(limit)
+        .offset(offset)
+    ).all()
     return [{
         "id": e.id,
         "chapter_id": e.chapter_id,
@@ -124,7 +143,7 @@ def list_exports(db: Session, project_id: int) -> list[dict]:
 
 def delete_export(db: Session, export_id: int) -> dict:
     """Delete an export record and optionally the file."""
-    export = db.query(Export).filter(Export.id == export_id).first()
+    export = db.get(Export, export_id)
     if not export:
         raise ValueError(f"Export {export_id} not found")
 
@@ -1,18 +1,42 @@
 """Glossary CRUD service."""
 from __future__ import annotations
 
+from sqlalchemy import Row, insert, select
 from sqlalchemy.orm import Session
 
 from fiction_translator.db.models import GlossaryEntry
 
 _GLOSSARY_UPDATABLE = {"source_term", "translated_term", "term_type", "notes", "context"}
 
-
-def list_glossary(db: Session, project_id: int) -> list[dict]:
-    """List all glossary entries for a project."""
-    entries = db.query(GlossaryEntry).filter(
-        GlossaryEntry.project_id == project_id
-    ).order_by(GlossaryEntry.source_term).all()
+# Columns serialized by _entry_to_dict, for column-only selects
+_ENTRY_COLUMNS = (
+    GlossaryEntry.id,
+    GlossaryEntry.project_id,
+    GlossaryEntry.source_term,
+    GlossaryEntry.translated_term,
+    GlossaryEntry.term_type,
+    GlossaryEntry.notes,
+    GlossaryEntry.context,
+    GlossaryEntry.auto_detected,
+    GlossaryEntry.created_at,
+)
+
+
+def list_glossary(
+    db: Session,
+    project_id: int,
+    limit: int | None = None,
+    offset: int = 0,
+) -> list[dict]:
+    """List glossary entries for a project (one page with *limit*/*offset*)."""
+    # Plain rows rather than ORM instances for the read-only listing
+    entries = db.execute(
+        select(*_ENTRY_COLUMNS)
+        .where(GlossaryEntry.project_id == project_id)
+        .order_by(GlossaryEntry.source_term, GlossaryEntry.id)
+        .limit(limit)
+        .offset(offset)
+    ).all()
     return [_entry_to_dict(e) for e in entries]
 
 
@@ -28,14 +52,15 @@ def create_glossary_entry(db: Session, project_id: int, source_term: str, transl
         auto_detected=kwargs.get("auto_detected", False),
     )
     db.add(entry)
+    db.flush()
+    result = _entry_to_dict(entry)
     db.commit()
-    db.refresh(entry)
-    return _entry_to_dict(entry)
+    return result
 
 
 def get_glossary_entry(db: Session, entry_id: int) -> dict:
     """Get a single glossary entry by ID."""
-    entry = db.query(GlossaryEntry).filter(GlossaryEntry.id == entry_id).first()
+    entry = db.get(GlossaryEntry, entry_id)
     if not entry:
         raise ValueError(f"Glossary entry {entry_id} not found")
     return _entry_to_dict(entry)
@@ -43,20 +68,23 @@ def get_glossary_entry(db: Session, entry_id: int) -> dict:
 
 def update_glossary_entry(db: Session, entry_id: int, **kwargs) -> dict:
     """Update an existing glossary entry."""
-    entry = db.query(GlossaryEntry).filter(GlossaryEntry.id == entry_id).first()
+    entry = db.get(GlossaryEntry, entry_id)
     if not entry:
         raise ValueError(f"Glossary entry {entry_id} not found")
     for key, value in kwargs.items():
         if key in _GLOSSARY_UPDATABLE:
             setattr(entry, key, value)
+    if not db.is_modified(entry):
+        return _entry_to_dict(entry)
+    db.flush()
+    result = _entry_to_dict(entry)
     db.commit()
-    db.refresh(entry)
-    return _entry_to_dict(entry)
+    return result
 
 
 def delete_glossary_entry(db: Session, entry_id: int) -> dict:
     """Delete a glossary entry."""
-    entry = db.query(GlossaryEntry).filter(GlossaryEntry.id == entry_id).first()
+    entry = db.get(GlossaryEntry, entry_id)
     if not entry:
         raise ValueError(f"Glossary entry {entry_id} not found")
     db.delete(entry)
@@ -66,33 +94,35 @@ def delete_glossary_entry(db: Session, entry_id: int) -> dict:
 
 def get_glossary_map(db: Session, project_id: int) -> dict[str, str]:
     """Get glossary as source->target mapping for translation prompts."""
-    entries = db.query(GlossaryEntry).filter(
+    rows = db.query(GlossaryEntry.source_term, GlossaryEntry.translated_term).filter(
         GlossaryEntry.project_id == project_id
     ).all()
-    return {e.source_term: e.translated_term for e in entries}
+    return dict(rows)
 
 
 def bulk_import(db: Session, project_id: int, entries: list[dict]) -> dict:
     """Import multiple glossary entries."""
-    created = 0
-    for entry_data in entries:
-        entry = GlossaryEntry(
-            project_id=project_id,
-            source_term=entry_data["source_term"],
-            translated_term=entry_data["translated_term"],
-            term_type=entry_data.get("term_type", "general"),
-            notes=entry_data.get("notes"),
-            context=entry_data.get("context"),
-            auto_detected=entry_data.get("auto_detected", False),
-        )
-        db.add(entry)
-        created += 1
-    db.commit()
-    return {"imported": created}
-
-
-def _entry_to_dict(e: GlossaryEntry) -> dict:
-    """Convert GlossaryEntry model to dict."""
+    rows = [
+        {
+            "project_id": project_id,
+            "source_term": entry_data["source_term"],
+            "translated_term": entry_data["translated_term"],
+            "term_type": entry_data.get("term_type", "general"),
+            "notes": entry_data.get("notes"),
+            "context": entry_data.get("context"),
+            "auto_detected": entry_data.get("auto_detected", False),
+        }
+        for entry_data in entries
+    ]
+    if rows:
+        # One executemany INSERT instead of per-entry ORM instances
+        db.execute(insert(GlossaryEntry), rows)
+        db.commit()
+    return {"imported": len(rows)}
+
+
+def _entry_to_dict(e: GlossaryEntry | Row) -> dict:
+    """Convert GlossaryEntry model (or a row of ``_ENTRY_COLUMNS``) to dict."""
     return {
         "id": e.id,
         "project_id": e.project_id,
@@ -7,6 +7,10 @@ from fiction_translator.db.models import Persona, PersonaSuggestion
 
 _PERSONA_UPDATABLE = {"name", "aliases", "personality", "speech_style", "formality_level", "age_group", "example_dialogues", "notes"}
 
+_PERSONA_LIST_FIELDS = {"aliases", "example_dialogues"}
+
+_FORMALITY_LABELS = {1: "very casual", 2: "casual", 3: "neutral", 4: "formal", 5: "very formal"}
+
 
 def list_personas(db: Session, project_id: int) -> list[dict]:
     """List all personas in a project, ordered by appearance count."""
@@ -33,14 +37,15 @@ def create_persona(db: Session, project_id: int, name: str, **kwargs) -> dict:
         source_chapter_id=kwargs.get("source_chapter_id"),
     )
     db.add(persona)
+    db.flush()
+    result = _persona_to_dict(persona)
     db.commit()
-    db.refresh(persona)
-    return _persona_to_dict(persona)
+    return result
 
 
 def get_persona(db: Session, persona_id: int) -> dict:
     """Get a single persona by ID."""
-    persona = db.query(Persona).filter(Persona.id == persona_id).first()
+    persona = db.get(Persona, persona_id)
     if not persona:
         raise ValueError(f"Persona {persona_id} not found")
     return _persona_to_dict(persona)
@@ -48,20 +53,23 @@ def get_persona(db: Session, persona_id: int) -> dict:
 
 def update_persona(db: Session, persona_id: int, **kwargs) -> dict:
     """Update an existing persona."""
-    persona = db.query(Persona).filter(Persona.id == persona_id).first()
+    persona = db.get(Persona, persona_id)
     if not persona:
         raise ValueError(f"Persona {persona_id} not found")
     for key, value in kwargs.items():
         if key in _PERSONA_UPDATABLE:
             setattr(persona, key, value)
+    if not db.is_modified(persona):
+        return _persona_to_dict(persona)
+    db.flush()
+    result = _persona_to_dict(persona)
     db.commit()
-    db.refresh(persona)
-    return _persona_to_dict(persona)
+    return result
 
 
 def delete_persona(db: Session, persona_id: int) -> dict:
     """Delete a persona and all suggestions (cascades)."""
-    persona = db.query(Persona).filter(Persona.id == persona_id).first()
+    persona = db.get(Persona, persona_id)
     if not persona:
         raise ValueError(f"Persona {persona_id} not found")
     db.delete(persona)
@@ -71,25 +79,34 @@ def delete_persona(db: Session, persona_id: int) -> dict:
 
 def get_personas_context(db: Session, project_id: int) -> str:
     """Generate persona context string for translation prompts."""
-    personas = db.query(Persona).filter(Persona.project_id == project_id).all()
+    # Only the columns rendered below, in a fixed order so the context
+    # (and the prompts built from it) is identical between runs
+    personas = db.query(
+        Persona.name,
+        Persona.aliases,
+        Persona.personality,
+        Persona.speech_style,
+        Persona.formality_level,
+        Persona.age_group,
+    ).filter(Persona.project_id == project_id).order_by(Persona.id).all()
     if not personas:
         return ""
 
     parts = ["## Character Voice Guide\n"]
     for p in personas:
-        part = f"### {p.name}"
+        # Fragments joined once per persona
+        frag = [f"### {p.name}"]
         if p.aliases:
-            part += f" (also: {', '.join(p.aliases)})"
-        part += "\n"
+            frag.append(f" (also: {', '.join(p.aliases)})")
+        frag.append("\n")
         if p.personality:
-            part += f"- Personality: {p.personality}\n"
+            frag.append(f"- Personality: {p.personality}\n")
         if p.speech_style:
-            part += f"- Speech style: {p.speech_style}\n"
-        formality_labels = {1: "very casual", 2: "casual", 3: "neutral", 4: "formal", 5: "very formal"}
-        part += f"- Formality: {formality_labels.get(p.formality_level, 'neutral')}\n"
+            frag.append(f"- Speech style: {p.speech_style}\n")
+        frag.append(f"- Formality: {_FORMALITY_LABELS.get(p.formality_level, 'neutral')}\n")
         if p.age_group:
-            part += f"- Age group: {p.age_group}\n"
-        parts.append(part)
+            frag.append(f"- Age group: {p.age_group}\n")
+        parts.append("".join(frag))
     return "\n".join(parts)
 
 
@@ -113,38 +130,68 @@ def list_suggestions(db: Session, persona_id: int) -> list[dict]:
 
 def apply_suggestion(db: Session, suggestion_id: int, approve: bool = True) -> dict:
     """Approve or reject a persona suggestion."""
-    suggestion = db.query(PersonaSuggestion).filter(PersonaSuggestion.id == suggestion_id).first()
-    if not suggestion:
-        raise ValueError(f"Suggestion {suggestion_id} not found")
+    return apply_suggestions(db, [suggestion_id], approve)[0]
+
+
+def apply_suggestions(db: Session, suggestion_ids: list[int], approve: bool = True) -> list[dict]:
+    """Approve or reject several persona suggestions in one transaction.
+
+    Suggestions and their personas are each loaded with a single query
+    and everything is committed once.  Raises ``ValueError`` (before any
+    change) if an id does not exist.
+    """
+    suggestion_ids = list(dict.fromkeys(suggestion_ids))
+    by_id = {
+        s.id: s
+        for s in db.query(PersonaSuggestion).filter(PersonaSuggestion.id.in_(suggestion_ids))
+    }
+    for suggestion_id in suggestion_ids:
+        if suggestion_id not in by_id:
+            raise ValueError(f"Suggestion {suggestion_id} not found")
+    suggestions = [by_id[i] for i in suggestion_ids]
 
     if approve:
-        persona = db.query(Persona).filter(Persona.id == suggestion.persona_id).first()
-        if persona and hasattr(persona, suggestion.field_name):
-            current = getattr(persona, suggestion.field_name)
-            # Handle list fields (aliases, example_dialogues)
-            if isinstance(current, list):
-                if suggestion.suggested_value not in current:
-                    current.append(suggestion.suggested_value)
-                    setattr(persona, suggestion.field_name, current)
-            # Handle string fields
-            elif isinstance(current, str):
-                if current:
-                    setattr(persona, suggestion.field_name, f"{current}; {suggestion.suggested_value}")
-                else:
-                    setattr(persona, suggestion.field_name, suggestion.suggested_value)
-            else:
-                setattr(persona, suggestion.field_name, suggestion.suggested_value)
-        suggestion.status = "approved"
+        persona_ids = {s.persona_id for s in suggestions}
+        personas = {
+            p.id: p for p in db.query(Persona).filter(Persona.id.in_(persona_ids))
+        }
+        for suggestion in suggestions:
+            persona = personas.get(suggestion.persona_id)
+            # field_name comes from LLM output; only user-editable fields apply
+            if persona and suggestion.field_name in _PERSONA_UPDATABLE:
+                _apply_suggested_value(persona, suggestion.field_name, suggestion.suggested_value)
+            suggestion.status = "approved"
     else:
-        suggestion.status = "rejected"
+        for suggestion in suggestions:
+            suggestion.status = "rejected"
 
     db.commit()
-    return {"id": suggestion.id, "status": suggestion.status}
+    return [{"id": s.id, "status": s.status} for s in suggestions]
+
+
+def _apply_suggested_value(persona: Persona, field_name: str, value) -> None:
+    """Merge a suggested value into one persona field."""
+    current = getattr(persona, field_name)
+    # List fields (aliases, example_dialogues) are MutableList columns,
+    # so an in-place append is tracked without reassigning
+    if field_name in _PERSONA_LIST_FIELDS:
+        if current is None:
+            setattr(persona, field_name, [value])
+        elif value not in current:
+            current.append(value)
+    # Handle string fields
+    elif isinstance(current, str):
+        if current:
+            setattr(persona, field_name, f"{current}; {value}")
+        else:
+            setattr(persona, field_name, value)
+    else:
+        setattr(persona, field_name, value)
 
 
 def increment_appearance(db: Session, persona_id: int, chapter_id: int):
     """Increment appearance count and update last seen chapter."""
-    persona = db.query(Persona).filter(Persona.id == persona_id).first()
+    persona = db.get(Persona, persona_id)
     if persona:
         persona.appearance_count = (persona.appearance_count or 0) + 1
         persona.last_seen_chapter_id = chapter_id
@@ -1,7 +1,7 @@
 """Project CRUD service."""
 from __future__ import annotations
 
-from sqlalchemy import func
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from fiction_translator.db.models import Chapter, Project
@@ -11,16 +11,22 @@ _PROJECT_UPDATABLE = {"name", "description", "source_language", "target_language
 
 def list_projects(db: Session) -> list[dict]:
     """List all projects with chapter counts."""
-    # Get chapter counts in one query
-    chapter_counts = dict(
-        db.query(Chapter.project_id, func.count(Chapter.id))
-        .group_by(Chapter.project_id)
-        .all()
-    )
-
-    projects = db.query(Project).order_by(Project.updated_at.desc()).all()
+    # Listed columns and chapter counts as plain rows in one query (outer
+    # join keeps projects without chapters; style_settings isn't listed)
+    rows = db.execute(
+        select(
+            Project.id, Project.name, Project.description,
+            Project.source_language, Project.target_language, Project.genre,
+            Project.pipeline_type, Project.llm_provider,
+            Project.created_at, Project.updated_at,
+            func.count(Chapter.id).label("chapter_count"),
+        )
+        .outerjoin(Chapter, Chapter.project_id == Project.id)
+        .group_by(Project.id)
+        .order_by(Project.updated_at.desc())
+    ).all()
     result = []
-    for p in projects:
+    for p in rows:
         result.append({
             "id": p.id,
             "name": p.name,
@@ -32,7 +38,7 @@ def list_projects(db: Session) -> list[dict]:
             "llm_provider": p.llm_provider,
             "created_at": p.created_at.isoformat() if p.created_at else None,
             "updated_at": p.updated_at.isoformat() if p.updated_at else None,
-            "chapter_count": chapter_counts.get(p.id, 0),
+            "chapter_count": p.chapter_count,
         })
     return result
 
@@ -50,14 +56,15 @@ def create_project(db: Session, name: str, source_language: str = "ko", target_l
         llm_provider=kwargs.get("llm_provider", "gemini"),
     )
     db.add(project)
+    db.flush()
+    result = _project_to_dict(project)
     db.commit()
-    db.refresh(project)
-    return _project_to_dict(project)
+    return result
 
 
 def get_project(db: Session, project_id: int) -> dict:
     """Get a single project by ID."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = db.get(Project, project_id)
     if not project:
         raise ValueError(f"Project {project_id} not found")
     return _project_to_dict(project)
@@ -65,20 +72,24 @@ def get_project(db: Session, project_id: int) -> dict:
 
 def update_project(db: Session, project_id: int, **kwargs) -> dict:
     """Update an existing project."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = db.get(Project, project_id)
     if not project:
         raise ValueError(f"Project {project_id} not found")
     for key, value in kwargs.items():
         if key in _PROJECT_UPDATABLE:
             setattr(project, key, value)
+    # Nothing changed: skip the write transaction (and the updated_at bump)
+    if not db.is_modified(project):
+        return _project_to_dict(project)
+    db.flush()
+    result = _project_to_dict(project)
     db.commit()
-    db.refresh(project)
-    return _project_to_dict(project)
+    return result
 
 
 def delete_project(db: Session, project_id: int) -> dict:
     """Delete a project and all related data (cascades)."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = db.get(Project, project_id)
     if not project:
         raise ValueError(f"Project {project_id} not found")
     db.delete(project)
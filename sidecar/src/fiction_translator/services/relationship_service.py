@@ -1,7 +1,8 @@
 """Character relationship CRUD service."""
 from __future__ import annotations
 
-from sqlalchemy.orm import Session
+from sqlalchemy import or_, update
+from sqlalchemy.orm import Session, joinedload
 
 from fiction_translator.db.models import CharacterRelationship, Persona
 
@@ -41,60 +42,75 @@ def create_relationship(
         detection_confidence=kwargs.get("detection_confidence"),
     )
     db.add(rel)
+    db.flush()
+    result = _relationship_to_dict(rel)
     db.commit()
-    db.refresh(rel)
-    return _relationship_to_dict(rel)
+    return result
 
 
 def update_relationship(db: Session, relationship_id: int, **kwargs) -> dict:
-    """Update an existing relationship."""
-    rel = db.query(CharacterRelationship).filter(
-        CharacterRelationship.id == relationship_id
-    ).first()
+    """Update an existing relationship.
+
+    A real change is a single ``UPDATE ... RETURNING``; the row is only
+    read back separately when nothing matched (missing or unchanged).
+    """
+    values = {k: v for k, v in kwargs.items() if k in _RELATIONSHIP_UPDATABLE}
+    if values:
+        rel = db.scalars(
+            update(CharacterRelationship)
+            .where(
+                CharacterRelationship.id == relationship_id,
+                # Skip the write (and the updated_at bump) on a no-op save
+                or_(*(
+                    getattr(CharacterRelationship, key).is_distinct_from(value)
+                    for key, value in values.items()
+                )),
+            )
+            .values(**values)
+            .returning(CharacterRelationship)
+        ).one_or_none()
+        if rel is not None:
+            result = _relationship_to_dict(rel)
+            db.commit()
+            return result
+
+    rel = db.get(CharacterRelationship, relationship_id)
     if not rel:
         raise ValueError(f"Relationship {relationship_id} not found")
-    for key, value in kwargs.items():
-        if key in _RELATIONSHIP_UPDATABLE:
-            setattr(rel, key, value)
-    db.commit()
-    db.refresh(rel)
     return _relationship_to_dict(rel)
 
 
 def delete_relationship(db: Session, relationship_id: int) -> dict:
     """Delete a relationship."""
-    rel = db.query(CharacterRelationship).filter(
+    deleted = db.query(CharacterRelationship).filter(
         CharacterRelationship.id == relationship_id
-    ).first()
-    if not rel:
+    ).delete(synchronize_session=False)
+    if not deleted:
         raise ValueError(f"Relationship {relationship_id} not found")
-    db.delete(rel)
     db.commit()
     return {"deleted": True, "id": relationship_id}
 
 
 def get_relationships_context(db: Session, project_id: int) -> str:
     """Generate relationship context string for translation prompts."""
-    relationships = db.query(CharacterRelationship).filter(
+    # Both persona names come back in the same query; the inner joins also
+    # drop relationships whose persona no longer exists
+    relationships = db.query(CharacterRelationship).options(
+        joinedload(CharacterRelationship.persona_1, innerjoin=True).load_only(Persona.name),
+        joinedload(CharacterRelationship.persona_2, innerjoin=True).load_only(Persona.name),
+    ).filter(
         CharacterRelationship.project_id == project_id
-    ).all()
+    ).order_by(CharacterRelationship.id).all()
     if not relationships:
         return ""
 
-    parts = ["## Character Relationships\n"]
-    for r in relationships:
-        p1 = db.query(Persona).filter(Persona.id == r.persona_id_1).first()
-        p2 = db.query(Persona).filter(Persona.id == r.persona_id_2).first()
-        if not p1 or not p2:
-            continue
-        line = (
-            f"- {p1.name} ↔ {p2.name}: {r.relationship_type} "
-            f"(intimacy: {r.intimacy_level}/10)"
-        )
-        if r.description:
-            line += f" - {r.description}"
-        parts.append(line)
-    return "\n".join(parts)
+    lines = [
+        f"- {r.persona_1.name} ↔ {r.persona_2.name}: {r.relationship_type} "
+        f"(intimacy: {r.intimacy_level}/10)"
+        + (f" - {r.description}" if r.description else "")
+        for r in relationships
+    ]
+    return "## Character Relationships\n\n" + "\n".join(lines)
 
 
 def _relationship_to_dict(r: CharacterRelationship) -> dict:
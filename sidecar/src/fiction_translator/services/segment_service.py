@@ -3,9 +3,10 @@ from __future__ import annotations
 
 import logging
 
-from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, raiseload, selectinload
 
-from fiction_translator.db.models import Segment, Translation, TranslationStatus
+from fiction_translator.db.models import Chapter, Segment, Translation, TranslationStatus
 from fiction_translator.llm.prompts.cot_translation import build_cot_translation_prompt
 from fiction_translator.llm.prompts.text_utils import normalize_quotes
 from fiction_translator.llm.providers import get_llm_provider
@@ -45,8 +46,12 @@ async def retranslate_segments(
     if not segment_ids:
         raise ValueError("No segment IDs provided")
 
-    # Load segments
-    segments = db.query(Segment).filter(Segment.id.in_(segment_ids)).all()
+    # Load segments with their chapter and project up front; any other
+    # relationship access raises instead of lazy-loading per segment
+    segments = db.query(Segment).options(
+        selectinload(Segment.chapter).selectinload(Chapter.project),
+        raiseload("*"),
+    ).filter(Segment.id.in_(segment_ids)).all()
     if not segments:
         raise ValueError("No segments found for the given IDs")
 
@@ -82,36 +87,48 @@ async def retranslate_segments(
     provider = get_llm_provider(project.llm_provider, api_keys=api_keys)
     result = await provider.generate_json(prompt, max_tokens=4096)
 
-    # Update translations
-    translations_data = result.get("translations", [])
+    # Update translations; existing rows for every returned segment are
+    # loaded in one query.  Ids are normalised to the loaded segments' ints
+    # first: a string "12" would still match in SQL but miss the dict lookup
+    requested_ids = {seg.id for seg in segments}
+    returned = []
+    for t_data in result.get("translations", []):
+        seg_id = _as_segment_id(t_data.get("segment_id"))
+        if seg_id in requested_ids:
+            returned.append((seg_id, t_data.get("text", "")))
+    returned_ids = [seg_id for seg_id, _ in returned]
+    existing = {
+        t.segment_id: t
+        for t in db.query(Translation).filter(
+            Translation.segment_id.in_(returned_ids),
+            Translation.target_language == target_language,
+        )
+    } if returned_ids else {}
+
     updated = []
-    for t_data in translations_data:
-        seg_id = t_data.get("segment_id")
-        new_text = t_data.get("text", "")
-        if not seg_id or not new_text:
+    # Missing records are collected and inserted in one executemany; a
+    # segment repeated in the response keeps its last text
+    new_rows: dict[int, dict] = {}
+    for seg_id, new_text in returned:
+        if not new_text:
             continue
 
-        translation = db.query(Translation).filter(
-            Translation.segment_id == seg_id,
-            Translation.target_language == target_language,
-        ).first()
-
+        translation = existing.get(seg_id)
         if translation:
             translation.translated_text = new_text
             translation.status = TranslationStatus.TRANSLATED
             translation.manually_edited = False
-            updated.append({"segment_id": seg_id, "translated_text": new_text})
         else:
-            # Create new translation record if none exists
-            translation = Translation(
-                segment_id=seg_id,
-                target_language=target_language,
-                translated_text=new_text,
-                status=TranslationStatus.TRANSLATED,
-            )
-            db.add(translation)
-            updated.append({"segment_id": seg_id, "translated_text": new_text})
-
+            new_rows[seg_id] = {
+                "segment_id": seg_id,
+                "target_language": target_language,
+                "translated_text": new_text,
+                "status": TranslationStatus.TRANSLATED,
+            }
+        updated.append({"segment_id": seg_id, "translated_text": new_text})
+
+    if new_rows:
+        db.execute(insert(Translation), list(new_rows.values()))
     db.commit()
 
     return {
@@ -119,3 +136,11 @@ async def retranslate_segments(
         "updated_count": len(updated),
         "translations": updated,
     }
+
+
+def _as_segment_id(value) -> int | None:
+    """Return an LLM-reported segment id as an int, or None if invalid."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,138 @@
+"""Tests for regex-based speaker extraction in the character extractor."""
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from fiction_translator.pipeline.constants import SPEAKER_PATTERNS_FUSED
+from fiction_translator.pipeline.nodes.character_extractor import (
+    _build_prompt_cached,
+    _capped_text,
+    _merge_with_existing,
+    character_extractor_node,
+)
+
+
+def _speaker(lang: str, text: str) -> str | None:
+    match = SPEAKER_PATTERNS_FUSED[lang].search(text)
+    return match.group(match.lastgroup) if match else None
+
+
+class TestFusedSpeakerPatterns:
+    def test_english_said_after_quote(self):
+        assert _speaker("en", '"Hello there," said Bob') == "Bob"
+
+    def test_english_is_case_insensitive(self):
+        assert _speaker("en", '"Hello there," SAID Bob') == "Bob"
+
+    def test_english_colon_prefix(self):
+        assert _speaker("en", 'Alice: "Hello"') == "Alice"
+
+    def test_korean_subject_particle(self):
+        assert _speaker("ko", "철수가 말했다") == "철수"
+
+    def test_japanese_quote_attribution(self):
+        assert _speaker("ja", "「こんにちは」と花子") == "花子"
+
+    def test_no_match(self):
+        assert _speaker("en", "Nothing to see here.") is None
+
+
+@pytest.mark.asyncio
+class TestCharacterExtractorNode:
+    async def test_counts_regex_speakers(self):
+        state = {
+            "source_language": "en",
+            "segments": [
+                {"order": 0, "text": '"Hi," said Bob', "type": "dialogue"},
+                {"order": 1, "text": '"Bye," said Bob', "type": "dialogue"},
+                {"order": 2, "text": 'Alice: "Hey"', "type": "dialogue"},
+                {"order": 3, "text": "Bob said nothing.", "type": "narrative"},
+            ],
+        }
+        result = await character_extractor_node(state)
+        counts = {c["name"]: c["speaking_lines"] for c in result["detected_characters"]}
+        assert counts == {"Bob": 2, "Alice": 1}
+
+    async def test_counts_first_match_per_segment_only(self):
+        state = {
+            "source_language": "en",
+            "segments": [
+                {"order": 0, "text": 'Alice: "Hi." Bob: "Hey."', "type": "dialogue"},
+                {"order": 1, "text": "Carol", "type": "dialogue"},
+                {"order": 2, "text": ': "Nobody"', "type": "dialogue"},
+                {"order": 3, "text": 'Dave: "Yo"', "type": "dialogue"},
+            ],
+        }
+        result = await character_extractor_node(state)
+        counts = {c["name"]: c["speaking_lines"] for c in result["detected_characters"]}
+        assert counts == {"Alice": 1, "Dave": 1}
+
+    async def test_prefers_segmenter_speaker(self):
+        state = {
+            "source_language": "en",
+            "segments": [
+                {"order": 0, "text": '"Hi," said Bob', "type": "dialogue", "speaker": "Robert"},
+            ],
+        }
+        result = await character_extractor_node(state)
+        assert [c["name"] for c in result["detected_characters"]] == ["Robert"]
+
+    async def test_llm_prompt_is_reused_on_identical_retry(self):
+        _build_prompt_cached.cache_clear()
+        provider = MagicMock()
+        provider.generate_json = AsyncMock(return_value={"characters": []})
+        state = {
+            "source_language": "en",
+            "api_keys": {"gemini": "k"},
+            "segments": [{"order": 0, "text": '"Hi," said Bob', "type": "dialogue"}],
+            "existing_personas": [{"id": 1, "name": "Bob"}],
+        }
+        with patch(
+            "fiction_translator.llm.providers.get_llm_provider", return_value=provider,
+        ):
+            await character_extractor_node(state)
+            await character_extractor_node(state)
+
+        first, second = (c.kwargs["prompt"] for c in provider.generate_json.call_args_list)
+        assert first == second
+        assert "Already-known characters in this project: Bob" in first
+        info = _build_prompt_cached.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+
+class TestCappedText:
+    @pytest.mark.parametrize("limit", [0, 1, 3, 4, 5, 7, 8, 9, 50])
+    def test_matches_join_then_slice(self, limit):
+        segments = [{"text": "abc"}, {"text": ""}, {"text": "defg"}, {}, {"text": "hi"}]
+        expected = "\n".join(s.get("text", "") for s in segments)[:limit]
+        assert _capped_text(segments, limit) == expected
+
+    def test_empty_segments(self):
+        assert _capped_text([], 10) == ""
+
+
+class TestMergeWithExisting:
+    def test_matches_by_name_case_insensitively(self):
+        detected = [{"name": "bob", "aliases": []}]
+        personas = [{"id": 1, "name": "Bob", "aliases": None}]
+        result = _merge_with_existing(detected, personas)
+        assert result[0]["persona_id"] == 1
+        assert result[0]["canonical_name"] == "Bob"
+
+    def test_matches_persona_alias(self):
+        detected = [{"name": "Bobby", "aliases": []}]
+        personas = [{"id": 1, "name": "Robert", "aliases": ["Bobby"]}]
+        result = _merge_with_existing(detected, personas)
+        assert result[0]["persona_id"] == 1
+
+    def test_matches_detected_alias(self):
+        detected = [{"name": "The Knight", "aliases": ["Sir Bob", "bob"]}]
+        personas = [{"id": 7, "name": "Bob", "aliases": None}]
+        result = _merge_with_existing(detected, personas)
+        assert result[0]["persona_id"] == 7
+
+    def test_unmatched_character_is_left_alone(self):
+        detected = [{"name": "Stranger", "aliases": ["Nobody"]}]
+        personas = [{"id": 1, "name": "Bob", "aliases": None}]
+        result = _merge_with_existing(detected, personas)
+        assert "persona_id" not in result[0]
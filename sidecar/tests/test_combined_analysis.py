@@ -0,0 +1,121 @@
+"""Tests for the fused review + persona/relationship analysis node."""
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from fiction_translator.llm.prompts.review import build_review_prompt
+from fiction_translator.pipeline.edges import should_fuse_analysis
+from fiction_translator.pipeline.nodes._common import build_review_pairs
+from fiction_translator.pipeline.nodes.combined_analysis import combined_analysis_node
+
+
+def _state(n=3, **overrides):
+    state = {
+        "api_keys": {"gemini": "k"},
+        "translated_segments": [
+            {"segment_id": i, "source_text": f"s{i}", "translated_text": f"t{i}"}
+            for i in range(n)
+        ],
+        "detected_characters": [{"name": "Bob"}],
+        "existing_personas": [
+            {"id": 1, "name": "Bob", "aliases": None},
+            {"id": 2, "name": "Alice", "aliases": ["Al"]},
+        ],
+    }
+    state.update(overrides)
+    return state
+
+
+def _response(flag_id=None, confidence=0.9):
+    reviews = [{"segment_id": flag_id, "verdict": "flag", "issue": "x"}] if flag_id else []
+    return {
+        "overall_passed": flag_id is None,
+        "segment_reviews": reviews,
+        "persona_updates": [
+            {"name": "bob", "field": "personality", "value": "Brave", "confidence": confidence},
+            {"name": "Bob", "field": "mood", "value": "?", "confidence": 0.9},
+        ],
+        "relationship_updates": [
+            {"character_1": "Bob", "character_2": "Al", "relationship_type": "friend",
+             "intimacy_level": 12, "confidence": confidence},
+        ],
+    }
+
+
+@pytest.mark.asyncio
+class TestCombinedAnalysisNode:
+    async def _run(self, state, *responses):
+        provider = MagicMock()
+        provider.generate_json = AsyncMock(side_effect=list(responses))
+        with patch(
+            "fiction_translator.llm.providers.get_llm_provider", return_value=provider,
+        ):
+            result = await combined_analysis_node(state)
+        return result, provider
+
+    async def test_single_call_returns_review_and_suggestions(self):
+        result, provider = await self._run(_state(), _response(flag_id=1))
+
+        assert provider.generate_json.await_count == 1
+        prompt = provider.generate_json.call_args.kwargs["prompt"]
+        assert "persona_updates" in prompt and "relationship_updates" in prompt
+
+        assert result["review_passed"] is False
+        assert result["review_iteration"] == 1
+        assert result["flagged_segments"] == [1]
+        [persona] = result["persona_suggestions"]
+        assert (persona["persona_id"], persona["field"]) == (1, "personality")
+        [rel] = result["relationship_suggestions"]
+        assert (rel["persona_id_1"], rel["persona_id_2"], rel["intimacy_level"]) == (1, 2, 10)
+
+    async def test_merges_chunks_keeping_most_confident(self):
+        result, provider = await self._run(
+            _state(n=45, review_token_budget=1200), _response(confidence=0.5), _response(confidence=0.8),
+        )
+
+        assert provider.generate_json.await_count == 2
+        [persona] = result["persona_suggestions"]
+        assert persona["confidence"] == 0.8
+        [rel] = result["relationship_suggestions"]
+        assert rel["confidence"] == 0.8
+
+    async def test_without_characters_only_reviews(self):
+        result, provider = await self._run(
+            _state(detected_characters=[]), _response(),
+        )
+
+        prompt = provider.generate_json.call_args.kwargs["prompt"]
+        assert "persona_updates" not in prompt
+        # Without character tasks the fused prompt is exactly the review prompt
+        pairs = build_review_pairs(_state(detected_characters=[])["translated_segments"])
+        assert prompt == build_review_prompt(pairs, "ko", "en")
+        assert result["review_passed"] is True
+        assert result["persona_suggestions"] == []
+        assert result["relationship_suggestions"] == []
+
+    async def test_second_iteration_only_reviews_flagged(self):
+        earlier = {"persona_id": 2, "name": "Alice", "field": "personality",
+                   "value": "Calm", "confidence": 0.7}
+        state = _state(
+            review_iteration=1, flagged_segments=[1], persona_suggestions=[earlier],
+        )
+        result, provider = await self._run(state, _response())
+
+        prompt = provider.generate_json.call_args.kwargs["prompt"]
+        assert "t1" in prompt and "t0" not in prompt and "t2" not in prompt
+        assert result["review_iteration"] == 2
+        # Suggestions from the first iteration survive the re-review
+        assert {s["persona_id"] for s in result["persona_suggestions"]} == {1, 2}
+
+    async def test_failure_passes_through(self):
+        result, _ = await self._run(_state(), RuntimeError("boom"))
+        assert result["review_passed"] is True
+        assert result["persona_suggestions"] == []
+
+
+class TestShouldFuseAnalysis:
+    def test_defaults_to_separate_review(self):
+        assert should_fuse_analysis({}) == "review"
+
+    def test_flag_selects_fused_node(self):
+        assert should_fuse_analysis({"fused_analysis": True}) == "analyse"
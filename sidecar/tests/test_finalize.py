@@ -0,0 +1,331 @@
+"""Tests for pipeline/graph.py: the DB-backed stages and the compiled graph cache."""
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from fiction_translator.db.models import (
+    Base,
+    Chapter,
+    CharacterRelationship,
+    GlossaryEntry,
+    Persona,
+    PersonaSuggestion,
+    Project,
+    Segment,
+    Translation,
+    TranslationBatch,
+)
+from fiction_translator.pipeline.graph import (
+    _build_connected_text,
+    finalize_node,
+    load_context_node,
+)
+
+
+def _segments():
+    return [
+        {"order": 0, "text": "가", "source_start_offset": 0, "source_end_offset": 1,
+         "has_preceding_break": False},
+        {"order": 1, "text": "나", "source_start_offset": 3, "source_end_offset": 4,
+         "has_preceding_break": True},
+        {"order": 2, "text": "다", "source_start_offset": 5, "source_end_offset": 6,
+         "has_preceding_break": False},
+    ]
+
+
+class TestBuildConnectedText:
+    def test_joins_with_break_aware_separators(self):
+        translated = [
+            {"segment_id": 2, "translated_text": "C"},
+            {"segment_id": 0, "translated_text": "A"},
+            {"segment_id": 1, "translated_text": "B"},
+        ]
+        connected, segment_map = _build_connected_text(translated, _segments())
+        assert connected == "A\n\nB\nC"
+        assert [sm["segment_id"] for sm in segment_map] == [0, 1, 2]
+
+    def test_segment_map_offsets_slice_connected_text(self):
+        translated = [
+            {"segment_id": 0, "translated_text": "Alpha"},
+            {"segment_id": 1, "translated_text": "Beta"},
+            {"segment_id": 2, "translated_text": "Gamma"},
+        ]
+        connected, segment_map = _build_connected_text(translated, _segments())
+        for sm, expected in zip(segment_map, ["Alpha", "Beta", "Gamma"], strict=True):
+            assert connected[sm["translated_start"]:sm["translated_end"]] == expected
+
+    def test_carries_source_offsets(self):
+        translated = [{"segment_id": 1, "translated_text": "B"}]
+        _, segment_map = _build_connected_text(translated, _segments())
+        assert segment_map[0]["source_start"] == 3
+        assert segment_map[0]["source_end"] == 4
+
+    def test_empty_input(self):
+        assert _build_connected_text([], _segments()) == ("", [])
+
+    def test_unknown_segment_defaults_to_zero_offsets(self):
+        translated = [{"segment_id": 99, "translated_text": "X"}]
+        connected, segment_map = _build_connected_text(translated, _segments())
+        assert connected == "X"
+        assert segment_map[0]["source_start"] == 0
+        assert segment_map[0]["source_end"] == 0
+
+
+@pytest.fixture
+def engine():
+    """In-memory SQLite engine shared across sessions."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def _state(chapter_id, project_id):
+    return {
+        "chapter_id": chapter_id,
+        "project_id": project_id,
+        "target_language": "en",
+        "segments": _segments(),
+        "translated_segments": [
+            {"segment_id": 0, "translated_text": "A"},
+            {"segment_id": 1, "translated_text": "B"},
+            {"segment_id": 2, "translated_text": "C"},
+        ],
+        "batches": [
+            {"batch_order": 0, "segment_ids": [0, 1]},
+            {"batch_order": 1, "segment_ids": [2]},
+        ],
+    }
+
+
+@pytest.mark.asyncio
+class TestFinalizeNode:
+    async def _run(self, engine, state_overrides=None):
+        Session = sessionmaker(bind=engine)
+        with Session() as setup:
+            project = Project(name="P", source_language="ko", target_language="en")
+            setup.add(project)
+            setup.flush()
+            chapter = Chapter(project_id=project.id, title="C1", source_content="가\n\n나\n다")
+            setup.add(chapter)
+            setup.commit()
+            chapter_id, project_id = chapter.id, project.id
+
+        state = _state(chapter_id, project_id)
+        if state_overrides:
+            state.update(state_overrides)
+        with patch("fiction_translator.db.session.get_db", side_effect=Session):
+            result = await finalize_node(state)
+        return result, Session(), chapter_id
+
+    async def test_persists_segments_and_translations(self, engine):
+        result, db, chapter_id = await self._run(engine)
+        assert result["connected_translated_text"] == "A\n\nB\nC"
+
+        segments = db.query(Segment).filter(
+            Segment.chapter_id == chapter_id
+        ).order_by(Segment.order).all()
+        assert [s.source_text for s in segments] == ["가", "나", "다"]
+        texts = [s.translations[0].translated_text for s in segments]
+        assert texts == ["A", "B", "C"]
+        assert db.get(Chapter, chapter_id).translated_content == "A\n\nB\nC"
+
+    async def test_links_translations_to_batches(self, engine):
+        _, db, chapter_id = await self._run(engine)
+
+        batches = {
+            b.batch_order: b.id
+            for b in db.query(TranslationBatch).filter(
+                TranslationBatch.chapter_id == chapter_id
+            )
+        }
+        rows = db.query(Segment.order, Translation.batch_id).join(
+            Translation, Translation.segment_id == Segment.id
+        ).filter(Segment.chapter_id == chapter_id).order_by(Segment.order).all()
+        assert [batch_id for _, batch_id in rows] == [batches[0], batches[0], batches[1]]
+
+    async def test_rerun_replaces_previous_segments(self, engine):
+        _, db, chapter_id = await self._run(engine)
+        state = _state(chapter_id, db.get(Chapter, chapter_id).project_id)
+        db.close()
+
+        Session = sessionmaker(bind=engine)
+        with patch("fiction_translator.db.session.get_db", side_effect=Session):
+            await finalize_node(state)
+
+        with Session() as check:
+            assert check.query(Segment).filter(Segment.chapter_id == chapter_id).count() == 3
+            assert check.query(Translation).count() == 3
+
+    async def test_saves_unknown_terms_skipping_existing(self, engine):
+        Session = sessionmaker(bind=engine)
+        with Session() as setup:
+            project = Project(name="P", source_language="ko", target_language="en")
+            setup.add(project)
+            setup.flush()
+            setup.add(GlossaryEntry(
+                project_id=project.id, source_term="Dragon", translated_term="용",
+            ))
+            chapter = Chapter(project_id=project.id, title="C1", source_content="가")
+            setup.add(chapter)
+            setup.commit()
+            chapter_id, project_id = chapter.id, project.id
+
+        state = _state(chapter_id, project_id)
+        state["unknown_terms"] = [
+            {"source_term": "dragon", "translated_term": "Drake"},
+            {"source_term": "검", "translated_term": "Sword", "term_type": "item"},
+        ]
+        with patch("fiction_translator.db.session.get_db", side_effect=Session):
+            await finalize_node(state)
+
+        with Session() as check:
+            terms = {
+                e.source_term: e.auto_detected
+                for e in check.query(GlossaryEntry).filter(
+                    GlossaryEntry.project_id == project_id
+                )
+            }
+        assert terms == {"Dragon": False, "검": True}
+
+    async def test_persona_suggestions_create_and_apply(self, engine):
+        Session = sessionmaker(bind=engine)
+        with Session() as setup:
+            project = Project(name="P", source_language="ko", target_language="en")
+            setup.add(project)
+            setup.flush()
+            manual = Persona(project_id=project.id, name="Alice", auto_detected=False)
+            aliased = Persona(
+                project_id=project.id, name="Robert", aliases=["Bobby"], auto_detected=True,
+            )
+            setup.add_all([manual, aliased])
+            chapter = Chapter(project_id=project.id, title="C1", source_content="가")
+            setup.add(chapter)
+            setup.commit()
+            chapter_id, project_id = chapter.id, project.id
+            manual_id, aliased_id = manual.id, aliased.id
+
+        state = _state(chapter_id, project_id)
+        state["persona_suggestions"] = [
+            {"name": "alice", "field": "personality", "value": "Calm", "confidence": 0.9},
+            {"name": "bobby", "field": "speech_style", "value": "Curt"},
+            {"name": "Carol", "field": "formality_level", "value": "4", "confidence": 0.7},
+            {"name": "carol", "field": "aliases", "value": "Caz"},
+            {"name": "Dave", "persona_id": manual_id, "field": "speech_style", "value": "Dry"},
+        ]
+        with patch("fiction_translator.db.session.get_db", side_effect=Session):
+            await finalize_node(state)
+
+        with Session() as check:
+            personas = {
+                p.name: p for p in check.query(Persona).filter(Persona.project_id == project_id)
+            }
+            assert set(personas) == {"Alice", "Robert", "Carol"}
+            assert personas["Alice"].personality is None
+            assert personas["Robert"].speech_style == "Curt"
+            carol = personas["Carol"]
+            assert carol.auto_detected is True
+            assert carol.detection_confidence == 0.7
+            assert carol.formality_level == 4
+            assert carol.aliases == ["Caz"]
+
+            suggestions = sorted(
+                (s.persona_id, s.field_name, s.status)
+                for s in check.query(PersonaSuggestion)
+            )
+        assert suggestions == sorted([
+            (manual_id, "personality", "pending"),
+            (aliased_id, "speech_style", "auto_applied"),
+            (carol.id, "formality_level", "auto_applied"),
+            (carol.id, "aliases", "auto_applied"),
+            (manual_id, "speech_style", "pending"),
+        ])
+
+    async def test_saves_new_relationship_suggestions_once(self, engine):
+        Session = sessionmaker(bind=engine)
+        with Session() as setup:
+            project = Project(name="P", source_language="ko", target_language="en")
+            setup.add(project)
+            setup.flush()
+            a, b, c = (Persona(project_id=project.id, name=n) for n in "ABC")
+            setup.add_all([a, b, c])
+            setup.flush()
+            setup.add(CharacterRelationship(
+                project_id=project.id, persona_id_1=a.id, persona_id_2=b.id,
+            ))
+            chapter = Chapter(project_id=project.id, title="C1", source_content="가")
+            setup.add(chapter)
+            setup.commit()
+            chapter_id, project_id = chapter.id, project.id
+            ids = (a.id, b.id, c.id)
+
+        state = _state(chapter_id, project_id)
+        state["relationship_suggestions"] = [
+            {"persona_id_1": ids[1], "persona_id_2": ids[0]},  # already exists
+            {"persona_id_1": ids[2], "persona_id_2": ids[0], "relationship_type": "rival"},
+            {"persona_id_1": ids[0], "persona_id_2": ids[2]},  # duplicate pair
+            {"persona_id_1": ids[1], "persona_id_2": ids[1]},  # self-pair
+            {"persona_id_1": ids[1]},
+        ]
+        with patch("fiction_translator.db.session.get_db", side_effect=Session):
+            await finalize_node(state)
+
+        with Session() as check:
+            rels = sorted(
+                (r.persona_id_1, r.persona_id_2, r.relationship_type, r.auto_detected)
+                for r in check.query(CharacterRelationship)
+            )
+        assert rels == [
+            (ids[0], ids[1], "acquaintance", False),
+            (ids[0], ids[2], "rival", True),
+        ]
+
+
+@pytest.mark.asyncio
+class TestLoadContextNode:
+    async def test_loads_all_context(self, tmp_path):
+        # File-backed DB: concurrent reads each check out their own connection
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'ctx.db'}",
+            connect_args={"check_same_thread": False},
+        )
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine)
+        with Session() as setup:
+            project = Project(name="P", source_language="ko", target_language="en")
+            setup.add(project)
+            setup.flush()
+            setup.add(GlossaryEntry(
+                project_id=project.id, source_term="검", translated_term="Sword",
+            ))
+            setup.add(Persona(project_id=project.id, name="Bob"))
+            setup.commit()
+            project_id = project.id
+
+        with patch("fiction_translator.db.session.get_db", side_effect=Session):
+            result = await load_context_node({"project_id": project_id})
+
+        assert result["glossary"] == {"검": "Sword"}
+        assert [p["name"] for p in result["existing_personas"]] == ["Bob"]
+        assert list(result["persona_name_index"]) == ["bob"]
+        assert "Bob" in result["personas_context"]
+        assert result["existing_relationships"] == []
+        engine.dispose()
+
+
+class TestGetTranslationGraph:
+    def test_compiles_once_under_concurrent_first_calls(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from fiction_translator.pipeline import graph as graph_module
+
+        with patch.object(graph_module, "_compiled_graph", None):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(lambda _: graph_module.get_translation_graph(), range(8)))
+        assert all(r is results[0] for r in results)
@@ -260,3 +260,36 @@ class TestApiKeyStore:
         store = _ApiKeyStore()
         status = await store.get_status()
         assert status == {}
+
+
+@pytest.mark.asyncio
+class TestExportHandlers:
+    """Tests for export handler threading."""
+
+    async def test_export_runs_off_event_loop_with_own_session(self, monkeypatch):
+        """Test that exports run on a worker thread and close their session."""
+        import threading
+
+        from fiction_translator.ipc import handlers
+
+        closed = []
+        calls = []
+
+        class _FakeSession:
+            def close(self):
+                closed.append(True)
+
+        def fake_export(db, chapter_id, target_language):
+            calls.append((threading.get_ident(), chapter_id, target_language))
+            return {"path": "out.txt", "format": "txt"}
+
+        monkeypatch.setattr(handlers, "get_db", _FakeSession)
+        monkeypatch.setattr(handlers, "export_chapter_txt", fake_export)
+
+        result = await handlers.export_chapter_txt_handler(7, "ja")
+
+        assert result == {"path": "out.txt", "format": "txt"}
+        [(thread_id, chapter_id, target_language)] = calls
+        assert thread_id != threading.get_ident()
+        assert (chapter_id, target_language) == (7, "ja")
+        assert closed == [True]
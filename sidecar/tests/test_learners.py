@@ -0,0 +1,130 @@
+"""Tests for the persona and relationship learner nodes."""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from fiction_translator.pipeline.graph import learn_node
+from fiction_translator.pipeline.nodes._common import (
+    build_name_index,
+    join_translated_text,
+    persona_name_index,
+    segment_key,
+)
+
+
+class _Provider:
+    """Fake provider answering both learners and tracking overlap."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.prompts: list[str] = []
+
+    async def generate_json(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return {
+            "persona_updates": [
+                {"name": "bob", "field": "personality", "value": "Brave", "confidence": 0.9},
+            ],
+            "relationship_updates": [
+                {"character_1": "Bob", "character_2": "Al", "relationship_type": "friend",
+                 "intimacy_level": 12, "confidence": 0.8},
+            ],
+        }
+
+
+def _state():
+    return {
+        "api_keys": {"gemini": "k"},
+        "translated_segments": [
+            {"segment_id": 1, "translated_text": "Second"},
+            {"segment_id": 0, "translated_text": "First"},
+            {"segment_id": 2, "translated_text": ""},
+        ],
+        "detected_characters": [{"name": "Bob"}],
+        "existing_personas": [
+            {"id": 1, "name": "Bob", "aliases": None},
+            {"id": 2, "name": "Alice", "aliases": ["Al"]},
+        ],
+    }
+
+
+class TestSegmentKey:
+    def test_prefers_segment_id(self):
+        assert segment_key({"segment_id": 0, "order": 5}) == 0
+
+    def test_falls_back_to_order(self):
+        assert segment_key({"order": 5}) == 5
+        assert segment_key({}) == 0
+
+
+class TestJoinTranslatedText:
+    def test_sorts_and_skips_empty(self):
+        assert join_translated_text(_state()["translated_segments"]) == "First\nSecond"
+
+    def test_falls_back_to_order(self):
+        segs = [{"order": 2, "translated_text": "b"}, {"order": 1, "translated_text": "a"}]
+        assert join_translated_text(segs) == "a\nb"
+
+    def test_already_sorted_input(self):
+        segs = [{"segment_id": i, "translated_text": t} for i, t in enumerate("abc")]
+        assert join_translated_text(segs) == "a\nb\nc"
+
+
+class TestBuildNameIndex:
+    def test_indexes_names_and_aliases_case_insensitively(self):
+        index = build_name_index(_state()["existing_personas"])
+        assert index == {"bob": 1, "alice": 2, "al": 2}
+
+    def test_first_persona_wins_on_collision(self):
+        personas = [
+            {"id": 1, "name": "Kim", "aliases": ["Boss"]},
+            {"id": 2, "name": "Boss"},
+        ]
+        assert build_name_index(personas)["boss"] == 1
+
+    def test_skips_empty_names(self):
+        assert build_name_index([{"id": 1, "aliases": [""]}]) == {}
+
+
+class TestPersonaNameIndex:
+    def test_reuses_index_from_state(self):
+        index = {"bob": 9}
+        assert persona_name_index({**_state(), "persona_name_index": index}) is index
+
+    def test_builds_index_when_absent(self):
+        assert persona_name_index(_state())["al"] == 2
+
+
+@pytest.mark.asyncio
+class TestLearnNode:
+    async def test_runs_both_learners_concurrently(self):
+        provider = _Provider()
+        with patch(
+            "fiction_translator.llm.providers.get_llm_provider", return_value=provider,
+        ):
+            result = await learn_node(_state())
+
+        assert provider.max_in_flight == 2
+        assert all("First\nSecond" in prompt for prompt in provider.prompts)
+
+        [persona] = result["persona_suggestions"]
+        assert (persona["persona_id"], persona["value"]) == (1, "Brave")
+        [rel] = result["relationship_suggestions"]
+        assert (rel["persona_id_1"], rel["persona_id_2"]) == (1, 2)
+        assert rel["intimacy_level"] == 10
+
+    async def test_uses_text_joined_by_translator(self):
+        provider = _Provider()
+        state = {**_state(), "translated_text_joined": "Precomputed"}
+        with patch(
+            "fiction_translator.llm.providers.get_llm_provider", return_value=provider,
+        ):
+            await learn_node(state)
+
+        assert all("Precomputed" in prompt for prompt in provider.prompts)
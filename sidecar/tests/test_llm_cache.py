@@ -0,0 +1,125 @@
+"""Tests for the persistent LLM response cache."""
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from fiction_translator.db.models import Base, LLMCacheEntry
+from fiction_translator.llm.cache import (
+    CACHE_TTL,
+    cache_key,
+    cached_generate_json,
+    cached_generate_json_with_hit,
+)
+
+
+@pytest.fixture
+def Session():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    with patch("fiction_translator.db.session.get_db", side_effect=factory):
+        yield factory
+
+
+def _provider(response):
+    provider = MagicMock()
+    provider.model = "test-model"
+    provider.generate_json = AsyncMock(return_value=response)
+    return provider
+
+
+class TestCacheKey:
+    def test_stable_and_parameter_sensitive(self):
+        key = cache_key("m", "p", temperature=0.2, max_tokens=10)
+        assert key == cache_key("m", "p", max_tokens=10, temperature=0.2)
+        assert key != cache_key("m", "p", temperature=0.3, max_tokens=10)
+        assert key != cache_key("other", "p", temperature=0.2, max_tokens=10)
+        assert key != cache_key("m", "q", temperature=0.2, max_tokens=10)
+
+    def test_ignores_prompt_cache_hint(self):
+        assert cache_key("m", "p", cache_key="seg:ko") == cache_key("m", "p")
+
+
+@pytest.mark.asyncio
+class TestCachedGenerateJSON:
+    async def test_second_call_is_served_from_cache(self, Session):
+        provider = _provider({"ok": 1})
+        first = await cached_generate_json(provider, prompt="p", temperature=0.2)
+        second = await cached_generate_json(provider, prompt="p", temperature=0.2)
+
+        assert first == second == {"ok": 1}
+        provider.generate_json.assert_awaited_once_with(prompt="p", temperature=0.2)
+        with Session() as db:
+            assert db.query(LLMCacheEntry).one().model == "test-model"
+
+    async def test_reports_cache_hits(self, Session):
+        provider = _provider({"ok": 1})
+        assert await cached_generate_json_with_hit(provider, "p") == ({"ok": 1}, False)
+        assert await cached_generate_json_with_hit(provider, "p") == ({"ok": 1}, True)
+        assert await cached_generate_json_with_hit(
+            provider, "p", enabled=False,
+        ) == ({"ok": 1}, False)
+
+    async def test_different_prompt_misses(self, Session):
+        provider = _provider({"ok": 1})
+        await cached_generate_json(provider, prompt="p")
+        await cached_generate_json(provider, prompt="q")
+        assert provider.generate_json.await_count == 2
+
+    async def test_disabled_bypasses_cache(self, Session):
+        provider = _provider({"ok": 1})
+        await cached_generate_json(provider, prompt="p", enabled=False)
+        await cached_generate_json(provider, prompt="p", enabled=False)
+        assert provider.generate_json.await_count == 2
+        with Session() as db:
+            assert db.query(LLMCacheEntry).count() == 0
+
+    async def test_cache_errors_fall_back_to_provider(self):
+        provider = _provider({"ok": 1})
+        with patch(
+            "fiction_translator.db.session.get_db", side_effect=RuntimeError("no db"),
+        ):
+            assert await cached_generate_json(provider, prompt="p") == {"ok": 1}
+
+    async def test_rejected_response_is_not_stored(self, Session):
+        provider = _provider({"ok": 0})
+        await cached_generate_json(provider, prompt="p", cache_if=lambda r: r["ok"])
+        await cached_generate_json(provider, prompt="p", cache_if=lambda r: r["ok"])
+        assert provider.generate_json.await_count == 2
+        with Session() as db:
+            assert db.query(LLMCacheEntry).count() == 0
+
+    async def test_expired_entry_misses_and_is_evicted(self, Session):
+        provider = _provider({"ok": 1})
+        await cached_generate_json(provider, prompt="p")
+        with Session() as db:
+            db.query(LLMCacheEntry).update(
+                {"created_at": datetime.utcnow() - CACHE_TTL * 2},
+            )
+            db.commit()
+
+        # Storing another entry evicts the expired one
+        await cached_generate_json(provider, prompt="q")
+        with Session() as db:
+            assert db.query(LLMCacheEntry).count() == 1
+
+        await cached_generate_json(provider, prompt="p")
+        assert provider.generate_json.await_count == 3
+
+    async def test_row_cap_evicts_oldest(self, Session):
+        provider = _provider({"ok": 1})
+        with patch("fiction_translator.llm.cache.CACHE_MAX_ENTRIES", 2):
+            for prompt in ("a", "b", "c"):
+                await cached_generate_json(provider, prompt=prompt)
+            await cached_generate_json(provider, prompt="a")
+        assert provider.generate_json.await_count == 4
+        with Session() as db:
+            assert db.query(LLMCacheEntry).count() == 2
@@ -44,6 +44,14 @@ class TestSplitParagraphs:
         assert len(result) == 2
         assert result[1][2] is True
 
+    def test_offsets_point_at_stripped_text(self):
+        text = "\n\n  Para 1  \n\n\tPara 2\n"
+        result = _split_paragraphs(text)
+        assert [r[0] for r in result] == ["Para 1", "Para 2"]
+        for stripped, offset, _ in result:
+            assert text[offset:offset + len(stripped)] == stripped
+        assert result[0][2] is False
+
 
 class TestRuleBasedSegment:
     def test_preserves_has_preceding_break(self):
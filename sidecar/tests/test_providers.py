@@ -6,11 +6,15 @@ import httpx
 import pytest
 
 from fiction_translator.llm.providers import (
+    RETRY_MAX_DELAY,
     ClaudeProvider,
     GeminiProvider,
     LLMResponse,
     OpenAIProvider,
+    _retry_delay,
+    close_http_client,
     get_available_providers,
+    get_http_client,
     get_llm_provider,
 )
 
@@ -210,6 +214,65 @@ class TestGenerateJSON:
         assert "Respond with valid JSON only" in call_args.kwargs["system_prompt"]
 
 
+@pytest.mark.asyncio
+class TestSharedHTTPClient:
+    """Tests for the pooled HTTP client shared by providers."""
+
+    async def test_reused_within_event_loop(self):
+        client = get_http_client()
+        try:
+            assert get_http_client() is client
+        finally:
+            await close_http_client()
+        assert client.is_closed
+
+    async def test_recreated_after_close(self):
+        client = get_http_client()
+        await close_http_client()
+        replacement = get_http_client()
+        try:
+            assert replacement is not client
+        finally:
+            await close_http_client()
+
+
+@pytest.mark.asyncio
+class TestPromptCacheKey:
+    """Tests for forwarding prompt cache keys to providers."""
+
+    async def _post_payload(self, provider, **kwargs):
+        mock_response = MagicMock()
+        mock_response.json.return_value = {
+            "choices": [{"message": {"content": "ok"}}],
+            "usage": {},
+        }
+        with patch("fiction_translator.llm.providers.get_http_client") as mock_client:
+            client = MagicMock()
+            post = AsyncMock(return_value=mock_response)
+            client.post = post
+            mock_client.return_value = client
+            await provider.generate("test prompt", **kwargs)
+        return post.call_args.kwargs["json"]
+
+    async def test_openai_sends_prompt_cache_key(self):
+        provider = OpenAIProvider(api_key="test-key")
+        payload = await self._post_payload(provider, cache_key="segmentation:ko")
+        assert payload["prompt_cache_key"] == "segmentation:ko"
+
+    async def test_openai_omits_prompt_cache_key_by_default(self):
+        provider = OpenAIProvider(api_key="test-key")
+        payload = await self._post_payload(provider)
+        assert "prompt_cache_key" not in payload
+
+    async def test_generate_json_forwards_cache_key(self):
+        provider = GeminiProvider(api_key="test-key")
+        provider.generate = AsyncMock(
+            return_value=LLMResponse(text="{}", model="test", usage={})
+        )
+        await provider.generate_json("test prompt", cache_key="k")
+        assert provider.generate.call_args.kwargs["cache_key"] == "k"
+
+
 @pytest.mark.asyncio
 class TestRetryLogic:
     """Tests for LLM provider retry logic."""
@@ -231,12 +294,12 @@ class TestRetryLogic:
             "usageMetadata": {},
         }
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_context = AsyncMock()
-            mock_context.__aenter__.return_value.post = AsyncMock(
+        with patch("fiction_translator.llm.providers.get_http_client") as mock_client:
+            client = MagicMock()
+            client.post = AsyncMock(
                 side_effect=[mock_response_429, mock_response_success]
             )
-            mock_client.return_value = mock_context
+            mock_client.return_value = client
 
             # Should succeed after retry
             result = await provider.generate("test prompt")
@@ -252,17 +315,17 @@ class TestRetryLogic:
             "Bad request", request=MagicMock(), response=mock_response
         )
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_context = AsyncMock()
-            mock_context.__aenter__.return_value.post = AsyncMock(side_effect=error)
-            mock_client.return_value = mock_context
+        with patch("fiction_translator.llm.providers.get_http_client") as mock_client:
+            client = MagicMock()
+            client.post = AsyncMock(side_effect=error)
+            mock_client.return_value = client
 
             # Should raise immediately without retry
             with pytest.raises(httpx.HTTPStatusError):
                 await provider.generate("test prompt")
 
             # Should only be called once (no retries)
-            assert mock_context.__aenter__.return_value.post.call_count == 1
+            assert client.post.call_count == 1
 
     async def test_does_not_retry_on_404_not_found(self):
         """Test that 404 status does not trigger retry."""
@@ -274,16 +337,16 @@ class TestRetryLogic:
             "Not found", request=MagicMock(), response=mock_response
         )
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_context = AsyncMock()
-            mock_context.__aenter__.return_value.post = AsyncMock(side_effect=error)
-            mock_client.return_value = mock_context
+        with patch("fiction_translator.llm.providers.get_http_client") as mock_client:
+            client = MagicMock()
+            client.post = AsyncMock(side_effect=error)
+            mock_client.return_value = client
 
             with pytest.raises(httpx.HTTPStatusError):
                 await provider.generate("test prompt")
 
             # Should only be called once (no retries)
-            assert mock_context.__aenter__.return_value.post.call_count == 1
+            assert client.post.call_count == 1
 
     async def test_retries_on_500_server_error(self):
         """Test that 500 status triggers retry."""
@@ -295,47 +358,72 @@ class TestRetryLogic:
             "Server error", request=MagicMock(), response=mock_response_500
         )
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_context = AsyncMock()
-            mock_context.__aenter__.return_value.post = AsyncMock(side_effect=error)
-            mock_client.return_value = mock_context
+        with patch("fiction_translator.llm.providers.get_http_client") as mock_client:
+            client = MagicMock()
+            client.post = AsyncMock(side_effect=error)
+            mock_client.return_value = client
 
             with pytest.raises(httpx.HTTPStatusError):
                 await provider.generate("test prompt")
 
             # Should retry (3 attempts total)
-            assert mock_context.__aenter__.return_value.post.call_count == 3
+            assert client.post.call_count == 3
 
     async def test_retries_on_connection_error(self):
         """Test that connection errors trigger retry."""
         provider = GeminiProvider(api_key="test-key", model="test-model")
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_context = AsyncMock()
-            mock_context.__aenter__.return_value.post = AsyncMock(
+        with patch("fiction_translator.llm.providers.get_http_client") as mock_client:
+            client = MagicMock()
+            client.post = AsyncMock(
                 side_effect=httpx.ConnectError("Connection failed")
             )
-            mock_client.return_value = mock_context
+            mock_client.return_value = client
 
             with pytest.raises(httpx.ConnectError):
                 await provider.generate("test prompt")
 
             # Should retry (3 attempts total)
-            assert mock_context.__aenter__.return_value.post.call_count == 3
+            assert client.post.call_count == 3
 
     async def test_retries_on_timeout(self):
         """Test that timeout errors trigger retry."""
         provider = GeminiProvider(api_key="test-key", model="test-model")
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_context = AsyncMock()
-            mock_context.__aenter__.return_value.post = AsyncMock(
+        with patch("fiction_translator.llm.providers.get_http_client") as mock_client:
+            client = MagicMock()
+            client.post = AsyncMock(
                 side_effect=httpx.ReadTimeout("Timeout")
             )
-            mock_client.return_value = mock_context
+            mock_client.return_value = client
 
             with pytest.raises(httpx.ReadTimeout):
                 await provider.generate("test prompt")
 
             # Should retry (3 attempts total)
-            assert mock_context.__aenter__.return_value.post.call_count == 3
+            assert client.post.call_count == 3
+
+
+class TestRetryDelay:
+    """Tests for the retry backoff schedule."""
+
+    def _status_error(self, headers):
+        response = httpx.Response(429, headers=headers)
+        return httpx.HTTPStatusError("Rate limit", request=MagicMock(), response=response)
+
+    def test_exponential_with_jitter(self):
+        with patch("fiction_translator.llm.providers.random.uniform", return_value=0.5):
+            assert _retry_delay(0) == 1.5
+            assert _retry_delay(2) == 4.5
+
+    def test_capped(self):
+        assert _retry_delay(10) == RETRY_MAX_DELAY
+
+    def test_honours_retry_after_seconds(self):
+        assert _retry_delay(0, self._status_error({"retry-after": "7"})) == 7.0
+        assert _retry_delay(0, self._status_error({"retry-after": "600"})) == RETRY_MAX_DELAY
+
+    def test_ignores_http_date_retry_after(self):
+        error = self._status_error({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        with patch("fiction_translator.llm.providers.random.uniform", return_value=0.0):
+            assert _retry_delay(1, error) == 2.0
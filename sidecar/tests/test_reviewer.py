@@ -0,0 +1,167 @@
+"""Tests for the reviewer node."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from fiction_translator.pipeline.nodes._common import pack_by_tokens
+from fiction_translator.pipeline.nodes.reviewer import reviewer_node
+
+
+def _translated(n):
+    return [
+        {"segment_id": i, "source_text": f"s{i}", "translated_text": f"t{i}"}
+        for i in range(n)
+    ]
+
+
+class _SlowProvider:
+    """Fake provider that records how many calls overlap."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+
+    async def generate_json(self, prompt, **kwargs):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return {"overall_passed": True, "segment_reviews": []}
+
+
+class TestPackByTokens:
+    def _pairs(self, *lengths):
+        return [
+            {"segment_id": i, "source_text": "x" * n, "translated_text": "y" * n}
+            for i, n in enumerate(lengths)
+        ]
+
+    def test_packs_short_pairs_into_one_chunk(self):
+        chunks = pack_by_tokens(self._pairs(*[3] * 50))
+        assert [len(c) for c in chunks] == [50]
+
+    def test_splits_when_budget_is_exceeded(self):
+        # Each pair estimates to 100 // 3 * 2 + 40 = 106 tokens
+        chunks = pack_by_tokens(self._pairs(*[100] * 5), budget=250)
+        assert [len(c) for c in chunks] == [2, 2, 1]
+        assert [p["segment_id"] for c in chunks for p in c] == list(range(5))
+
+    def test_oversized_pair_gets_its_own_chunk(self):
+        chunks = pack_by_tokens(self._pairs(3, 3000, 3), budget=500)
+        assert [len(c) for c in chunks] == [1, 1, 1]
+
+    def test_caps_pairs_per_chunk(self):
+        chunks = pack_by_tokens(self._pairs(*[0] * 5), max_pairs=2)
+        assert [len(c) for c in chunks] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+class TestReviewerNode:
+    async def _run(self, provider, state):
+        with patch(
+            "fiction_translator.llm.providers.get_llm_provider", return_value=provider,
+        ):
+            return await reviewer_node(state)
+
+    async def test_chunks_are_reviewed_concurrently_within_limit(self):
+        provider = _SlowProvider()
+        state = {
+            "api_keys": {"gemini": "k"},
+            "translated_segments": _translated(95),
+            "review_concurrency": 2,
+            # 40 estimated tokens per short pair -> 30 pairs per chunk
+            "review_token_budget": 1200,
+        }
+        result = await self._run(provider, state)
+        assert provider.calls == 4
+        assert provider.max_in_flight == 2
+        assert result["review_passed"] is True
+        assert result["review_iteration"] == 1
+
+    async def test_merges_flags_from_all_chunks_in_order(self):
+        provider = MagicMock()
+        responses = [
+            {"overall_passed": False, "segment_reviews": [
+                {"segment_id": 3, "verdict": "flag", "issue": "a", "suggestion": "x"},
+                {"segment_id": 4, "verdict": "pass"},
+            ]},
+            {"overall_passed": True, "segment_reviews": []},
+            {"overall_passed": False, "segment_reviews": [
+                {"segment_id": 61, "verdict": "flag", "issue": "b"},
+            ]},
+        ]
+
+        async def generate_json(prompt, **kwargs):
+            # Finish out of order to make sure results keep chunk order
+            index = len(started)
+            started.append(index)
+            await asyncio.sleep(0.01 * (3 - index))
+            return responses[index]
+
+        started: list[int] = []
+        provider.generate_json = generate_json
+        state = {
+            "api_keys": {"gemini": "k"},
+            "translated_segments": _translated(65),
+            "review_token_budget": 1200,
+        }
+        result = await self._run(provider, state)
+
+        assert result["review_passed"] is False
+        assert result["flagged_segments"] == [3, 61]
+        assert result["review_feedback"][0] == {
+            "segment_id": 3, "issue": "a", "suggestion": "x",
+        }
+
+    async def test_later_iterations_only_review_previously_flagged(self):
+        provider = MagicMock()
+        provider.generate_json = AsyncMock(
+            return_value={"overall_passed": True, "segment_reviews": []},
+        )
+        state = {
+            "api_keys": {"gemini": "k"},
+            "translated_segments": _translated(10),
+            "review_iteration": 1,
+            "flagged_segments": [2, 7],
+        }
+        result = await self._run(provider, state)
+
+        prompt = provider.generate_json.call_args.kwargs["prompt"]
+        assert "t2" in prompt and "t7" in prompt
+        assert "t3" not in prompt
+        assert result["review_iteration"] == 2
+
+    async def test_repeated_lines_are_reviewed_once(self):
+        provider = MagicMock()
+        provider.generate_json = AsyncMock(return_value={
+            "overall_passed": False,
+            "segment_reviews": [{"segment_id": 0, "verdict": "flag", "issue": "tone"}],
+        })
+        segs = [
+            {"segment_id": i, "source_text": "네.", "translated_text": "Yes."}
+            for i in range(3)
+        ]
+        segs.append({"segment_id": 3, "source_text": "네.", "translated_text": ""})
+        state = {"api_keys": {"gemini": "k"}, "translated_segments": segs}
+        result = await self._run(provider, state)
+
+        prompt = provider.generate_json.call_args.kwargs["prompt"]
+        assert prompt.count("Yes.") == 1
+        assert result["flagged_segments"] == [0, 1, 2]
+        assert [fb["segment_id"] for fb in result["review_feedback"]] == [0, 1, 2]
+        assert result["review_feedback"][2]["issue"] == "tone"
+
+    async def test_chunk_failure_passes_through(self):
+        provider = MagicMock()
+
+        async def generate_json(prompt, **kwargs):
+            raise RuntimeError("boom")
+
+        provider.generate_json = generate_json
+        state = {"api_keys": {"gemini": "k"}, "translated_segments": _translated(5)}
+        result = await self._run(provider, state)
+        assert result["review_passed"] is True
+        assert result["flagged_segments"] == []
@@ -0,0 +1,202 @@
+"""Tests for the segmenter node."""
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from fiction_translator.db.models import Base, LLMCacheEntry
+from fiction_translator.pipeline.nodes.segmenter import (
+    _parse_llm_segments,
+    _rule_based_segment,
+    segmenter_node,
+)
+from fiction_translator.pipeline.nodes.validator import validator_node
+
+
+def _types(text, lang="en"):
+    return [(s["type"], s["speaker"]) for s in _rule_based_segment(text, lang)]
+
+
+class TestClassification:
+    def test_dialogue_with_speaker(self):
+        assert _types('"Hello there," said Bob') == [("dialogue", "Bob")]
+
+    def test_dialogue_without_speaker(self):
+        assert _types('"Hello there."') == [("dialogue", None)]
+
+    def test_thought_markers(self):
+        text = "‘I wonder.’\n\n(Maybe not.)\n\n【Hmm】"
+        assert _types(text) == [("thought", None)] * 3
+
+    def test_narrative(self):
+        assert _types("The rain kept falling.") == [("narrative", None)]
+
+    def test_korean_dialogue(self):
+        assert _types("“안녕”", "ko") == [("dialogue", None)]
+
+    def test_unknown_language_falls_back_to_english(self):
+        assert _types('"Hi," said Bob', "fr") == [("dialogue", "Bob")]
+
+
+class TestParseLLMSegments:
+    def test_locates_segments_in_order(self):
+        source = "Hi. Bye. Hi."
+        segs = _parse_llm_segments(
+            [{"text": "Hi."}, {"text": "Hi.", "type": "dialogue"}], source,
+        )
+        assert [(s["source_start_offset"], s["source_end_offset"]) for s in segs] == [
+            (0, 3), (9, 12),
+        ]
+        assert segs[1]["type"] == "dialogue"
+
+    def test_prefix_fallback_for_paraphrased_long_segment(self):
+        head = "x" * 50
+        source = f"{head} original ending."
+        [seg] = _parse_llm_segments([{"text": f"{head} reworded ending."}], source)
+        assert seg["source_start_offset"] == 0
+
+    def test_prefers_later_exact_match_over_earlier_prefix_match(self):
+        head = "y" * 50
+        source = f"{head} A. {head} B."
+        [seg] = _parse_llm_segments([{"text": f"{head} B."}], source)
+        assert source[seg["source_start_offset"]:seg["source_end_offset"]] == f"{head} B."
+
+    def test_unlocatable_segment_uses_search_start(self):
+        segs = _parse_llm_segments([{"text": "abc"}, {"text": "zzz"}], "abcdef")
+        assert segs[1]["source_start_offset"] == 3
+
+
+@pytest.mark.asyncio
+class TestLLMSegmentationGate:
+    async def _run(self, source_text, **state):
+        provider = MagicMock()
+        provider.generate_json = AsyncMock(return_value={"segments": []})
+        with patch(
+            "fiction_translator.llm.providers.get_llm_provider", return_value=provider,
+        ):
+            result = await segmenter_node({
+                "source_text": source_text,
+                "source_language": "ko",
+                "api_keys": {"gemini": "k"},
+                **state,
+            })
+        return provider, result
+
+    async def test_auto_refines_short_text_with_cache_key(self):
+        provider, result = await self._run("짧은 글.")
+        provider.generate_json.assert_awaited_once()
+        kwargs = provider.generate_json.call_args.kwargs
+        assert kwargs["cache_key"] == "segmentation:ko"
+        assert [s["text"] for s in result["segments"]] == ["짧은 글."]
+
+    async def test_auto_skips_long_text(self):
+        provider, _ = await self._run("가" * 10000)
+        provider.generate_json.assert_not_awaited()
+
+    async def test_off_skips_llm(self):
+        provider, _ = await self._run("짧은 글.", llm_segmentation="off")
+        provider.generate_json.assert_not_awaited()
+
+    async def test_on_forces_llm_for_long_text(self):
+        provider, _ = await self._run("가" * 10000, llm_segmentation="on")
+        provider.generate_json.assert_awaited_once()
+
+
+@pytest.fixture
+def Session():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    with patch("fiction_translator.db.session.get_db", side_effect=factory):
+        yield factory
+
+
+async def _segment_and_validate(state):
+    result = await segmenter_node(state)
+    await validator_node({**state, **result})
+    return result
+
+
+@pytest.mark.asyncio
+class TestSegmentationCache:
+    async def test_rerun_reuses_validated_segments(self, Session):
+        state = {"source_text": "One.\n\nTwo.", "source_language": "en", "use_llm_cache": True}
+        first = await _segment_and_validate(state)
+        with patch(
+            "fiction_translator.pipeline.nodes.segmenter._rule_based_segment",
+        ) as segment:
+            second = await segmenter_node(state)
+
+        segment.assert_not_called()
+        assert second["segments"] == first["segments"]
+        assert second["segmentation_cache_key"] is None
+
+    async def test_not_stored_before_validation(self, Session):
+        state = {"source_text": "One.", "source_language": "en", "use_llm_cache": True}
+        await segmenter_node(state)
+        with Session() as db:
+            assert db.query(LLMCacheEntry).count() == 0
+
+    async def test_failed_validation_is_not_stored(self, Session):
+        state = {"source_text": "One.", "source_language": "en", "use_llm_cache": True}
+        result = await segmenter_node(state)
+        await validator_node({**state, **result, "segments": [{"text": ""}]})
+        with Session() as db:
+            assert db.query(LLMCacheEntry).count() == 0
+
+    async def test_re_segment_bypasses_cache(self, Session):
+        state = {"source_text": "One.", "source_language": "en", "use_llm_cache": True}
+        await _segment_and_validate(state)
+        with patch(
+            "fiction_translator.pipeline.nodes.segmenter._rule_based_segment",
+            return_value=[],
+        ) as segment:
+            await segmenter_node({**state, "validation_attempts": 1})
+        segment.assert_called_once()
+
+    async def test_changed_text_misses(self, Session):
+        state = {"source_language": "en", "use_llm_cache": True}
+        await _segment_and_validate({**state, "source_text": "One."})
+        result = await segmenter_node({**state, "source_text": "Two."})
+        assert [s["text"] for s in result["segments"]] == ["Two."]
+
+    async def test_key_includes_model(self, Session):
+        state = {
+            "source_text": "짧은 글.",
+            "source_language": "ko",
+            "api_keys": {"gemini": "k"},
+            "use_llm_cache": True,
+        }
+        keys = []
+        for model in ("model-a", "model-b"):
+            provider = MagicMock(model=model)
+            provider.generate_json = AsyncMock(return_value={"segments": []})
+            with patch(
+                "fiction_translator.llm.providers.get_llm_provider", return_value=provider,
+            ):
+                keys.append((await _segment_and_validate(state))["segmentation_cache_key"])
+            provider.generate_json.assert_awaited_once()
+        assert keys[0] != keys[1]
+
+    async def test_llm_failure_is_not_cached(self, Session):
+        provider = MagicMock()
+        provider.generate_json = AsyncMock(side_effect=RuntimeError("boom"))
+        state = {
+            "source_text": "짧은 글.",
+            "source_language": "ko",
+            "api_keys": {"gemini": "k"},
+            "use_llm_cache": True,
+        }
+        with patch(
+            "fiction_translator.llm.providers.get_llm_provider", return_value=provider,
+        ):
+            result = await _segment_and_validate(state)
+            await _segment_and_validate(state)
+        assert result["segmentation_cache_key"] is None
+        assert provider.generate_json.await_count == 2
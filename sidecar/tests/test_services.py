@@ -1,23 +1,46 @@
 """Tests for CRUD service layer."""
+from pathlib import Path
+
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from fiction_translator.db.models import Base, Chapter, GlossaryEntry, Project
+from fiction_translator.db.models import (
+    Base,
+    Chapter,
+    GlossaryEntry,
+    PersonaSuggestion,
+    Project,
+    Segment,
+    Translation,
+    TranslationStatus,
+)
 from fiction_translator.services.chapter_service import (
     create_chapter,
     delete_chapter,
     get_chapter,
+    get_editor_data,
     list_chapters,
     update_chapter,
 )
+from fiction_translator.services.export_service import export_chapter_txt, list_exports
 from fiction_translator.services.glossary_service import (
+    bulk_import,
     create_glossary_entry,
     delete_glossary_entry,
+    get_glossary_map,
     list_glossary,
     update_glossary_entry,
 )
+from fiction_translator.services.persona_service import (
+    apply_suggestion,
+    apply_suggestions,
+    create_persona,
+    get_persona,
+    get_personas_context,
+)
 from fiction_translator.services.project_service import (
     create_project,
     delete_project,
@@ -25,6 +48,13 @@ from fiction_translator.services.project_service import (
     list_projects,
     update_project,
 )
+from fiction_translator.services.relationship_service import (
+    create_relationship,
+    delete_relationship,
+    get_relationships_context,
+    update_relationship,
+)
+from fiction_translator.services.segment_service import retranslate_segments
 
 
 @pytest.fixture
@@ -94,14 +124,18 @@ class TestProjectService:
         create_chapter(db, p1["id"], "Chapter 1")
         create_chapter(db, p1["id"], "Chapter 2")
         create_chapter(db, p2["id"], "Chapter 1")
+        create_project(db, name="Project 3")
 
         projects = list_projects(db)
+        assert len(projects) == 3
         # Find projects by name
         project1 = next(p for p in projects if p["name"] == "Project 1")
         project2 = next(p for p in projects if p["name"] == "Project 2")
+        project3 = next(p for p in projects if p["name"] == "Project 3")
 
         assert project1["chapter_count"] == 2
         assert project2["chapter_count"] == 1
+        assert project3["chapter_count"] == 0
 
     def test_get_project(self, db):
         created = create_project(db, name="Test Project")
@@ -129,6 +163,34 @@ class TestProjectService:
         assert updated["description"] == "New description"
         assert updated["genre"] == "sci-fi"
 
+    def test_create_and_update_skip_reselect(self, db):
+        statements = []
+        event.listen(
+            db.get_bind(), "before_cursor_execute",
+            lambda conn, cursor, stmt, *args: statements.append(stmt.split()[0]),
+        )
+
+        project = create_project(db, name="Round Trips")
+        assert statements == ["INSERT"]
+        assert project["created_at"] is not None
+        assert project["updated_at"] is not None
+
+        statements.clear()
+        update_project(db, project["id"], name="Renamed")
+        assert statements == ["SELECT", "UPDATE"]
+
+    def test_update_project_noop_skips_write(self, db):
+        project = create_project(db, name="Same", genre="fantasy")
+        statements = []
+        event.listen(
+            db.get_bind(), "before_cursor_execute",
+            lambda conn, cursor, stmt, *args: statements.append(stmt.split()[0]),
+        )
+
+        updated = update_project(db, project["id"], name="Same", genre="fantasy")
+        assert statements == ["SELECT"]
+        assert updated["updated_at"] == project["updated_at"]
+
     def test_update_project_whitelist_enforcement(self, db):
         """Test that only whitelisted fields can be updated."""
         project = create_project(db, name="Test Project")
@@ -227,6 +289,43 @@ class TestChapterService:
         assert chapters[1]["title"] == "Chapter 2"
         assert chapters[0]["segment_count"] == 0
         assert chapters[0]["translated_count"] == 0
+        # Content stays out of the listing
+        assert "source_content" not in chapters[0]
+
+    def test_list_chapters_paginated(self, db):
+        project = create_project(db, name="Test Project")
+        for i in range(5):
+            create_chapter(db, project["id"], f"Chapter {i + 1}")
+        ch3 = list_chapters(db, project["id"])[2]
+        db.add(Segment(chapter_id=ch3["id"], order=0, source_text="s"))
+        db.commit()
+
+        page = list_chapters(db, project["id"], limit=2, offset=2)
+        assert [c["title"] for c in page] == ["Chapter 3", "Chapter 4"]
+        assert [c["segment_count"] for c in page] == [1, 0]
+        assert list_chapters(db, project["id"], limit=2, offset=6) == []
+
+    def test_list_chapters_counts_per_chapter(self, db):
+        project = create_project(db, name="Test Project")
+        ch1 = create_chapter(db, project["id"], "Chapter 1", "Content 1")
+        ch2 = create_chapter(db, project["id"], "Chapter 2", "Content 2")
+        segs = [
+            Segment(chapter_id=ch1["id"], order=i, source_text=f"s{i}") for i in range(3)
+        ]
+        segs.append(Segment(chapter_id=ch2["id"], order=0, source_text="t"))
+        db.add_all(segs)
+        db.flush()
+        db.add_all([
+            Translation(segment_id=segs[0].id, target_language="en",
+                        translated_text="a", status=TranslationStatus.TRANSLATED),
+            Translation(segment_id=segs[1].id, target_language="en",
+                        translated_text="", status=TranslationStatus.PENDING),
+        ])
+        db.commit()
+
+        chapters = list_chapters(db, project["id"])
+        counts = [(c["segment_count"], c["translated_count"]) for c in chapters]
+        assert counts == [(3, 1), (1, 0)]
 
     def test_list_chapters_empty(self, db):
         project = create_project(db, name="Test Project")
@@ -299,6 +398,93 @@ class TestChapterService:
             delete_chapter(db, 999)
 
 
+class TestEditorData:
+    """Tests for get_editor_data."""
+
+    def _chapter(self, db, source, segments, translations):
+        project = create_project(db, name="Test Project")
+        chapter = create_chapter(db, project["id"], "Chapter 1", source)
+        segs = []
+        for order, text in enumerate(segments):
+            start = source.index(text)
+            segs.append(Segment(
+                chapter_id=chapter["id"], order=order, source_text=text,
+                source_start_offset=start, source_end_offset=start + len(text),
+            ))
+        db.add_all(segs)
+        db.flush()
+        db.add_all([
+            Translation(segment_id=seg.id, target_language="en", translated_text=text)
+            for seg, text in zip(segs, translations, strict=True)
+            if text is not None
+        ])
+        db.commit()
+        return chapter["id"]
+
+    def test_connected_text_and_offsets(self, db):
+        chapter_id = self._chapter(
+            db, "One.\nTwo.\n\nThree.", ["One.", "Two.", "Three."], ["1", None, "3"],
+        )
+        data = get_editor_data(db, chapter_id)
+
+        assert data["source_connected_text"] == "One.\nTwo.\n\nThree."
+        assert data["translated_connected_text"] == "1\n\n3"
+        spans = [
+            (m["source_start"], m["source_end"], m["translated_start"], m["translated_end"])
+            for m in data["segment_map"]
+        ]
+        assert spans == [(0, 4, 0, 1), (5, 9, 1, 1), (11, 17, 3, 4)]
+
+    def test_no_segments_returns_chapter_content(self, db):
+        project = create_project(db, name="Test Project")
+        chapter = create_chapter(db, project["id"], "Chapter 1", "Raw text")
+        data = get_editor_data(db, chapter["id"])
+        assert data["source_connected_text"] == "Raw text"
+        assert data["segment_map"] == []
+
+    def test_only_target_language_translations(self, db):
+        chapter_id = self._chapter(db, "One.\nTwo.", ["One.", "Two."], ["1", "2"])
+        seg_id = get_editor_data(db, chapter_id)["segment_map"][0]["segment_id"]
+        db.add(Translation(segment_id=seg_id, target_language="ja", translated_text="一"))
+        db.commit()
+
+        assert get_editor_data(db, chapter_id)["translated_connected_text"] == "1\n2"
+        assert get_editor_data(db, chapter_id, "ja")["translated_connected_text"] == "一"
+
+
+class TestExportService:
+    """Tests for chapter export."""
+
+    def test_export_txt_uses_target_translations(self, db, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        project = create_project(db, name="Test Project")
+        chapter = create_chapter(db, project["id"], "Chapter 1", "가\n나\n다")
+        segs = [
+            Segment(chapter_id=chapter["id"], order=i, source_text=t)
+            for i, t in enumerate(["가", "나", "다"])
+        ]
+        db.add_all(segs)
+        db.flush()
+        db.add_all([
+            Translation(segment_id=segs[0].id, target_language="en", translated_text="A"),
+            Translation(segment_id=segs[1].id, target_language="ja", translated_text="ナ"),
+            Translation(segment_id=segs[2].id, target_language="en", translated_text="C"),
+        ])
+        db.commit()
+
+        result = export_chapter_txt(db, chapter["id"])
+
+        assert result["path"].startswith(str(tmp_path))
+        content = Path(result["path"]).read_text(encoding="utf-8")
+        assert content == "# Chapter 1\n\nA\n나\nC"
+        assert result["size"] == len(content)
+
+        exports = list_exports(db, project["id"])
+        assert [(e["chapter_id"], e["format"], e["file_path"]) for e in exports] == [
+            (chapter["id"], "txt", result["path"]),
+        ]
+
+
 class TestGlossaryService:
     """Tests for glossary CRUD operations."""
 
@@ -347,6 +533,14 @@ class TestGlossaryService:
         assert entries[0]["source_term"] in ["마법사", "전사"]
         assert entries[1]["source_term"] in ["마법사", "전사"]
 
+    def test_list_glossary_paginated(self, db):
+        project = create_project(db, name="Test Project")
+        for term in ["다", "가", "나"]:
+            create_glossary_entry(db, project["id"], source_term=term, translated_term=term)
+
+        page = list_glossary(db, project["id"], limit=2, offset=1)
+        assert [e["source_term"] for e in page] == ["나", "다"]
+
     def test_list_glossary_empty(self, db):
         project = create_project(db, name="Test Project")
         entries = list_glossary(db, project["id"])
@@ -422,3 +616,350 @@ class TestGlossaryService:
     def test_delete_glossary_entry_not_found(self, db):
         with pytest.raises(ValueError, match="Glossary entry 999 not found"):
             delete_glossary_entry(db, 999)
+
+    def test_bulk_import(self, db):
+        project = create_project(db, name="Test Project")
+        result = bulk_import(db, project["id"], [
+            {"source_term": "마법사", "translated_term": "Wizard"},
+            {"source_term": "검", "translated_term": "Sword", "term_type": "item",
+             "auto_detected": True},
+        ])
+
+        assert result == {"imported": 2}
+        entries = list_glossary(db, project["id"])
+        assert [(e["source_term"], e["term_type"], e["auto_detected"]) for e in entries] == [
+            ("검", "item", True),
+            ("마법사", "general", False),
+        ]
+        assert all(e["created_at"] for e in entries)
+
+    def test_bulk_import_empty(self, db):
+        project = create_project(db, name="Test Project")
+        assert bulk_import(db, project["id"], []) == {"imported": 0}
+
+    def test_get_glossary_map(self, db):
+        project = create_project(db, name="Test Project")
+        other = create_project(db, name="Other Project")
+        create_glossary_entry(db, project["id"], source_term="마법사", translated_term="Wizard")
+        create_glossary_entry(db, other["id"], source_term="검", translated_term="Sword")
+
+        assert get_glossary_map(db, project["id"]) == {"마법사": "Wizard"}
+
+
+class TestPersonaService:
+    """Tests for persona prompt context and suggestions."""
+
+    def test_personas_context(self, db):
+        project = create_project(db, name="Test Project")
+        create_persona(
+            db, project["id"], "Mina", aliases=["Min"], personality="curious",
+            formality_level=4, age_group="teen",
+        )
+        create_persona(db, project["id"], "Joon", speech_style="blunt", formality_level=9)
+
+        assert get_personas_context(db, project["id"]) == (
+            "## Character Voice Guide\n\n"
+            "### Mina (also: Min)\n"
+            "- Personality: curious\n"
+            "- Formality: formal\n"
+            "- Age group: teen\n"
+            "\n"
+            "### Joon\n"
+            "- Speech style: blunt\n"
+            "- Formality: neutral\n"
+        )
+
+    def test_personas_context_empty(self, db):
+        project = create_project(db, name="Test Project")
+        assert get_personas_context(db, project["id"]) == ""
+
+    def test_apply_suggestion_ignores_non_updatable_field(self, db):
+        project = create_project(db, name="Test Project")
+        other = create_project(db, name="Other Project")
+        persona = create_persona(db, project["id"], "Mina", personality="curious")
+        suggestion = PersonaSuggestion(
+            persona_id=persona["id"], field_name="project_id", suggested_value=str(other["id"]),
+        )
+        db.add(suggestion)
+        db.commit()
+
+        assert apply_suggestion(db, suggestion.id)["status"] == "approved"
+        assert get_persona(db, persona["id"])["project_id"] == project["id"]
+
+    def test_apply_suggestion_appends_to_text_field(self, db):
+        project = create_project(db, name="Test Project")
+        persona = create_persona(db, project["id"], "Mina", personality="curious")
+        suggestion = PersonaSuggestion(
+            persona_id=persona["id"], field_name="personality", suggested_value="stubborn",
+        )
+        db.add(suggestion)
+        db.commit()
+
+        apply_suggestion(db, suggestion.id)
+        assert get_persona(db, persona["id"])["personality"] == "curious; stubborn"
+
+    def test_apply_suggestions_bulk_appends_aliases(self, db):
+        project = create_project(db, name="Test Project")
+        persona = create_persona(db, project["id"], "Mina", aliases=["Min"])
+        suggestions = [
+            PersonaSuggestion(persona_id=persona["id"], field_name="aliases", suggested_value=v)
+            for v in ("Minnie", "Min", "M")
+        ]
+        db.add_all(suggestions)
+        db.commit()
+
+        results = apply_suggestions(db, [s.id for s in suggestions])
+        assert [r["status"] for r in results] == ["approved"] * 3
+
+        db.expire_all()
+        assert get_persona(db, persona["id"])["aliases"] == ["Min", "Minnie", "M"]
+
+    def test_apply_suggestions_missing_id(self, db):
+        project = create_project(db, name="Test Project")
+        persona = create_persona(db, project["id"], "Mina")
+        suggestion = PersonaSuggestion(
+            persona_id=persona["id"], field_name="personality", suggested_value="shy",
+        )
+        db.add(suggestion)
+        db.commit()
+
+        with pytest.raises(ValueError, match="Suggestion 999 not found"):
+            apply_suggestions(db, [suggestion.id, 999], approve=False)
+        db.refresh(suggestion)
+        assert suggestion.status == "pending"
+
+
+class TestRelationshipService:
+    """Tests for relationship updates and prompt context."""
+
+    def _relationship(self, db):
+        project = create_project(db, name="Test Project")
+        mina = create_persona(db, project["id"], "Mina")
+        joon = create_persona(db, project["id"], "Joon")
+        return create_relationship(db, project["id"], mina["id"], joon["id"])
+
+    def test_create_relationship_single_insert(self, db):
+        project = create_project(db, name="Test Project")
+        mina = create_persona(db, project["id"], "Mina")
+        joon = create_persona(db, project["id"], "Joon")
+        statements = []
+        event.listen(
+            db.get_bind(), "before_cursor_execute",
+            lambda conn, cursor, stmt, *args: statements.append(stmt.split()[0]),
+        )
+
+        rel = create_relationship(db, project["id"], joon["id"], mina["id"])
+
+        assert statements == ["INSERT"]
+        assert (rel["persona_id_1"], rel["persona_id_2"]) == (mina["id"], joon["id"])
+        assert rel["relationship_type"] == "acquaintance"
+        assert rel["created_at"] is not None
+        assert rel["updated_at"] is not None
+
+    def test_update_relationship(self, db):
+        rel = self._relationship(db)
+        statements = []
+        event.listen(
+            db.get_bind(), "before_cursor_execute",
+            lambda conn, cursor, stmt, *args: statements.append(stmt.split()[0]),
+        )
+
+        updated = update_relationship(
+            db, rel["id"], relationship_type="friends", intimacy_level=7, project_id=999,
+        )
+
+        assert statements == ["UPDATE"]
+        assert updated["relationship_type"] == "friends"
+        assert updated["intimacy_level"] == 7
+        assert updated["project_id"] == rel["project_id"]
+        assert updated["created_at"] == rel["created_at"]
+
+    def test_update_relationship_noop_skips_write(self, db):
+        rel = self._relationship(db)
+        updated = update_relationship(db, rel["id"], relationship_type="acquaintance")
+        assert updated == rel
+
+    def test_update_relationship_not_found(self, db):
+        with pytest.raises(ValueError, match="Relationship 999 not found"):
+            update_relationship(db, 999, relationship_type="friends")
+
+    def test_no_match_keeps_pending_changes(self, db):
+        rel = self._relationship(db)
+        project = db.get(Project, rel["project_id"])
+        project.name = "Renamed"
+
+        update_relationship(db, rel["id"], relationship_type="acquaintance")
+        with pytest.raises(ValueError, match="not found"):
+            update_relationship(db, 999, relationship_type="friends")
+        with pytest.raises(ValueError, match="not found"):
+            delete_relationship(db, 999)
+        db.commit()
+
+        db.expire_all()
+        assert db.get(Project, rel["project_id"]).name == "Renamed"
+
+    def test_delete_relationship(self, db):
+        rel = self._relationship(db)
+        assert delete_relationship(db, rel["id"]) == {"deleted": True, "id": rel["id"]}
+        with pytest.raises(ValueError, match="not found"):
+            delete_relationship(db, rel["id"])
+
+    def test_relationships_context(self, db):
+        project = create_project(db, name="Test Project")
+        mina = create_persona(db, project["id"], "Mina")
+        joon = create_persona(db, project["id"], "Joon")
+        seo = create_persona(db, project["id"], "Seo")
+        create_relationship(
+            db, project["id"], mina["id"], joon["id"],
+            relationship_type="siblings", intimacy_level=8, description="twins",
+        )
+        create_relationship(db, project["id"], seo["id"], joon["id"], relationship_type="rivals")
+
+        statements = []
+        event.listen(
+            db.get_bind(), "before_cursor_execute",
+            lambda conn, cursor, stmt, *args: statements.append(stmt),
+        )
+        context = get_relationships_context(db, project["id"])
+
+        assert context == (
+            "## Character Relationships\n\n"
+            "- Mina ↔ Joon: siblings (intimacy: 8/10) - twins\n"
+            "- Joon ↔ Seo: rivals (intimacy: 5/10)"
+        )
+        assert len(statements) == 1
+
+    def test_relationships_context_empty(self, db):
+        project = create_project(db, name="Test Project")
+        assert get_relationships_context(db, project["id"]) == ""
+
+
+@pytest.mark.asyncio
+class TestRetranslateSegments:
+    """Tests for segment re-translation."""
+
+    async def test_updates_existing_and_creates_missing(self, db, monkeypatch):
+        project = create_project(db, name="Test Project")
+        chapter = create_chapter(db, project["id"], "Chapter 1", "가 나")
+        seg_a = Segment(chapter_id=chapter["id"], order=0, source_text="가")
+        seg_b = Segment(chapter_id=chapter["id"], order=1, source_text="나")
+        db.add_all([seg_a, seg_b])
+        db.flush()
+        db.add(Translation(
+            segment_id=seg_a.id, target_language="en", translated_text="old",
+            manually_edited=True,
+        ))
+        db.commit()
+
+        class _Provider:
+            async def generate_json(self, prompt, **kwargs):
+                return {"translations": [
+                    {"segment_id": seg_a.id, "text": "A"},
+                    {"segment_id": seg_b.id, "text": "B"},
+                    {"segment_id": seg_b.id, "text": "B2"},
+                ]}
+
+        monkeypatch.setattr(
+            "fiction_translator.services.segment_service.get_llm_provider",
+            lambda *args, **kwargs: _Provider(),
+        )
+        result = await retranslate_segments(db, [seg_a.id, seg_b.id], "en", "", {})
+
+        assert result["updated_count"] == 3
+        rows = {
+            t.segment_id: t for t in db.query(Translation).filter(
+                Translation.target_language == "en"
+            )
+        }
+        assert rows[seg_a.id].translated_text == "A"
+        assert rows[seg_a.id].manually_edited is False
+        assert rows[seg_b.id].translated_text == "B2"
+        assert rows[seg_b.id].status == TranslationStatus.TRANSLATED
+
+    async def test_normalises_returned_segment_ids(self, db, monkeypatch):
+        project = create_project(db, name="Test Project")
+        chapter = create_chapter(db, project["id"], "Chapter 1", "가")
+        seg = Segment(chapter_id=chapter["id"], order=0, source_text="가")
+        db.add(seg)
+        db.flush()
+        db.add(Translation(segment_id=seg.id, target_language="en", translated_text="old"))
+        db.commit()
+
+        class _Provider:
+            async def generate_json(self, prompt, **kwargs):
+                return {"translations": [
+                    {"segment_id": str(seg.id), "text": "A"},
+                    {"segment_id": "abc", "text": "junk"},
+                    {"segment_id": seg.id + 100, "text": "other"},
+                ]}
+
+        monkeypatch.setattr(
+            "fiction_translator.services.segment_service.get_llm_provider",
+            lambda *args, **kwargs: _Provider(),
+        )
+        result = await retranslate_segments(db, [seg.id], "en", "", {})
+
+        assert result["translations"] == [{"segment_id": seg.id, "translated_text": "A"}]
+        [row] = db.query(Translation).all()
+        assert (row.segment_id, row.translated_text) == (seg.id, "A")
+
+    async def test_inserts_rows_when_none_exist(self, db, monkeypatch):
+        project = create_project(db, name="Test Project")
+        chapter = create_chapter(db, project["id"], "Chapter 1", "가 나")
+        segs = [
+            Segment(chapter_id=chapter["id"], order=i, source_text=t)
+            for i, t in enumerate(["가", "나"])
+        ]
+        db.add_all(segs)
+        db.commit()
+
+        class _Provider:
+            async def generate_json(self, prompt, **kwargs):
+                return {"translations": [
+                    {"segment_id": segs[0].id, "text": "A"},
+                    {"segment_id": segs[1].id, "text": "B"},
+                ]}
+
+        monkeypatch.setattr(
+            "fiction_translator.services.segment_service.get_llm_provider",
+            lambda *args, **kwargs: _Provider(),
+        )
+        result = await retranslate_segments(db, [s.id for s in segs], "ja", "", {})
+
+        assert result["updated_count"] == 2
+        rows = db.query(Translation).order_by(Translation.segment_id).all()
+        assert [
+            (t.segment_id, t.target_language, t.translated_text, t.status, t.manually_edited)
+            for t in rows
+        ] == [
+            (segs[0].id, "ja", "A", TranslationStatus.TRANSLATED, False),
+            (segs[1].id, "ja", "B", TranslationStatus.TRANSLATED, False),
+        ]
+
+    async def test_other_relationships_are_not_lazy_loaded(self, db, monkeypatch):
+        project = create_project(db, name="Test Project")
+        chapter = create_chapter(db, project["id"], "Chapter 1", "가")
+        seg = Segment(chapter_id=chapter["id"], order=0, source_text="가")
+        db.add(seg)
+        db.commit()
+        seg_id = seg.id
+        db.expunge_all()
+
+        touched = {}
+
+        class _Provider:
+            async def generate_json(self, prompt, **kwargs):
+                loaded = db.get(Segment, seg_id)
+                touched["chapter"] = loaded.chapter.title
+                with pytest.raises(InvalidRequestError):
+                    loaded.translations  # noqa: B018
+                return {"translations": []}
+
+        monkeypatch.setattr(
+            "fiction_translator.services.segment_service.get_llm_provider",
+            lambda *args, **kwargs: _Provider(),
+        )
+        await retranslate_segments(db, [seg_id], "en", "", {})
+
+        # The preloaded chapter is still available
+        assert touched["chapter"] == "Chapter 1"
@@ -2,6 +2,7 @@
 import pytest
 from fiction_translator.llm.prompts.text_utils import (
     normalize_quotes,
+    build_glossary_matcher,
     build_glossary_pattern,
     apply_glossary_exchange,
     filter_glossary_for_batch,
@@ -132,3 +133,15 @@ class TestFilterGlossaryForBatch:
         batch = ["용이 검을 들었다"]
         result = filter_glossary_for_batch(glossary, batch)
         assert result == glossary
+
+    def test_matcher_finds_overlapping_terms(self):
+        pytest.importorskip("ahocorasick")
+        glossary = {"도적": "Thief", "검은 별": "Black Star", "검은": "Black", "별빛": "Starlight"}
+        batch = ["검은 별빛"]
+        matcher = build_glossary_matcher(glossary)
+        result = filter_glossary_for_batch(glossary, batch, matcher)
+        assert result == filter_glossary_for_batch(glossary, batch)
+        assert list(result) == ["검은 별", "검은", "별빛"]
+
+    def test_no_matcher_for_empty_glossary(self):
+        assert build_glossary_matcher({}) is None
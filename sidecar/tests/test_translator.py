@@ -0,0 +1,260 @@
+"""Tests for the translator node."""
+import asyncio
+import re
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from fiction_translator.db.models import Base
+from fiction_translator.pipeline.nodes.translator import (
+    DIALOGUE_OVERFLOW_RATIO,
+    MAX_BATCH_CHARS,
+    MIN_BATCH_CHARS,
+    _adaptive_max_chars,
+    _group_segments_into_batches,
+    _pack_batches,
+    _record_batch_throughput,
+    translator_node,
+)
+
+
+def _segments(n):
+    return [{"order": i, "text": f"s{i}", "type": "narrative"} for i in range(n)]
+
+
+def _sizes(batches):
+    return [sum(len(s["text"]) for s in batch) for batch in batches]
+
+
+class TestGroupSegmentsIntoBatches:
+    def test_balances_without_extra_batches(self):
+        segs = [{"order": i, "text": "x" * 5000, "type": "narrative"} for i in range(9)]
+        assert _sizes(_group_segments_into_batches(segs, balance=False)) == [
+            20000, 20000, 5000,
+        ]
+        assert _sizes(_group_segments_into_batches(segs)) == [15000, 15000, 15000]
+
+    def test_keeps_segment_order(self):
+        segs = [
+            {"order": i, "text": "x" * (i * 97 % 900), "type": "narrative"}
+            for i in range(40)
+        ]
+        batches = _group_segments_into_batches(segs)
+        assert [s["order"] for batch in batches for s in batch] == list(range(40))
+        assert all(len(batch) <= 10 for batch in batches)
+
+    def test_dialogue_run_overflows_cap_within_bound(self):
+        segs = [
+            {"order": 0, "text": "x" * 6000, "type": "narrative"},
+            {"order": 1, "text": "x" * 3000, "type": "dialogue"},
+            {"order": 2, "text": "x" * 1500, "type": "dialogue"},
+            {"order": 3, "text": "x" * 1000, "type": "narrative"},
+        ]
+        # 10500 chars: the unfinished exchange stays together past the cap
+        assert _sizes(_pack_batches(segs, max_chars=10000)) == [10500, 1000]
+
+    def test_dialogue_run_split_beyond_overflow(self):
+        segs = [
+            {"order": 0, "text": "x" * 6000, "type": "narrative"},
+            {"order": 1, "text": "x" * 3000, "type": "dialogue"},
+            {"order": 2, "text": "x" * 2500, "type": "dialogue"},
+        ]
+        # 11500 chars would exceed the 10% overflow, so the exchange splits
+        assert _sizes(_pack_batches(segs, max_chars=10000)) == [9000, 2500]
+
+    @pytest.mark.parametrize("lengths, max_chars", [
+        ((25000, 12000, 12000), MAX_BATCH_CHARS),
+        ((9000, 4000, 4000, 3000), MIN_BATCH_CHARS),
+    ])
+    def test_oversized_segment_does_not_raise_cap(self, lengths, max_chars):
+        segs = [
+            {"order": i, "text": "x" * n, "type": "narrative"}
+            for i, n in enumerate(lengths)
+        ]
+        batches = _group_segments_into_batches(segs, max_chars=max_chars)
+        limit = max_chars + int(max_chars * DIALOGUE_OVERFLOW_RATIO)
+        assert all(
+            size <= limit
+            for batch, size in zip(batches, _sizes(batches), strict=True)
+            if len(batch) > 1
+        )
+        assert [s["order"] for batch in batches for s in batch] == list(range(len(segs)))
+
+    def test_single_batch_unchanged(self):
+        segs = _segments(3)
+        assert _group_segments_into_batches(segs) == [segs]
+
+
+class TestAdaptiveBatchSize:
+    def test_defaults_without_samples(self):
+        assert _adaptive_max_chars([], 60.0) == MAX_BATCH_CHARS
+
+    def test_targets_latency_within_bounds(self):
+        samples = []
+        _record_batch_throughput(samples, 1000, 10.0)  # 100 chars/s
+        assert _adaptive_max_chars(samples, 60.0) == 6000
+        assert _adaptive_max_chars(samples, 10.0) == MIN_BATCH_CHARS
+        assert _adaptive_max_chars(samples, 1000.0) == MAX_BATCH_CHARS
+
+    def test_cap_is_applied_to_grouping(self):
+        segs = [{"order": i, "text": "x" * 5000, "type": "narrative"} for i in range(4)]
+        batches = _group_segments_into_batches(segs, max_chars=10000)
+        assert _sizes(batches) == [10000, 10000]
+
+
+class _EchoProvider:
+    """Fake provider that translates each prompt's segments and tracks overlap."""
+
+    def __init__(self, fail_batches=()):
+        self.prompts = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+        self.fail_batches = set(fail_batches)
+
+    async def generate_json(self, prompt, **kwargs):
+        call = self.calls
+        self.calls += 1
+        self.prompts.append(prompt)
+        self.kwargs = kwargs
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # Later calls finish first to check results keep batch order
+        await asyncio.sleep(0.01 * (5 - call % 5))
+        self.in_flight -= 1
+        if call in self.fail_batches:
+            raise RuntimeError("boom")
+        ids = [int(i) for i in re.findall(r"\[(\d+)\|", prompt)]
+        return {"translations": [{"segment_id": i, "text": f"t{i}"} for i in ids]}
+
+
+@pytest.fixture
+def Session():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    with patch("fiction_translator.db.session.get_db", side_effect=factory):
+        yield factory
+
+
+@pytest.mark.asyncio
+class TestTranslatorNode:
+    async def _run(self, provider, **state):
+        with patch(
+            "fiction_translator.llm.providers.get_llm_provider", return_value=provider,
+        ):
+            return await translator_node({
+                "api_keys": {"gemini": "k"},
+                "use_cot": False,
+                **state,
+            })
+
+    async def test_batches_run_concurrently_within_limit(self):
+        provider = _EchoProvider()
+        result = await self._run(
+            provider, segments=_segments(45), translation_concurrency=2,
+        )
+
+        assert provider.calls == 5
+        assert provider.max_in_flight == 2
+        assert [t["translated_text"] for t in result["translated_segments"]] == [
+            f"t{i}" for i in range(45)
+        ]
+        assert [b["batch_order"] for b in result["batches"]] == list(range(5))
+
+    async def test_failed_batch_keeps_placeholders_in_order(self):
+        provider = _EchoProvider(fail_batches={0})
+        result = await self._run(provider, segments=_segments(15))
+
+        translated = result["translated_segments"]
+        assert [t["segment_id"] for t in translated] == list(range(15))
+        for t in translated:
+            expected = "[TRANSLATION FAILED]" if t["batch_id"] == 0 else f"t{t['order']}"
+            assert t["translated_text"] == expected
+        assert translated[0]["batch_id"] == 0 and translated[-1]["batch_id"] == 1
+        assert [b["batch_order"] for b in result["batches"]] == [1]
+
+    async def test_retranslation_sends_feedback_with_its_batch(self):
+        provider = _EchoProvider()
+        previous = [
+            {"segment_id": i, "order": i, "translated_text": f"old{i}"} for i in range(15)
+        ]
+        result = await self._run(
+            provider,
+            segments=_segments(15),
+            translated_segments=previous,
+            flagged_segments=list(range(12)),
+            review_feedback=[
+                {"segment_id": 1, "issue": "fix-one"},
+                {"segment_id": 10, "issue": "fix-ten"},
+            ],
+        )
+
+        assert provider.calls == 2
+        first, second = sorted(provider.prompts, key=lambda p: "[0|" not in p)
+        assert "fix-one" in first and "fix-ten" not in first
+        assert "fix-ten" in second and "fix-one" not in second
+        texts = {t["segment_id"]: t["translated_text"] for t in result["translated_segments"]}
+        assert texts[11] == "t11" and texts[12] == "old12"
+
+    async def test_rerun_is_served_from_llm_cache(self, Session):
+        provider = _EchoProvider()
+        provider.model = "test-model"
+        first = await self._run(provider, segments=_segments(12), use_llm_cache=True)
+        second = await self._run(provider, segments=_segments(12), use_llm_cache=True)
+
+        assert provider.calls == 2
+        assert second["translated_segments"] == first["translated_segments"]
+
+    async def test_throughput_stays_in_run_state(self, Session):
+        provider = _EchoProvider()
+        provider.model = "test-model"
+        first = await self._run(provider, segments=_segments(12), use_llm_cache=True)
+        assert len(first["batch_throughput"]) == 2
+
+        # A new run starts without samples; its cache hits add none
+        second = await self._run(provider, segments=_segments(12), use_llm_cache=True)
+        assert second["batch_throughput"] == []
+        assert provider.calls == 2
+
+    async def test_incomplete_batch_is_not_cached(self, Session):
+        provider = _EchoProvider()
+        provider.model = "test-model"
+        real = provider.generate_json
+
+        async def drop_last(prompt, **kwargs):
+            result = await real(prompt, **kwargs)
+            result["translations"][-1]["text"] = ""
+            return result
+
+        provider.generate_json = drop_last
+        await self._run(provider, segments=_segments(3), use_llm_cache=True)
+        await self._run(provider, segments=_segments(3), use_llm_cache=True)
+
+        assert provider.calls == 2
+
+    async def test_batches_share_prompt_head_and_cache_key(self):
+        provider = _EchoProvider()
+        segs = _segments(12)
+        segs[0]["text"] = "검은 별"
+        segs[11]["text"] = "하얀 달"
+        await self._run(
+            provider,
+            segments=segs,
+            project_id=7,
+            personas_context="## Character Voice Guide\nMina: terse",
+            glossary={"검은 별": "Black Star", "하얀 달": "White Moon"},
+        )
+
+        first, second = sorted(provider.prompts, key=lambda p: "[0|" not in p)
+        head = first[:first.index("## Glossary Reference")]
+        assert "Mina: terse" in head
+        assert second.startswith(head)
+        assert provider.kwargs["cache_key"] == "translation:7:en"
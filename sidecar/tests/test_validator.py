@@ -0,0 +1,98 @@
+"""Tests for pipeline/nodes/validator.py."""
+import pytest
+
+from fiction_translator.pipeline.nodes.validator import (
+    MAX_SEGMENT_LENGTH,
+    MAX_VALIDATION_ERRORS,
+    validator_node,
+)
+
+
+def _seg(text, start, end, seg_type="narrative", speaker=None):
+    return {
+        "text": text,
+        "type": seg_type,
+        "speaker": speaker,
+        "source_start_offset": start,
+        "source_end_offset": end,
+    }
+
+
+@pytest.mark.asyncio
+class TestValidatorNode:
+    async def test_valid_segments_pass(self):
+        result = await validator_node({
+            "source_text": "Hello.\n\n\"Hi.\"",
+            "segments": [
+                _seg("Hello.", 0, 6),
+                _seg("\"Hi.\"", 8, 13, "dialogue", "Mina"),
+            ],
+        })
+
+        assert result["validation_passed"] is True
+        assert result["validation_errors"] == []
+        assert result["validation_attempts"] == 1
+
+    async def test_no_segments_fails(self):
+        result = await validator_node({"source_text": "x", "segments": []})
+
+        assert result["validation_passed"] is False
+        assert result["validation_errors"] == ["No segments produced"]
+
+    async def test_collects_every_issue_in_one_pass(self):
+        long_text = "x" * (MAX_SEGMENT_LENGTH + 1)
+        result = await validator_node({
+            "source_text": long_text,
+            "validation_attempts": 1,
+            "segments": [
+                _seg("  ", 0, 2),
+                _seg(long_text, 5, 3, "monologue"),
+            ],
+        })
+
+        assert result["validation_passed"] is False
+        assert result["validation_attempts"] == 2
+        assert result["validation_errors"] == [
+            "Segment 0 is empty",
+            f"Segment 1 exceeds max length ({MAX_SEGMENT_LENGTH + 1} > {MAX_SEGMENT_LENGTH})",
+            "Segment 1 end offset (3) < start offset (5)",
+            "Segment 1 has invalid type 'monologue'",
+        ]
+
+    async def test_issues_are_grouped_by_check(self):
+        result = await validator_node({
+            "source_text": "x" * 100,
+            "segments": [
+                _seg("x", 0, 1, "monologue"),
+                _seg(" ", 1, 0),
+            ],
+        })
+
+        assert result["validation_errors"] == [
+            "Segment 1 is empty",
+            "Segment 1 end offset (0) < start offset (1)",
+            "Low coverage: segments cover 2% of source text (minimum 80%)",
+            "Segment 0 has invalid type 'monologue'",
+        ]
+
+    async def test_low_coverage_fails(self):
+        result = await validator_node({
+            "source_text": "A much longer source text than the segments cover.",
+            "segments": [_seg("A much", 0, 6)],
+        })
+
+        assert result["validation_passed"] is False
+        assert result["validation_errors"][0].startswith("Low coverage")
+
+    async def test_stops_scanning_after_error_limit(self):
+        segments = [_seg("", 0, 0) for _ in range(MAX_VALIDATION_ERRORS + 20)]
+        result = await validator_node({"source_text": "long source", "segments": segments})
+
+        errors = result["validation_errors"]
+        assert len(errors) == MAX_VALIDATION_ERRORS + 2
+        # Coverage is measured up front, so it is still reported
+        assert errors[-2].startswith("Low coverage")
+        assert errors[-1] == (
+            f"Stopped after {MAX_VALIDATION_ERRORS} issues; "
+            f"segments {MAX_VALIDATION_ERRORS}-{len(segments) - 1} not checked"
+        )
@@ -98,8 +98,19 @@ export const api = {
     rpc<{ deleted: boolean; id: number }>("relationship.delete", { relationship_id: relationshipId }),
 
   // Pipeline
-  translateChapter: (chapterId: number, targetLanguage: string = "en", useCot: boolean = true) =>
-    rpc("pipeline.translate_chapter", { chapter_id: chapterId, target_language: targetLanguage, use_cot: useCot }),
+  translateChapter: (
+    chapterId: number,
+    targetLanguage: string = "en",
+    useCot: boolean = true,
+    options: { fusedAnalysis?: boolean; useLlmCache?: boolean } = {},
+  ) =>
+    rpc("pipeline.translate_chapter", {
+      chapter_id: chapterId,
+      target_language: targetLanguage,
+      use_cot: useCot,
+      fused_analysis: options.fusedAnalysis ?? false,
+      use_llm_cache: options.useLlmCache ?? false,
+    }),
   cancelPipeline: () => rpc("pipeline.cancel"),
 
   // Segments
@@ -39,8 +39,9 @@ export interface Chapter {
   project_id: number;
   title: string;
   order: number;
-  source_content: string | null;
-  translated_content: string | null;
+  // Omitted from chapter.list; present on chapter.get/create/update
+  source_content?: string | null;
+  translated_content?: string | null;
   translation_stale: boolean;
   created_at: string;
   updated_at: string;
@@ -4,12 +4,14 @@ import { api } from "@/api/tauri-bridge";
 export function useTranslateChapter() {
   const qc = useQueryClient();
   return useMutation({
-    mutationFn: ({ chapterId, targetLanguage, useCot = true }: {
+    mutationFn: ({ chapterId, targetLanguage, useCot = true, fusedAnalysis = false, useLlmCache = false }: {
       chapterId: number;
       targetLanguage: string;
       useCot?: boolean;
+      fusedAnalysis?: boolean;
+      useLlmCache?: boolean;
     }) =>
-      api.translateChapter(chapterId, targetLanguage, useCot),
+      api.translateChapter(chapterId, targetLanguage, useCot, { fusedAnalysis, useLlmCache }),
     onSuccess: (_, vars) => {
       qc.invalidateQueries({ queryKey: ["chapter", vars.chapterId] });
       qc.invalidateQueries({ queryKey: ["editor-data", vars.chapterId] });